@@ -0,0 +1,41 @@
+# apiserver/src/apiserver/cache/answer_key.py
+from uuid import UUID
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from apiserver.cache.l1 import l1_cache
+from apiserver.cache.quiz_content import get_quiz_content
+
+# 퀴즈 버전별 정답표: question_id -> (correct_choice_id, 유효한 choice_id 집합)
+# 버전 내용(cache/quiz_content.py)에서 만들어 L1에만 둔다. (Redis에는 버전 내용만 저장)
+
+def answer_key_cache_key(quiz_id, version):
+    return f"quiz:{quiz_id}:answer_key:v{version}"
+
+class AnswerKey:
+    def __init__(self, questions: dict):
+        # {question_id(str): {"correct": choice_id(str) | None, "choices": [choice_id(str), ...]}}
+        self.correct = {qid: q["correct"] for qid, q in questions.items()}
+        self.choices = {qid: frozenset(q["choices"]) for qid, q in questions.items()}
+
+    def is_valid(self, question_id, choice_id):
+        choices = self.choices.get(str(question_id))
+        return choices is not None and str(choice_id) in choices
+
+    def correct_pairs(self):
+        return {UUID(qid): UUID(cid) for qid, cid in self.correct.items() if cid}
+
+    @classmethod
+    def from_content(cls, content):
+        return cls({
+            question_id: {
+                "correct": question["correct"],
+                "choices": [choice_id for choice_id, _ in question["choices"]],
+            }
+            for question_id, question in content.questions.items()
+        })
+
+async def get_answer_key(db: AsyncSession, quiz_id, version) -> AnswerKey:
+    async def load():
+        return AnswerKey.from_content(await get_quiz_content(db, quiz_id, version))
+
+    return await l1_cache.get_or_load(answer_key_cache_key(quiz_id, version), load)
@@ -0,0 +1,45 @@
+# apiserver/src/apiserver/cache/attempted.py
+from sqlalchemy.future import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from apiserver.models.quiz_attempt_model import QuizAttempt
+from apiserver.db.redis_client import redis_client
+from apiserver.config import settings
+
+# 사용자별 응시한 퀴즈 id 집합 (Redis SET)
+# 퀴즈 목록 캐시는 사용자와 무관하게 공유하고, attempted 값은 이 집합으로 덧씌운다.
+# 집합에 LOADED 표식이 없으면 DB에서 다시 채운다 (만료되었거나 아직 만들어지지 않은 경우).
+
+LOADED = "__loaded__"
+
+def attempted_quizzes_key(user_id):
+    return f"user:{user_id}:attempted_quizzes"
+
+async def get_attempted_flags(db: AsyncSession, user_id, quiz_ids):
+    quiz_ids = [str(quiz_id) for quiz_id in quiz_ids]
+    key = attempted_quizzes_key(user_id)
+
+    flags = await redis_client.smismember(key, [LOADED, *quiz_ids])
+    if flags[0]:
+        return [bool(flag) for flag in flags[1:]]
+
+    result = await db.execute(
+        select(QuizAttempt.quiz_id).where(QuizAttempt.user_id == user_id)
+    )
+    attempted = {str(quiz_id) for quiz_id in result.scalars().all()}
+
+    async with redis_client.pipeline(transaction=True) as pipe:
+        pipe.sadd(key, LOADED, *attempted)
+        pipe.expire(key, settings.ATTEMPTED_CACHE_TTL)
+        await pipe.execute()
+
+    return [quiz_id in attempted for quiz_id in quiz_ids]
+
+# attempt_quiz 커밋 이후에 호출
+# 집합이 없으면 LOADED 표식 없이 만들어지므로 다음 조회 때 DB에서 전체를 다시 채운다.
+async def mark_attempted(user_id, quiz_id):
+    key = attempted_quizzes_key(user_id)
+    async with redis_client.pipeline(transaction=True) as pipe:
+        pipe.sadd(key, str(quiz_id))
+        pipe.expire(key, settings.ATTEMPTED_CACHE_TTL)
+        await pipe.execute()
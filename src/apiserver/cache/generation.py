@@ -0,0 +1,74 @@
+# apiserver/src/apiserver/cache/generation.py
+from apiserver.db.redis_client import redis_client
+from apiserver.cache.l1 import l1_cache, publish_invalidation
+from apiserver.db.routing import mark_written, mark_shared_written
+
+# 네임스페이스별 세대(generation) 카운터로 캐시를 무효화한다.
+# 캐시 키에 관련 네임스페이스들의 현재 세대를 붙이고, 쓰기 요청은 커밋 후 세대를 INCR 한다.
+# 세대가 바뀌면 이전 키는 더 이상 조회되지 않으므로 TTL을 길게 잡아도 변경이 바로 보인다.
+# 세대 값은 L1에 캐시하고, INCR 할 때 pub/sub으로 모든 워커의 L1에서 지운다.
+#
+# 네임스페이스
+#   quizzes                : 퀴즈 목록
+#   users                  : 사용자 목록
+#   quiz:{quiz_id}         : 퀴즈 하나의 내용 (상세, 정답표)
+#   quiz:{quiz_id}:user:{user_id} : 사용자 한 명의 응시 상태 (응시, 답안, 제출)
+
+QUIZZES = "quizzes"
+USERS = "users"
+
+def quiz_namespace(quiz_id):
+    return f"quiz:{quiz_id}"
+
+def quiz_user_namespace(quiz_id, user_id):
+    return f"quiz:{quiz_id}:user:{user_id}"
+
+def is_shared_namespace(namespace):
+    return ":user:" not in namespace
+
+# quiz:{quiz_id}:user:{user_id} -> user_id
+def namespace_user_id(namespace):
+    return namespace.rsplit(":user:", 1)[1]
+
+def generation_key(namespace):
+    return f"gen:{namespace}"
+
+async def get_generation(namespace):
+    return (await get_generations(namespace))[0]
+
+async def get_generations(*namespaces):
+    keys = [generation_key(namespace) for namespace in namespaces]
+    generations = [l1_cache.get(key) for key in keys]
+
+    missing = [key for key, generation in zip(keys, generations) if generation is None]
+    if missing:
+        with l1_cache.watch(*missing) as versions:
+            fetched = dict(zip(missing, await redis_client.mget(missing)))
+            for key, generation in fetched.items():
+                l1_cache.set(key, int(generation) if generation else 0, version=versions[key])
+        generations = [
+            generation if generation is not None else int(fetched[key] or 0)
+            for key, generation in zip(keys, generations)
+        ]
+
+    return generations
+
+async def bump_generation(*namespaces):
+    keys = [generation_key(namespace) for namespace in namespaces]
+    async with redis_client.pipeline(transaction=True) as pipe:
+        # 복제 지연 동안 읽기를 primary로 (db/routing.py)
+        # 새 세대를 본 요청이 복제본의 이전 데이터로 캐시를 채우지 않도록 INCR 보다 먼저 표시한다.
+        if any(is_shared_namespace(namespace) for namespace in namespaces):
+            await mark_shared_written(pipe=pipe)
+        for user_id in {namespace_user_id(namespace) for namespace in namespaces if not is_shared_namespace(namespace)}:
+            await mark_written(user_id, pipe=pipe)
+        marks = len(pipe)
+        for key in keys:
+            pipe.incr(key)
+        await publish_invalidation(*keys, pipe=pipe)
+        return (await pipe.execute())[marks:marks + len(keys)]
+
+# key에 네임스페이스들의 현재 세대를 붙인 캐시 키 (Redis 왕복 1회)
+async def cache_key(key, *namespaces):
+    generations = await get_generations(*namespaces)
+    return key + "@" + ".".join(str(generation) for generation in generations)
@@ -0,0 +1,32 @@
+# apiserver/src/apiserver/cache/item_analysis.py
+import json
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from apiserver.db.redis_client import redis_client
+from apiserver.cache.l1 import l1_cache
+from apiserver.cache.quiz_content import get_quiz_content
+from apiserver.utils.item_analysis import load_answer_columns, compute_item_analysis
+from apiserver.config import settings
+
+# 퀴즈 버전별 문항 분석 결과 캐시 (utils/item_analysis.py)
+# 같은 버전이라도 제출이 계속 쌓이므로 무효화 대신 ITEM_ANALYSIS_CACHE_TTL 동안만 재사용한다.
+# 동시에 같은 버전을 요청하면 계산은 한 번만 (L1 single-flight)
+
+def item_analysis_cache_key(quiz_id, version):
+    return f"quiz:{quiz_id}:item_analysis:v{version}"
+
+async def get_item_analysis(db: AsyncSession, quiz_id, version):
+    redis_key = item_analysis_cache_key(quiz_id, version)
+
+    async def load():
+        cached_data = await redis_client.get(redis_key)
+        if cached_data:
+            return json.loads(cached_data)
+
+        content = await get_quiz_content(db, quiz_id, version)
+        columns = await load_answer_columns(db, quiz_id, version, content)
+        report = {"version": version, **compute_item_analysis(columns, content)}
+        await redis_client.set(redis_key, json.dumps(report), ex=settings.ITEM_ANALYSIS_CACHE_TTL)
+        return report
+
+    return await l1_cache.get_or_load(redis_key, load)
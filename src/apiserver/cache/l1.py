@@ -0,0 +1,148 @@
+# apiserver/src/apiserver/cache/l1.py
+import asyncio
+import json
+import logging
+from contextlib import contextmanager
+
+from apiserver.db.redis_client import redis_client
+from apiserver.cache.lru import LRUCache
+from apiserver.config import settings
+
+# Redis 앞단의 프로세스 내 L1 캐시
+# - 항목 수/TTL 제한 (LRUCache)
+# - 무효화는 Redis pub/sub 채널로 모든 워커에 전파 (listen_for_invalidations)
+# - get_or_load: 같은 키를 동시에 여러 요청이 찾으면 백엔드 조회는 한 번만 실행 (single-flight)
+# - watch: 세대 접미사가 없는 키(세대 값, 사용자 정보)를 백엔드에서 읽는 동안 그 키가 무효화되면 결과를 저장하지 않는다
+#   get_or_load의 키에는 세대(또는 퀴즈 버전) 접미사가 붙어서 쓰기가 있으면 키 자체가 바뀌므로 따로 확인하지 않는다.
+# 캐시되는 값은 요청 간에 공유되므로 호출자가 수정하면 안 된다.
+
+logger = logging.getLogger(__name__)
+
+INVALIDATION_CHANNEL = "cache:invalidate"
+
+class L1Cache:
+    def __init__(self, maxsize: int, ttl: float):
+        self._lru = LRUCache(maxsize, ttl)
+        self._inflight = {}
+        # watch 중인 키별 [조회 수, 무효화 횟수]; 조회가 모두 끝나면 지운다
+        self._watches = {}
+        # clear 횟수 (전체 무효화)
+        self._clears = 0
+        self.hits = 0
+        self.misses = 0
+        self.loads = 0
+        self.coalesced = 0
+        self.invalidations = 0
+
+    def get(self, key):
+        value = self._lru.get(key)
+        if value is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return value
+
+    def _version(self, key):
+        watch = self._watches.get(key)
+        return self._clears, watch[1] if watch else 0
+
+    # 백엔드에서 keys를 읽기 전에 감싼다. 키별 버전을 돌려주고, set(..., version=)에 넘기면
+    # 그 사이 해당 키가 무효화(또는 clear)됐을 때 저장하지 않는다.
+    @contextmanager
+    def watch(self, *keys):
+        for key in keys:
+            self._watches.setdefault(key, [0, 0])[0] += 1
+        try:
+            yield {key: self._version(key) for key in keys}
+        finally:
+            for key in keys:
+                watch = self._watches[key]
+                watch[0] -= 1
+                if not watch[0]:
+                    del self._watches[key]
+
+    def set(self, key, value, ttl: float = None, version=None):
+        if version is not None and version != self._version(key):
+            return
+        self._lru.set(key, value, ttl)
+
+    async def get_or_load(self, key, loader, ttl: float = None):
+        value = self.get(key)
+        if value is not None:
+            return value
+
+        future = self._inflight.get(key)
+        if future is not None:
+            self.coalesced += 1
+            return await asyncio.shield(future)
+
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        try:
+            self.loads += 1
+            value = await loader()
+            self.set(key, value, ttl)
+            future.set_result(value)
+            return value
+        except BaseException as e:
+            future.set_exception(e)
+            # 기다리는 요청이 없을 때 "exception was never retrieved" 경고 방지
+            future.exception()
+            raise
+        finally:
+            del self._inflight[key]
+
+    def invalidate(self, *keys):
+        self.invalidations += len(keys)
+        for key in keys:
+            watch = self._watches.get(key)
+            if watch:
+                watch[1] += 1
+            self._lru.delete(key)
+
+    def clear(self):
+        self._clears += 1
+        self._lru.clear()
+
+    def stats(self):
+        lookups = self.hits + self.misses
+        return {
+            "size": len(self._lru),
+            "maxsize": self._lru.maxsize,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "evictions": self._lru.evictions,
+            "loads": self.loads,
+            "coalesced": self.coalesced,
+            "invalidations": self.invalidations,
+        }
+
+l1_cache = L1Cache(settings.L1_CACHE_SIZE, settings.L1_CACHE_TTL)
+
+# 현재 워커의 L1에서 지우고 다른 워커에도 전파
+async def publish_invalidation(*keys, pipe=None):
+    l1_cache.invalidate(*keys)
+    message = json.dumps(keys)
+    if pipe is not None:
+        pipe.publish(INVALIDATION_CHANNEL, message)
+    else:
+        await redis_client.publish(INVALIDATION_CHANNEL, message)
+
+# 앱 lifespan 동안 실행되는 구독 루프
+# 연결이 끊긴 동안의 메시지는 받을 수 없으므로 (재)구독할 때마다 L1을 비운다.
+async def listen_for_invalidations():
+    while True:
+        try:
+            async with redis_client.pubsub() as pubsub:
+                await pubsub.subscribe(INVALIDATION_CHANNEL)
+                l1_cache.clear()
+                async for message in pubsub.listen():
+                    if message["type"] == "message":
+                        l1_cache.invalidate(*json.loads(message["data"]))
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            logger.exception("L1 cache invalidation listener failed, resubscribing")
+            l1_cache.clear()
+            await asyncio.sleep(1)
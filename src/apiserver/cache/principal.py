@@ -0,0 +1,96 @@
+# apiserver/src/apiserver/cache/principal.py
+import asyncio
+from itertools import chain
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from apiserver.models.user_model import User
+from apiserver.schemas.user_shcema import UserPrincipal
+from apiserver.db.redis_client import redis_client
+from apiserver.cache.l1 import l1_cache, publish_invalidation
+from apiserver.config import settings
+
+# 인증된 사용자(id, is_admin) 캐시: 짧은 TTL의 L1 -> Redis
+# 캐시에 있으면 get_current_user가 DB 세션을 열지 않는다.
+# 무효화할 때마다 사용자별 버전(principal_ver)을 INCR 하고, DB에서 읽은 값은 읽기 전 버전이 그대로일 때만 저장한다.
+# 버전 키에는 TTL을 두지 않는다. (만료 후 다시 같은 값이 되면 오래된 값이 저장될 수 있음)
+
+def principal_cache_key(user_id):
+    return f"user:{user_id}:principal"
+
+def principal_version_key(user_id):
+    return f"user:{user_id}:principal_ver"
+
+# KEYS: 버전, 캐시 / ARGV: 읽기 전 버전, 값, TTL(초)
+# 반환: 저장했으면 1
+SET_PRINCIPAL_SCRIPT = redis_client.register_script("""
+if (redis.call('GET', KEYS[1]) or '0') ~= ARGV[1] then
+    return 0
+end
+redis.call('SET', KEYS[2], ARGV[2], 'EX', ARGV[3])
+return 1
+""")
+
+async def get_principal(user_id):
+    key = principal_cache_key(user_id)
+    principal = l1_cache.get(key)
+    if principal is not None:
+        return principal
+
+    with l1_cache.watch(key) as versions:
+        cached_data = await redis_client.get(key)
+        if not cached_data:
+            return None
+
+        principal = UserPrincipal.model_validate_json(cached_data)
+        l1_cache.set(key, principal, settings.PRINCIPAL_CACHE_LOCAL_TTL, versions[key])
+    return principal
+
+# DB에서 사용자를 읽기 전에 호출; 반환값을 set_principal에 넘긴다
+async def get_principal_version(user_id):
+    return await redis_client.get(principal_version_key(user_id)) or "0"
+
+# version: get_principal_version의 반환값
+# 그 사이에 무효화가 있었으면 (권한 변경 등) 읽은 값이 이미 오래된 것일 수 있으므로 L1/Redis 모두 저장하지 않는다.
+async def set_principal(principal: UserPrincipal, version: str):
+    key = principal_cache_key(principal.id)
+    with l1_cache.watch(key) as versions:
+        stored = await SET_PRINCIPAL_SCRIPT(
+            keys=[principal_version_key(principal.id), key],
+            args=[version, principal.model_dump_json(), settings.PRINCIPAL_CACHE_TTL],
+        )
+        if stored:
+            l1_cache.set(key, principal, settings.PRINCIPAL_CACHE_LOCAL_TTL, versions[key])
+
+async def invalidate_principal(user_id):
+    key = principal_cache_key(user_id)
+    async with redis_client.pipeline(transaction=True) as pipe:
+        pipe.incr(principal_version_key(user_id))
+        pipe.delete(key)
+        await publish_invalidation(key, pipe=pipe)
+        await pipe.execute()
+
+# User가 ORM으로 수정/삭제되면 커밋 후 캐시를 무효화한다.
+@event.listens_for(Session, "after_flush")
+def _collect_changed_users(session, flush_context):
+    for obj in chain(session.dirty, session.deleted):
+        if isinstance(obj, User):
+            session.info.setdefault("changed_user_ids", set()).add(obj.id)
+
+_pending_invalidations = set()
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_changed_users(session):
+    user_ids = session.info.pop("changed_user_ids", None)
+    if not user_ids:
+        return
+    loop = asyncio.get_running_loop()
+    for user_id in user_ids:
+        l1_cache.invalidate(principal_cache_key(user_id))
+        task = loop.create_task(invalidate_principal(user_id))
+        _pending_invalidations.add(task)
+        task.add_done_callback(_pending_invalidations.discard)
+
+@event.listens_for(Session, "after_rollback")
+def _discard_changed_users(session):
+    session.info.pop("changed_user_ids", None)
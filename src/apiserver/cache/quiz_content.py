@@ -0,0 +1,99 @@
+# apiserver/src/apiserver/cache/quiz_content.py
+import json
+from sqlalchemy.future import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from apiserver.models.question_model import Question
+from apiserver.models.choice_model import Choice
+from apiserver.models.quiz_version_model import QuizVersion
+from apiserver.db.redis_client import redis_client
+from apiserver.cache.l1 import l1_cache
+from apiserver.config import settings
+
+# 퀴즈 버전별 문제 내용 캐시 (quiz_versions.content)
+# 응시(QuizAttempt.questions)에는 질문 id와 선택지 순서만 저장하고, 내용은 같은 버전을 푸는 모든 응시가 이 캐시를 공유한다.
+# 버전 내용은 바뀌지 않으므로 무효화가 필요 없고, 퀴즈를 수정하면 새 버전 번호로 새 키를 쓴다.
+# 조회 순서: L1 -> Redis -> PostgreSQL (동시에 같은 버전을 찾으면 조회는 한 번만)
+
+def quiz_content_cache_key(quiz_id, version):
+    return f"quiz:{quiz_id}:content:v{version}"
+
+class QuizContent:
+    def __init__(self, questions: list):
+        # [{"id": question_id(str), "content": str, "correct": choice_id(str) | None,
+        #   "choices": [[choice_id(str), content], ...]}, ...] (표시 순서)
+        self.questions = {question["id"]: question for question in questions}
+
+    def question_ids(self):
+        return list(self.questions)
+
+    def choice_ids(self, question_id):
+        return [choice_id for choice_id, _ in self.questions[str(question_id)]["choices"]]
+
+    # 응시에 저장된 질문 하나를 화면용 dict로 만든다 (choice_ids가 없으면 기본 순서)
+    def render_question(self, question_id, choice_ids=None):
+        question = self.questions.get(str(question_id))
+        if question is None:
+            return None
+        contents = dict(question["choices"])
+        if choice_ids is None:
+            choice_ids = list(contents)
+        return {
+            "id": str(question_id),
+            "content": question["content"],
+            "choices": [
+                {"id": choice_id, "content": contents[choice_id]}
+                for choice_id in choice_ids if choice_id in contents
+            ],
+        }
+
+    def to_json(self):
+        return json.dumps(list(self.questions.values()))
+
+    @classmethod
+    def from_json(cls, data):
+        return cls(json.loads(data))
+
+def quiz_version_statement(quiz_id, version):
+    return select(QuizVersion.content).where(QuizVersion.quiz_id == quiz_id, QuizVersion.version == version)
+
+# 버전이 기록되기 전의 퀴즈를 위한 대체 경로: 현재 질문/선택지로 내용을 만든다
+async def load_live_content(db: AsyncSession, quiz_id):
+    result = await db.execute(
+        select(Question.id, Question.content, Question.correct_choice_id, Choice.id, Choice.content)
+        .outerjoin(Choice, (Choice.question_id == Question.id) & Choice.removed_at.is_(None))
+        .where(Question.quiz_id == quiz_id, Question.removed_at.is_(None))
+        .order_by(Question.created_at, Question.id, Choice.created_at, Choice.id)
+    )
+    questions = {}
+    for question_id, question_content, correct_choice_id, choice_id, choice_content in result.all():
+        question = questions.setdefault(str(question_id), {
+            "id": str(question_id),
+            "content": question_content,
+            "correct": str(correct_choice_id) if correct_choice_id else None,
+            "choices": [],
+        })
+        if choice_id:
+            question["choices"].append([str(choice_id), choice_content])
+    return list(questions.values())
+
+async def load_quiz_content(db: AsyncSession, quiz_id, version):
+    result = await db.execute(quiz_version_statement(quiz_id, version))
+    content = result.scalar_one_or_none()
+    if content is None:
+        content = await load_live_content(db, quiz_id)
+    return QuizContent(content)
+
+async def get_quiz_content(db: AsyncSession, quiz_id, version) -> QuizContent:
+    redis_key = quiz_content_cache_key(quiz_id, version)
+
+    async def load():
+        cached_data = await redis_client.get(redis_key)
+        if cached_data:
+            return QuizContent.from_json(cached_data)
+
+        content = await load_quiz_content(db, quiz_id, version)
+        await redis_client.set(redis_key, content.to_json(), ex=settings.QUIZ_CONTENT_CACHE_TTL)
+        return content
+
+    return await l1_cache.get_or_load(redis_key, load)
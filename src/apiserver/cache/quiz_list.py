@@ -0,0 +1,62 @@
+# apiserver/src/apiserver/cache/quiz_list.py
+from apiserver.schemas.quiz_schema import QuizGetListResponse
+
+# 퀴즈 목록 응답을 최종 JSON 바이트 조각으로 캐시 (GET /quizzes)
+# 캐시 적중 시 JSON 파싱/모델 검증/직렬화 없이 조각을 이어 붙여서 Response로 바로 반환한다.
+# - 퀴즈마다 관리자용(config 포함), 사용자용(config null) 조각을 두고
+#   사용자별 값인 attempted는 각 조각 끝(`"attempted":`)에 true/false만 붙인다.
+# - 조각은 pydantic(model_dump_json)으로 만들므로 필드 순서와 형식이 response_model로 직렬화한 응답과 같다.
+# - Redis에는 조각을 줄바꿈으로 이어서 저장한다. 압축 JSON에는 줄바꿈이 없으므로 (문자열 안에서는 \n으로 이스케이프)
+#   적중 시 split만 하면 된다.
+
+TRUE = b"true}"
+FALSE = b"false}"
+
+class EncodedQuizList:
+    def __init__(self, quiz_ids, admin_items, user_items, head, tail):
+        self.quiz_ids = quiz_ids
+        self.admin_items = admin_items
+        self.user_items = user_items
+        self.head = head
+        self.tail = tail
+
+    def render(self, is_admin, attempted_flags):
+        items = self.admin_items if is_admin else self.user_items
+        return b"".join((
+            self.head,
+            b",".join(item + (TRUE if attempted else FALSE) for item, attempted in zip(items, attempted_flags)),
+            self.tail,
+        ))
+
+    # 줄마다 조각 하나: head, tail, 퀴즈 id들(쉼표 구분), 관리자용 조각들, 사용자용 조각들
+    def dumps(self):
+        return "\n".join((
+            self.head.decode(),
+            self.tail.decode(),
+            ",".join(self.quiz_ids),
+            *(item.decode() for item in self.admin_items),
+            *(item.decode() for item in self.user_items),
+        ))
+
+    @classmethod
+    def loads(cls, data):
+        head, tail, quiz_ids, *items = data.encode().split(b"\n")
+        quiz_ids = quiz_ids.decode().split(",") if quiz_ids else []
+        return cls(quiz_ids, items[:len(quiz_ids)], items[len(quiz_ids):], head, tail)
+
+# `{"title":...,"config":...,"attempted":` (닫는 괄호 전까지)
+def encode_item(quiz, **update):
+    data = quiz.model_copy(update=update).model_dump_json()
+    return data.removesuffix("false}").encode()
+
+def encode_quiz_list(response_data: QuizGetListResponse) -> EncodedQuizList:
+    quizzes = [quiz.model_copy(update={"attempted": False}) for quiz in response_data.quizzes]
+    # 퀴즈 목록을 뺀 나머지 필드: `{"quizzes":[` + `],"total_pages":...}`
+    head, tail = response_data.model_copy(update={"quizzes": []}).model_dump_json().split("[]", 1)
+    return EncodedQuizList(
+        [str(quiz.id) for quiz in quizzes],
+        [encode_item(quiz) for quiz in quizzes],
+        [encode_item(quiz, config=None) for quiz in quizzes],
+        (head + "[").encode(),
+        ("]" + tail).encode(),
+    )
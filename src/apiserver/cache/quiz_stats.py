@@ -0,0 +1,129 @@
+# apiserver/src/apiserver/cache/quiz_stats.py
+from uuid import UUID
+from sqlalchemy import select, func
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from apiserver.models.quiz_attempt_model import QuizAttempt
+from apiserver.db.redis_client import redis_client
+
+# 퀴즈별 통계와 리더보드 (Redis에 제출 시점마다 갱신, 조회는 quiz_attempts/answers를 읽지 않음)
+# - quiz:{id}:stats (HASH): attempts, submissions, score_sum, score:{점수}별 인원, LOADED 표식
+# - quiz:{id}:leaderboard (ZSET): user_id -> 점수
+# 제출 반영은 리더보드 ZADD NX가 성공했을 때만 카운터를 올리므로 같은 제출을 여러 번 반영해도 한 번만 센다.
+# 그래서 DB에서 다시 채우는 rebuild_quiz_stats는 기존 값 위에 덮어써도 되고, 진행 중인 제출과 겹쳐도 중복되지 않는다.
+# (attempts만 단순 카운터라 rebuild 도중 시작된 응시 몇 건은 다음 rebuild까지 빠질 수 있다)
+# LOADED 표식이 없으면 (Redis 유실, 처음 조회) 조회 시점에 DB에서 다시 채운다.
+
+LOADED = "__loaded__"
+REBUILD_BATCH_SIZE = 1000
+
+def quiz_stats_key(quiz_id):
+    return f"quiz:{quiz_id}:stats"
+
+def quiz_leaderboard_key(quiz_id):
+    return f"quiz:{quiz_id}:leaderboard"
+
+# KEYS: stats, leaderboard / ARGV: user_id, score
+RECORD_SUBMISSION_SCRIPT = redis_client.register_script("""
+if redis.call('ZADD', KEYS[2], 'NX', ARGV[2], ARGV[1]) == 1 then
+    redis.call('HINCRBY', KEYS[1], 'submissions', 1)
+    redis.call('HINCRBY', KEYS[1], 'score_sum', ARGV[2])
+    redis.call('HINCRBY', KEYS[1], 'score:' .. ARGV[2], 1)
+end
+""")
+
+async def record_submission_in(pipe, quiz_id, user_id, score):
+    await RECORD_SUBMISSION_SCRIPT(
+        keys=[quiz_stats_key(quiz_id), quiz_leaderboard_key(quiz_id)],
+        args=[str(user_id), score],
+        client=pipe,
+    )
+
+# attempt_quiz 커밋 이후에 호출
+async def record_attempt(quiz_id):
+    await redis_client.hincrby(quiz_stats_key(quiz_id), "attempts", 1)
+
+# submit_quiz_attempt 커밋 이후에 호출
+async def record_submission(quiz_id, user_id, score):
+    async with redis_client.pipeline(transaction=False) as pipe:
+        await record_submission_in(pipe, quiz_id, user_id, score)
+        await pipe.execute()
+
+def submitted_scores_statement(quiz_id):
+    return (
+        select(QuizAttempt.user_id, QuizAttempt.score)
+        .where(QuizAttempt.quiz_id == quiz_id, QuizAttempt.submitted_at.is_not(None))
+    )
+
+# PostgreSQL의 제출 기록으로 통계/리더보드를 다시 채운다 (reset이면 지우고 처음부터)
+async def rebuild_quiz_stats(db: AsyncSession, quiz_id, reset=False):
+    if reset:
+        await redis_client.delete(quiz_stats_key(quiz_id), quiz_leaderboard_key(quiz_id))
+
+    # 서버 측 커서로 나눠 읽어서 응시 수와 무관하게 메모리를 일정하게 사용
+    result = await db.stream(submitted_scores_statement(quiz_id).execution_options(yield_per=REBUILD_BATCH_SIZE))
+    async for rows in result.partitions():
+        async with redis_client.pipeline(transaction=False) as pipe:
+            for user_id, score in rows:
+                await record_submission_in(pipe, quiz_id, user_id, score or 0)
+            await pipe.execute()
+
+    count_result = await db.execute(
+        select(func.count(QuizAttempt.id)).where(QuizAttempt.quiz_id == quiz_id)
+    )
+    await redis_client.hset(quiz_stats_key(quiz_id), mapping={
+        "attempts": count_result.scalar(),
+        LOADED: 1,
+    })
+
+async def load_stats_hash(db: AsyncSession, quiz_id):
+    stats = await redis_client.hgetall(quiz_stats_key(quiz_id))
+    if LOADED not in stats:
+        await rebuild_quiz_stats(db, quiz_id)
+        stats = await redis_client.hgetall(quiz_stats_key(quiz_id))
+    return stats
+
+async def get_quiz_stats(db: AsyncSession, quiz_id):
+    stats = await load_stats_hash(db, quiz_id)
+    submissions = int(stats.get("submissions", 0))
+    return {
+        "attempts": int(stats.get("attempts", 0)),
+        "submissions": submissions,
+        "average_score": int(stats.get("score_sum", 0)) / submissions if submissions else None,
+        "score_distribution": dict(sorted(
+            (int(field.removeprefix("score:")), int(count))
+            for field, count in stats.items() if field.startswith("score:")
+        )),
+    }
+
+# 상위 limit명과 user_id의 순위 (동점자는 같은 순위: 1 + 더 높은 점수의 인원 수)
+async def get_quiz_leaderboard(db: AsyncSession, quiz_id, user_id, limit):
+    if not await redis_client.hexists(quiz_stats_key(quiz_id), LOADED):
+        await rebuild_quiz_stats(db, quiz_id)
+
+    key = quiz_leaderboard_key(quiz_id)
+    async with redis_client.pipeline(transaction=True) as pipe:
+        pipe.zrevrange(key, 0, limit - 1, withscores=True)
+        pipe.zscore(key, str(user_id))
+        top, my_score = await pipe.execute()
+
+    entries = []
+    for position, (member, score) in enumerate(top):
+        if entries and entries[-1]["score"] == int(score):
+            rank = entries[-1]["rank"]
+        else:
+            rank = position + 1
+        entries.append({"rank": rank, "user_id": UUID(member), "score": int(score)})
+
+    my_rank = None
+    if my_score is not None:
+        my_rank = await redis_client.zcount(key, f"({my_score}", "+inf") + 1
+
+    return {
+        "entries": entries,
+        "my_rank": my_rank,
+        "my_score": int(my_score) if my_score is not None else None,
+    }
+
+async def drop_quiz_stats(quiz_id):
+    await redis_client.delete(quiz_stats_key(quiz_id), quiz_leaderboard_key(quiz_id))
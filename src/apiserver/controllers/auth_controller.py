@@ -6,7 +6,7 @@ from sqlalchemy.future import select
 
 from apiserver.db.database import get_db
 from apiserver.models.user_model import User
-from apiserver.utils.auth import verify_password, create_access_token, hash_password
+from apiserver.utils.auth import verify_password_async, create_access_token
 
 router = APIRouter(prefix="/auth", tags=["Auth"])
 
@@ -18,7 +18,7 @@ async def login(
     result = await db.execute(select(User).where(User.name == form_data.username))
     user = result.scalar_one_or_none()
 
-    if not user or not verify_password(form_data.password, hash_password(form_data.password)):
+    if not user or not await verify_password_async(form_data.password, user.password):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Incorrect username or password",
@@ -0,0 +1,19 @@
+from fastapi import APIRouter, Depends
+from apiserver.db.database import pool_stats
+from apiserver.schemas.user_shcema import UserPrincipal
+from apiserver.dependencies.auth import admin_required
+from apiserver.utils.auth import password_hash_stats
+from apiserver.dependencies.rate_limit import route_limit_stats
+from apiserver.cache.l1 import l1_cache
+
+router = APIRouter(tags=["Metrics"])
+
+# 워커 프로세스별 풀/캐시 상태 (관리자용)
+@router.get("/metrics")
+async def get_metrics(current_user: UserPrincipal = Depends(admin_required)):
+    return {
+        "db_pool": pool_stats(),
+        "password_hash": password_hash_stats(),
+        "route_limits": route_limit_stats(),
+        "l1_cache": l1_cache.stats(),
+    }
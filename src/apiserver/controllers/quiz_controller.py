@@ -1,25 +1,50 @@
 # controllers/quiz_controller.py
 from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from fastapi.responses import Response, StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
-from sqlalchemy.orm import selectinload, aliased
-from sqlalchemy import delete, case, func, literal
-from sqlalchemy.sql import exists
+from sqlalchemy.orm import selectinload
+from sqlalchemy import delete, update, func
+from sqlalchemy.exc import SQLAlchemyError, IntegrityError
+from pydantic import ValidationError
 from uuid import UUID
-import random
+from typing import Optional
 from datetime import datetime
 
 from apiserver.db.database import get_db
 from apiserver.models.quiz_model import Quiz
+from apiserver.models.quiz_version_model import QuizVersion
 from apiserver.models.quiz_config_model import QuizConfig
 from apiserver.models.question_model import Question
 from apiserver.models.choice_model import Choice
-from apiserver.models.user_model import User
 from apiserver.models.quiz_attempt_model import QuizAttempt
 from apiserver.models.answer_model import Answer
-from apiserver.schemas.quiz_schema import QuizCreate, QuizUpdate, QuizUpdateResponse, QuizCreateResponse, QuizResponse, QuizGetListResponse, QuizGetDetailForStaffResponse, QuizAttemptResponse, QuizGetDetailForUserResponse, QuizAnswerCreate, QuizAnswerCreateResponse, QuizSubmitResponse
+from apiserver.schemas.quiz_schema import QuizCreate, QuizImportResponse, QuizUpdate, QuizUpdateResponse, QuizCreateResponse, QuizResponse, QuizGetListResponse, QuizGetDetailForStaffResponse, QuizAttemptResponse, QuizGetDetailForUserResponse, QuizAnswerCreate, QuizAnswerCreateResponse, QuizSubmitResponse, QuizPurgeStatusResponse, QuizStatsResponse, QuizLeaderboardResponse, QuizItemAnalysisResponse
+from apiserver.schemas.user_shcema import UserPrincipal
 from apiserver.dependencies.auth import get_current_user, admin_required
 from apiserver.db.redis_client import redis_client
+from apiserver.utils.quiz_writer import insert_quizzes
+from apiserver.utils.quiz_diff import load_live_questions, diff_questions, apply_question_diff
+from apiserver.utils.quiz_purge import mark_purge_pending, get_purge_status
+from apiserver.utils.results_export import EXPORT_MEDIA_TYPES, stream_results
+from apiserver.utils.ndjson import iter_ndjson_lines
+from apiserver.utils.pagination import decode_cursor, apply_cursor, cursor_page
+from apiserver.utils.answers import save_answers
+from apiserver.utils.attempt import (
+    load_attempt_page, selected_choice_ids, sample_attempt_questions, is_snapshot_question, render_attempt_questions,
+)
+from apiserver.cache.quiz_content import get_quiz_content
+from apiserver.utils.grading import grade_attempt, answer_key_from_snapshot
+from apiserver.cache.answer_key import get_answer_key
+from apiserver.cache.l1 import l1_cache
+from apiserver.cache.generation import cache_key, bump_generation, QUIZZES, quiz_namespace, quiz_user_namespace
+from apiserver.cache.attempted import get_attempted_flags, mark_attempted
+from apiserver.cache.item_analysis import get_item_analysis
+from apiserver.cache.quiz_list import EncodedQuizList, encode_quiz_list
+from apiserver.cache.quiz_stats import record_attempt, record_submission, rebuild_quiz_stats, get_quiz_stats, get_quiz_leaderboard
+from apiserver.dependencies.db import get_read_db, read_session_factory
+from apiserver.dependencies.rate_limit import answer_limit, submit_limit
+from apiserver.config import settings
 import json
 import math
 
@@ -30,54 +55,77 @@ router = APIRouter(prefix="/quizzes", tags=["Quizzes"])
 async def create_quiz(
     quiz_data: QuizCreate,
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(admin_required),
+    current_user: UserPrincipal = Depends(admin_required),
 ):
-    quiz = Quiz(
-        title=quiz_data.title, 
-        description=quiz_data.description,
-        created_by=current_user.id
-    )
-    db.add(quiz)
-    await db.flush()
-
-    config = QuizConfig(
-        quiz_id=quiz.id,
-        num_questions=quiz_data.num_questions,
-        shuffle_questions=quiz_data.shuffle_questions,
-        shuffle_choices=quiz_data.shuffle_choices,
-    )
-    db.add(config)
-    await db.flush()
-
-    for question_data in quiz_data.questions:
-        question = Question(
-            quiz_id=quiz.id,
-            content=question_data.content,
-        )
-        db.add(question)
-        await db.flush()
+    quiz_ids = await insert_quizzes(db, [(quiz_data, current_user.id)])
+    await db.commit()
+    await bump_generation(QUIZZES)
+    return {
+        "quiz_id": quiz_ids[0],
+        "message": "Successfully Created"
+    }
 
-        for choice_data in question_data.choices:
-            choice = Choice(
-                question_id=question.id,
-                content=choice_data.content,
-            )
-            db.add(choice)
-            await db.flush()
-            if choice_data.is_correct:
-                correct_choice_id = choice.id
+# 1-1. 관리자 퀴즈 일괄 등록 (NDJSON 스트림, 한 줄에 QuizCreate 하나)
+@router.post("/import", response_model=QuizImportResponse)
+async def import_quizzes(
+    request: Request,
+    db: AsyncSession = Depends(get_db),
+    current_user: UserPrincipal = Depends(admin_required),
+):
+    imported = 0
+    failed = 0
+    errors = []
+    batch = []
+
+    def report(line_no, detail):
+        nonlocal failed
+        failed += 1
+        if len(errors) < settings.IMPORT_MAX_REPORTED_ERRORS:
+            errors.append({"line": line_no, "detail": detail})
+
+    async def write_batch():
+        nonlocal imported
+        try:
+            await insert_quizzes(db, [(quiz_data, current_user.id) for _, quiz_data in batch])
+            await db.commit()
+            imported += len(batch)
+        except SQLAlchemyError:
+            await db.rollback()
+            # 배치가 실패하면 한 건씩 다시 저장해서 실패한 줄만 보고
+            for line_no, quiz_data in batch:
+                try:
+                    await insert_quizzes(db, [(quiz_data, current_user.id)])
+                    await db.commit()
+                    imported += 1
+                except SQLAlchemyError as e:
+                    await db.rollback()
+                    report(line_no, f"Database error: {e.__class__.__name__}")
+        batch.clear()
+        await bump_generation(QUIZZES)
+
+    async for line_no, line in iter_ndjson_lines(request.stream(), settings.IMPORT_MAX_LINE_BYTES):
+        if line is None:
+            report(line_no, f"Line exceeds {settings.IMPORT_MAX_LINE_BYTES} bytes")
+            continue
+        try:
+            quiz_data = QuizCreate.model_validate_json(line)
+        except ValidationError as e:
+            report(line_no, "; ".join(
+                f"{'.'.join(str(loc) for loc in err['loc']) or 'body'}: {err['msg']}" for err in e.errors()
+            ))
+            continue
 
-        if correct_choice_id:
-            question.correct_choice_id = correct_choice_id
+        batch.append((line_no, quiz_data))
+        if len(batch) >= settings.IMPORT_BATCH_SIZE:
+            await write_batch()
 
-        db.add(question)
-        await db.flush()
+    if batch:
+        await write_batch()
 
-    await db.commit()
-    await db.refresh(quiz)
     return {
-        "quiz_id": quiz.id,
-        "message": "Successfully Created"
+        "imported": imported,
+        "failed": failed,
+        "errors": errors,
     }
 
 # # 2. 사용자/관리자 퀴즈 목록 조회 + 페이징
@@ -86,79 +134,81 @@ async def list_quizzes(
     request: Request,
     page: int = 1,
     per_page: int = 10,
-    db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    cursor: Optional[str] = None,
+    db: AsyncSession = Depends(get_read_db),
+    current_user: UserPrincipal = Depends(get_current_user),
 ):
-    redis_key = str(request.url.path) + "?" + str(request.url.query)
-
-    cached_data = await redis_client.get(redis_key)
-    if cached_data:
-        return QuizGetListResponse.model_validate(json.loads(cached_data))
-
-    count_result = await db.execute(select(func.count(Quiz.id)))
-    total = count_result.scalar()
-    offset = (page - 1) * per_page
-    total_pages = math.ceil(total / per_page)
-
-    attempt_alias = aliased(QuizAttempt)
-
-    stmt = (
-        select(
-            Quiz,
-            case(
-                (
-                    exists().where(
-                        (attempt_alias.quiz_id == Quiz.id)
-                        & (attempt_alias.user_id == current_user.id)
-                    ),
-                    literal(True),
-                ),
-                else_=literal(False),
-            ).label("attempted"),
-        )
-        .options(selectinload(Quiz.config))
-        .offset(offset)
-        .limit(per_page)
-    )
+    # 목록 페이지는 사용자와 무관하게 공유 캐시 (관리자 기준, attempted 제외)
+    # 캐시 값은 최종 JSON 조각 (cache/quiz_list.py)
+    redis_key = await cache_key("quizzes:list:encoded?" + str(request.url.query), QUIZZES)
+
+    async def load_page():
+        cached_data = await redis_client.get(redis_key)
+        if cached_data:
+            return EncodedQuizList.loads(cached_data)
+
+        # 삭제된(정리 대기 중인) 퀴즈는 제외
+        stmt = select(Quiz).options(selectinload(Quiz.config)).where(Quiz.deleted_at.is_(None))
+
+        next_cursor = prev_cursor = None
+        if cursor is None:
+            count_result = await db.execute(select(func.count(Quiz.id)).where(Quiz.deleted_at.is_(None)))
+            total = count_result.scalar()
+            offset = (page - 1) * per_page
+            total_pages = math.ceil(total / per_page)
+
+            result = await db.execute(
+                stmt.order_by(Quiz.created_at, Quiz.id).offset(offset).limit(per_page)
+            )
+            quizzes = result.scalars().all()
+        else:
+            # 커서 모드: count(*)/OFFSET 없이 (created_at, id) 기준으로 조회
+            position = decode_cursor(cursor)
+            total_pages = None
 
-    result = await db.execute(stmt)
+            result = await db.execute(apply_cursor(stmt, Quiz.created_at, Quiz.id, position, per_page))
+            quizzes, next_cursor, prev_cursor = cursor_page(
+                result.scalars().all(), position, per_page, lambda quiz: (quiz.created_at, quiz.id)
+            )
 
-    quizzes_with_attempted = []
-    for quiz, attempted in result.all():
-        setattr(quiz, "attempted", attempted)
+        response_data = QuizGetListResponse(
+            quizzes=[QuizResponse.model_validate(quiz) for quiz in quizzes],
+            total_pages=total_pages,
+            page=page if cursor is None else None,
+            per_page=per_page,
+            next_cursor=next_cursor,
+            prev_cursor=prev_cursor,
+        )
 
-        if not current_user.is_admin:
-            quiz.config = None
+        encoded = encode_quiz_list(response_data)
+        await redis_client.set(redis_key, encoded.dumps(), ex=settings.CACHE_TTL)
+        return encoded
 
-        quiz_response = QuizResponse.model_validate(quiz)
-        quizzes_with_attempted.append(quiz_response)
+    encoded = await l1_cache.get_or_load(redis_key, load_page)
 
-    response_data = QuizGetListResponse(
-        quizzes=quizzes_with_attempted,
-        total_pages=total_pages,
-        page=page,
-        per_page=per_page,
+    # 사용자별 attempted 값과 config 노출 여부만 덧붙여서 바로 반환 (response_model 검증/직렬화를 거치지 않음)
+    attempted_flags = await get_attempted_flags(db, current_user.id, encoded.quiz_ids)
+    return Response(
+        content=encoded.render(current_user.is_admin, attempted_flags),
+        media_type="application/json",
     )
 
-    await redis_client.set(redis_key, response_data.model_dump_json(), ex=60)
-
-    return response_data
-
 # 3. 관리자 퀴즈 수정
 @router.patch("/{quiz_id}", response_model=QuizUpdateResponse)
 async def update_quiz(
     quiz_id: UUID,
     quiz_data: QuizUpdate,
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(admin_required),
+    current_user: UserPrincipal = Depends(admin_required),
 ):
-    result = await db.execute(select(Quiz).where(Quiz.id == quiz_id))
+    # 동시에 수정해도 버전 번호가 겹치지 않도록 퀴즈 행을 잠근다
+    result = await db.execute(select(Quiz).where(Quiz.id == quiz_id, Quiz.deleted_at.is_(None)).with_for_update())
     quiz = result.scalar_one_or_none()
 
     if not quiz:
         raise HTTPException(status_code=404, detail="Quiz not found")
 
-    quiz.update_at = datetime.now()
+    quiz.updated_at = datetime.now()
 
     update_fields = quiz_data.model_dump(exclude_unset=True)
     
@@ -177,36 +227,21 @@ async def update_quiz(
         else:
             setattr(quiz, key, value)
 
-    # 질문과 선택지 업데이트
+    # 질문과 선택지 업데이트: 현재 내용과 비교해서 바뀐 행만 쓰고, 바뀌었으면 새 내용 버전을 기록
     if "questions" in update_fields:
-        # 기존 질문 및 선택지 삭제
-        await db.execute(delete(Choice).where(Choice.question_id.in_(
-            select(Question.id).where(Question.quiz_id == quiz_id)
-        )))
-        await db.execute(delete(Question).where(Question.quiz_id == quiz_id))
-
-        for question_data in quiz_data.questions:
-            question = Question(
-                quiz_id=quiz.id,
-                content=question_data.content,
-            )
-            db.add(question)
-            await db.flush()
+        live_questions = await load_live_questions(db, quiz_id)
+        try:
+            diff = diff_questions(quiz_id, live_questions, quiz_data.questions)
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
 
-            for choice_data in question_data.choices:
-                choice = Choice(
-                    question_id=question.id,
-                    content=choice_data.content,
-                )
-                db.add(choice)
-                await db.flush()
-
-                if choice_data.is_correct:
-                    question.correct_choice_id = choice.id
-
-            await db.flush()
+        if diff.changed:
+            await apply_question_diff(db, diff)
+            quiz.version += 1
+            db.add(QuizVersion(quiz_id=quiz_id, version=quiz.version, content=diff.content))
 
     await db.commit()
+    await bump_generation(QUIZZES, quiz_namespace(quiz_id))
     await db.refresh(quiz)
     return {
         'quiz_id': quiz_id,
@@ -218,27 +253,33 @@ async def update_quiz(
 async def delete_quiz(
     quiz_id: UUID,
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(admin_required),
+    current_user: UserPrincipal = Depends(admin_required),
 ):
-    # 퀴즈 존재 여부 확인
-    quiz = await db.get(Quiz, quiz_id, options=[selectinload(Quiz.questions)])
-    if not quiz:
+    # 삭제 표시만 하고 바로 응답 (답안/응시/질문 등은 백그라운드에서 배치로 정리: utils/quiz_purge.py)
+    deleted_at = datetime.now()
+    result = await db.execute(
+        update(Quiz)
+        .where(Quiz.id == quiz_id, Quiz.deleted_at.is_(None))
+        .values(deleted_at=deleted_at)
+        .returning(Quiz.id)
+    )
+    if result.scalar_one_or_none() is None:
         raise HTTPException(status_code=404, detail="Quiz not found")
 
-    # 질문 ID 목록 조회
-    question_ids = [q.id for q in quiz.questions]
-
-    # 순서대로 삭제
-    if question_ids:
-        await db.execute(delete(Answer).where(Answer.question_id.in_(question_ids)))
-        await db.execute(delete(Choice).where(Choice.question_id.in_(question_ids)))
-        await db.execute(delete(Question).where(Question.id.in_(question_ids)))
-
-    await db.execute(delete(QuizConfig).where(QuizConfig.quiz_id == quiz_id))
-    await db.execute(delete(QuizAttempt).where(QuizAttempt.quiz_id == quiz_id))
-    await db.execute(delete(Quiz).where(Quiz.id == quiz_id))
-
     await db.commit()
+    await bump_generation(QUIZZES, quiz_namespace(quiz_id))
+    await mark_purge_pending(quiz_id, deleted_at)
+
+# 4-1. 관리자 삭제된 퀴즈 정리 진행 상황 조회
+@router.get("/{quiz_id}/purge", response_model=QuizPurgeStatusResponse)
+async def get_quiz_purge_status(
+    quiz_id: UUID,
+    current_user: UserPrincipal = Depends(admin_required),
+):
+    status = await get_purge_status(quiz_id)
+    if status is None:
+        raise HTTPException(status_code=404, detail="Quiz purge not found")
+    return status
 
 # 5. 관리자 퀴즈 상세 조회
 @router.get("/{quiz_id}/forstaff", response_model=QuizGetDetailForStaffResponse)
@@ -247,136 +288,142 @@ async def get_quiz_questions(
     quiz_id: UUID,
     page: int = 1,
     per_page: int = 10,
-    db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(admin_required),
+    cursor: Optional[str] = None,
+    db: AsyncSession = Depends(get_read_db),
+    current_user: UserPrincipal = Depends(admin_required),
 ):
 
-    # redis_key = str(request.url)
+    redis_key = await cache_key(
+        f"quizzes:forstaff:{quiz_id}?{request.url.query}",
+        quiz_namespace(quiz_id),
+    )
 
-    # cached_data = await redis_client.get(redis_key)
-    # if cached_data:
-    #     cached_obj = QuizGetDetailForStaffResponse.model_validate_json(cached_data)
-    #     return cached_obj
+    async def load_detail():
+        cached_data = await redis_client.get(redis_key)
+        if cached_data:
+            return QuizGetDetailForStaffResponse.model_validate_json(cached_data)
 
-    result = await db.execute(
-        select(Quiz)
-        .options(selectinload(Quiz.config))
-        .where(Quiz.id == quiz_id)
-    )
-    quiz = result.scalar_one_or_none()
-    if not quiz:
-        raise HTTPException(status_code=404, detail="Quiz not found")
+        result = await db.execute(
+            select(Quiz)
+            .options(selectinload(Quiz.config))
+            .where(Quiz.id == quiz_id, Quiz.deleted_at.is_(None))
+        )
+        quiz = result.scalar_one_or_none()
+        if not quiz:
+            raise HTTPException(status_code=404, detail="Quiz not found")
+
+        config = quiz.config
+        if not config:
+            raise HTTPException(status_code=400, detail="Quiz config not found")
+
+        # 수정으로 빠진 질문/선택지(removed_at)는 제외
+        stmt = (
+            select(Question)
+            .where(Question.quiz_id == quiz_id, Question.removed_at.is_(None))
+            .options(selectinload(Question.choices.and_(Choice.removed_at.is_(None))))
+        )
 
-    config = quiz.config
-    if not config:
-        raise HTTPException(status_code=400, detail="Quiz config not found")
+        next_cursor = prev_cursor = None
+        if cursor is None:
+            count_result = await db.execute(
+                select(func.count(Question.id))
+                .where(Question.quiz_id == quiz_id, Question.removed_at.is_(None))
+            )
+            total = count_result.scalar()
+            offset = (page - 1) * per_page
+            total_pages = math.ceil(total / per_page)
 
-    count_result = await db.execute(
-        select(func.count(Question.id))
-        .where(Question.quiz_id == quiz_id)
-    )
-    total = count_result.scalar()
-    offset = (page - 1) * per_page
+            result = await db.execute(
+                stmt.order_by(Question.created_at, Question.id).offset(offset).limit(per_page)
+            )
+            questions = result.scalars().unique().all()
+        else:
+            # 커서 모드: count(*)/OFFSET 없이 (created_at, id) 기준으로 조회
+            position = decode_cursor(cursor)
+            total_pages = None
 
-    result = await db.execute(
-        select(Question)
-        .where(Question.quiz_id == quiz_id)
-        .options(selectinload(Question.choices))
-        .offset(offset)
-        .limit(per_page)
-    )
-    questions = result.scalars().unique().all()
-
-    response_data = QuizGetDetailForStaffResponse(
-        title=quiz.title,
-        description=quiz.description,
-        created_by=quiz.created_by,
-        created_at=quiz.created_at.isoformat() if quiz.created_at else None,
-        updated_at=quiz.updated_at.isoformat() if quiz.updated_at else None,
-        config=quiz.config,
-        questions=questions,
-        total_pages=math.ceil(total / per_page),
-        page=page,
-        per_page=per_page,
-    )
+            result = await db.execute(apply_cursor(stmt, Question.created_at, Question.id, position, per_page))
+            questions, next_cursor, prev_cursor = cursor_page(
+                result.scalars().unique().all(), position, per_page, lambda q: (q.created_at, q.id)
+            )
 
-    # await redis_client.set(redis_key, response_data.model_dump_json(), ex=60)
+        response_data = QuizGetDetailForStaffResponse(
+            title=quiz.title,
+            description=quiz.description,
+            created_by=quiz.created_by,
+            created_at=quiz.created_at.isoformat() if quiz.created_at else None,
+            updated_at=quiz.updated_at.isoformat() if quiz.updated_at else None,
+            config=quiz.config,
+            version=quiz.version,
+            questions=questions,
+            total_pages=total_pages,
+            page=page if cursor is None else None,
+            per_page=per_page,
+            next_cursor=next_cursor,
+            prev_cursor=prev_cursor,
+        )
+
+        await redis_client.set(redis_key, response_data.model_dump_json(), ex=settings.CACHE_TTL)
+        return response_data
 
-    return response_data
+    return await l1_cache.get_or_load(redis_key, load_detail)
 
 # 6.퀴즈 응시
 @router.post("/{quiz_id}/attempt", response_model=QuizAttemptResponse)
 async def attempt_quiz(
     quiz_id: UUID,
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    current_user: UserPrincipal = Depends(get_current_user),
 ):
 
     result = await db.execute(
         select(Quiz)
         .options(selectinload(Quiz.config))
-        .where(Quiz.id == quiz_id)
+        .where(Quiz.id == quiz_id, Quiz.deleted_at.is_(None))
     )
     quiz = result.scalar_one_or_none()
     if not quiz:
         raise HTTPException(status_code=404, detail="Quiz not found")
 
-    def convert_uuid_to_str(data):
-        if isinstance(data, dict):
-            return {k: convert_uuid_to_str(v) for k, v in data.items()}
-        elif isinstance(data, list):
-            return [convert_uuid_to_str(i) for i in data]
-        elif isinstance(data, UUID):
-            return str(data)
-        elif hasattr(data, 'model_dump'):  # 예외 대비
-            return convert_uuid_to_str(data.model_dump())
-        else:
-            return data
+    # 사용자당 한 번만 응시 가능 (quiz_attempts (user_id, quiz_id) 유니크)
+    result = await db.execute(
+        select(QuizAttempt.id).where(
+            QuizAttempt.quiz_id == quiz_id,
+            QuizAttempt.user_id == current_user.id
+        )
+    )
+    if result.scalar_one_or_none():
+        raise HTTPException(status_code=400, detail="Already attempted")
 
     config = quiz.config
     if not config:
         raise HTTPException(status_code=400, detail="Quiz config not found")
 
-    result = await db.execute(
-        select(Question)
-        .where(Question.quiz_id == quiz_id)
-        .options(selectinload(Question.choices))
+    # 퀴즈 내용 캐시의 질문 id 목록에서 num_questions개만 골라 저장 (전체 질문/선택지를 읽지 않음)
+    content = await get_quiz_content(db, quiz_id, quiz.version)
+    questions_as_dict = sample_attempt_questions(
+        content, config.num_questions, config.shuffle_questions, config.shuffle_choices
     )
-    questions = result.scalars().all()
-
-    if config.shuffle_questions:
-        random.shuffle(questions)
-
-    print(questions)
-
-    def serialize_question(question: Question):
-        if config.shuffle_choices:
-            random.shuffle(question.choices)
-        return {
-            "id": str(question.id),
-            "content": question.content,
-            "correct_choice_id": str(question.correct_choice_id) if question.correct_choice_id else None,
-            "choices": [
-                {
-                    "id": str(choice.id),
-                    "question_id": str(choice.id),
-                    "content": choice.content,
-                } for choice in question.choices
-            ]
-    }
-
-    questions_as_dict = [serialize_question(q) for q in questions[:config.num_questions]]
 
     # 새로운 응시 생성
     attempt = QuizAttempt(
         user_id=current_user.id, 
         quiz_id=quiz_id,
-        questions=questions_as_dict
+        questions=questions_as_dict,
+        quiz_version=quiz.version,
     )
     db.add(attempt)
-    await db.flush()
+    try:
+        await db.flush()
+    except IntegrityError:
+        # 동시에 들어온 응시 요청
+        await db.rollback()
+        raise HTTPException(status_code=400, detail="Already attempted")
 
     await db.commit()
+    await mark_attempted(current_user.id, quiz_id)
+    await record_attempt(quiz_id)
+    await bump_generation(quiz_user_namespace(quiz_id, current_user.id))
     return {
         "attempt_id": attempt.id, 
         "message": "Succesfully Attempt"
@@ -389,94 +436,96 @@ async def get_quiz_questions(
     quiz_id: UUID,
     page: int = 1,
     per_page: int = 10,
-    db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_read_db),
+    current_user: UserPrincipal = Depends(get_current_user),
 ):
-    # 바로 바로 확인해야 하기 때문에 캐싱에서 제외
-    # redis_key = str(request.url)
-
-    # cached_data = await redis_client.get(redis_key)
-    # if cached_data:
-    #     cached_obj = QuizGetDetailForUserResponse.model_validate_json(cached_data)
-    #     return cached_obj
-
-
-    result = await db.execute(
-        select(Quiz)
-        .options(selectinload(Quiz.config))
-        .where(Quiz.id == quiz_id)
+    if page < 1 or per_page < 1:
+        raise HTTPException(status_code=400, detail="Invalid page")
+
+    # 응시/답안 저장/제출 시 quiz:{id}:user:{user_id} 세대가 올라가므로 바로 반영됨
+    redis_key = await cache_key(
+        f"quizzes:foruser:{quiz_id}:{current_user.id}?{request.url.query}",
+        quiz_namespace(quiz_id),
+        quiz_user_namespace(quiz_id, current_user.id),
     )
-    quiz = result.scalar_one_or_none()
-    if not quiz:
-        raise HTTPException(status_code=404, detail="Quiz not found")
-
-    config = quiz.config
-    if not config:
-        raise HTTPException(status_code=400, detail="Quiz config not found")
-
-    result = await db.execute(
-        select(QuizAttempt)
-        .where(QuizAttempt.user_id == current_user.id)
-        .where(QuizAttempt.quiz_id == quiz_id)
-    )
-    attempt = result.scalar_one_or_none()
-    if not attempt:
-        raise HTTPException(status_code=404, detail="Quiz attempt not found")
 
-    questions = attempt.questions
+    async def load_detail():
+        cached_data = await redis_client.get(redis_key)
+        if cached_data:
+            return QuizGetDetailForUserResponse.model_validate_json(cached_data)
 
-    total_pages = math.ceil((len(questions) + per_page - 1) / per_page)
-    start = (page - 1) * per_page
-    end = start + per_page
-
-    result = await db.execute(
-        select(Answer).where(Answer.attempt_id == attempt.id)
-    )
-    answers = result.scalars().all()
-
-    data = []
-    for question in questions[start:end]:
-        choices = question["choices"]
-        data.append({
-            "id": question["id"],
-            "content": question["content"],
-            "correct_choice_id": None,
-            "choices": [
-                {
-                    "id": choice["id"],
-                    "content": choice["content"],
-                    "selected": any(str(ans.choice_id) == str(choice["id"]) for ans in answers),
-                } for choice in choices
-            ]
-        })
-
-    response_data = QuizGetDetailForUserResponse(
-        id=quiz.id,
-        title=quiz.title,
-        description=quiz.description,
-        page=page,
-        per_page=per_page,
-        total_pages=total_pages,
-        questions=data,
-    )
+        result = await db.execute(
+            select(Quiz)
+            .options(selectinload(Quiz.config))
+            .where(Quiz.id == quiz_id, Quiz.deleted_at.is_(None))
+        )
+        quiz = result.scalar_one_or_none()
+        if not quiz:
+            raise HTTPException(status_code=404, detail="Quiz not found")
+
+        config = quiz.config
+        if not config:
+            raise HTTPException(status_code=400, detail="Quiz config not found")
+
+        # 응시한 질문 중 요청한 페이지만 DB에서 잘라서 가져온다
+        row = await load_attempt_page(db, current_user.id, quiz_id, (page - 1) * per_page, per_page)
+        if not row:
+            raise HTTPException(status_code=404, detail="Quiz attempt not found")
+        attempt_id, quiz_version, total_questions, questions = row
+
+        total_pages = math.ceil(total_questions / per_page)
+
+        # 이 페이지 질문들의 답안만 조회해서 선택한 choice_id 집합으로 확인
+        selected = await selected_choice_ids(db, attempt_id, [question["id"] for question in questions])
+
+        # compact 형식의 응시는 퀴즈 내용 캐시에서 문제/선택지 내용을 채운다
+        content = None
+        if not all(is_snapshot_question(question) for question in questions):
+            content = await get_quiz_content(db, quiz_id, quiz_version or quiz.version)
+
+        data = []
+        for question in render_attempt_questions(questions, content):
+            data.append({
+                "id": question["id"],
+                "content": question["content"],
+                "correct_choice_id": None,
+                "choices": [
+                    {
+                        "id": choice["id"],
+                        "content": choice["content"],
+                        "selected": choice["id"] in selected,
+                    } for choice in question["choices"]
+                ]
+            })
+
+        response_data = QuizGetDetailForUserResponse(
+            id=quiz.id,
+            title=quiz.title,
+            description=quiz.description,
+            page=page,
+            per_page=per_page,
+            total_pages=total_pages,
+            questions=data,
+        )
 
-    # await redis_client.set(redis_key, response_data.model_dump_json(), ex=60)
+        await redis_client.set(redis_key, response_data.model_dump_json(), ex=settings.CACHE_TTL)
+        return response_data
 
-    return response_data
+    return await l1_cache.get_or_load(redis_key, load_detail)
 
 # 8.응시내용 임시저장
-@router.post("/{quiz_id}/answer", response_model=QuizAnswerCreateResponse)
+@router.post("/{quiz_id}/answer", response_model=QuizAnswerCreateResponse, dependencies=[Depends(answer_limit)])
 async def save_quiz_answers(
     quiz_id: UUID,
     answer_data: QuizAnswerCreate,
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    current_user: UserPrincipal = Depends(get_current_user),
 ):
 
     result = await db.execute(
         select(Quiz)
         .options(selectinload(Quiz.config))
-        .where(Quiz.id == quiz_id)
+        .where(Quiz.id == quiz_id, Quiz.deleted_at.is_(None))
     )
     quiz = result.scalar_one_or_none()
     if not quiz:
@@ -490,41 +539,53 @@ async def save_quiz_answers(
     )
 
     attempt = existing_attempt.scalar_one_or_none()
+    if not attempt:
+        raise HTTPException(status_code=404, detail="Quiz attempt not found")
 
     if attempt.submitted_at:
         raise HTTPException(status_code=400, detail="Already submitted")
 
-    # 이전 답안 삭제 후 다시 저장
-    await db.execute(
-        delete(Answer).where(Answer.attempt_id == attempt.id)
+    # 응시한 질문 세트와 정답표 캐시로 질문/선택지 유효성 검사
+    attempt_question_ids = {UUID(question["id"]) for question in attempt.questions}
+    answer_key = await get_answer_key(db, quiz_id, attempt.quiz_version or quiz.version)
+    if not all(
+        ans.question_id in attempt_question_ids and answer_key.is_valid(ans.question_id, ans.choice_id)
+        for ans in answer_data.answer
+    ) or not attempt_question_ids.issuperset(answer_data.cleared):
+        raise HTTPException(status_code=400, detail="Invalid question or choice")
+
+    # (attempt_id, question_id) 기준 upsert, 같은 질문이 여러 번 오면 마지막 답안 사용
+    answers = {ans.question_id: ans.choice_id for ans in answer_data.answer}
+    await save_answers(
+        db,
+        attempt.id,
+        answers,
+        replace=answer_data.mode == "replace",
+        cleared=[question_id for question_id in answer_data.cleared if question_id not in answers],
     )
 
-    for ans in answer_data.answer:
-        db.add(Answer(
-            attempt_id=attempt.id,
-            question_id=ans.question_id,
-            choice_id=ans.choice_id,
-            is_correct=False  # 제출이 아니므로 아직 판단하지 않음
-        ))
-
     await db.commit()
+    await bump_generation(quiz_user_namespace(quiz_id, current_user.id))
     return {
         "attempt_id": attempt.id, 
         "message": "Successfully Saved"
     }
 
 # 9.퀴즈 제출
-@router.post("/{quiz_id}/submit", response_model=QuizSubmitResponse)
+@router.post("/{quiz_id}/submit", response_model=QuizSubmitResponse, dependencies=[Depends(submit_limit)])
 async def submit_quiz_attempt(
     quiz_id: UUID,
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    current_user: UserPrincipal = Depends(get_current_user),
 ):
-    # 기존 응시 내역 확인
+    # 기존 응시 내역 확인 (삭제된 퀴즈의 응시는 제외)
     result = await db.execute(
-        select(QuizAttempt).where(
+        select(QuizAttempt)
+        .join(Quiz, Quiz.id == QuizAttempt.quiz_id)
+        .where(
             QuizAttempt.quiz_id == quiz_id,
-            QuizAttempt.user_id == current_user.id
+            QuizAttempt.user_id == current_user.id,
+            Quiz.deleted_at.is_(None),
         )
     )
     attempt = result.scalar_one_or_none()
@@ -534,25 +595,102 @@ async def submit_quiz_attempt(
         raise HTTPException(status_code=400, detail="Already submitted")
 
 
-    # 저장된 답변 불러오기
-    result = await db.execute(
-        select(Answer).where(Answer.attempt_id == attempt.id)
-    )
-    answers = result.scalars().all()
-
-    total_score = 0
-    for ans in answers:
-        question: Question = await db.get(Question, ans.question_id)
-        is_correct = question.correct_choice_id == ans.choice_id
-        if is_correct:
-            total_score += 1
-        db.add(ans)
-
-    attempt.score = total_score
-    attempt.submitted_at = datetime.now()
+    # 답안 채점과 점수 저장을 한 번에 처리 (응시 시점의 정답 스냅샷 기준, 없으면 응시한 버전의 정답표)
+    answer_key = answer_key_from_snapshot(attempt.questions)
+    if answer_key is None:
+        quiz_version = attempt.quiz_version
+        if quiz_version is None:
+            quiz_version = (await db.execute(select(Quiz.version).where(Quiz.id == quiz_id))).scalar_one()
+        answer_key = (await get_answer_key(db, quiz_id, quiz_version)).correct_pairs()
+
+    graded = await grade_attempt(db, attempt.id, answer_key)
+    if not graded:
+        await db.rollback()
+        raise HTTPException(status_code=400, detail="Already submitted")
+
+    total_score, submitted_at = graded
     await db.commit()
+    await record_submission(quiz_id, current_user.id, total_score)
+    await bump_generation(quiz_user_namespace(quiz_id, current_user.id))
     return {
         "attempt_id": attempt.id, 
         "score": total_score,
-        "submitted_at": attempt.submitted_at
+        "submitted_at": submitted_at
     }
+
+async def get_live_quiz_id(db: AsyncSession, quiz_id):
+    result = await db.execute(select(Quiz.id).where(Quiz.id == quiz_id, Quiz.deleted_at.is_(None)))
+    if result.scalar_one_or_none() is None:
+        raise HTTPException(status_code=404, detail="Quiz not found")
+
+# 10. 관리자 퀴즈 통계 (응시/제출 수, 평균, 점수 분포)
+@router.get("/{quiz_id}/stats", response_model=QuizStatsResponse)
+async def get_stats(
+    quiz_id: UUID,
+    db: AsyncSession = Depends(get_read_db),
+    current_user: UserPrincipal = Depends(admin_required),
+):
+    await get_live_quiz_id(db, quiz_id)
+    return await get_quiz_stats(db, quiz_id)
+
+# 10-1. 관리자 퀴즈 통계/리더보드를 DB 기준으로 다시 계산
+@router.post("/{quiz_id}/stats/rebuild", response_model=QuizStatsResponse)
+async def rebuild_stats(
+    quiz_id: UUID,
+    db: AsyncSession = Depends(get_db),
+    current_user: UserPrincipal = Depends(admin_required),
+):
+    await get_live_quiz_id(db, quiz_id)
+    await rebuild_quiz_stats(db, quiz_id, reset=True)
+    return await get_quiz_stats(db, quiz_id)
+
+# 11. 퀴즈 리더보드 (상위 limit명과 내 순위)
+@router.get("/{quiz_id}/leaderboard", response_model=QuizLeaderboardResponse)
+async def get_leaderboard(
+    quiz_id: UUID,
+    limit: int = 10,
+    db: AsyncSession = Depends(get_read_db),
+    current_user: UserPrincipal = Depends(get_current_user),
+):
+    if not 1 <= limit <= 100:
+        raise HTTPException(status_code=400, detail="limit must be between 1 and 100")
+    await get_live_quiz_id(db, quiz_id)
+    return await get_quiz_leaderboard(db, quiz_id, current_user.id, limit)
+
+# 12. 관리자 문항 분석 (난이도, 변별도, 선택지별 선택 비율, 기본은 현재 버전)
+@router.get("/{quiz_id}/item-analysis", response_model=QuizItemAnalysisResponse)
+async def get_quiz_item_analysis(
+    quiz_id: UUID,
+    version: Optional[int] = None,
+    db: AsyncSession = Depends(get_read_db),
+    current_user: UserPrincipal = Depends(admin_required),
+):
+    result = await db.execute(select(Quiz.version).where(Quiz.id == quiz_id, Quiz.deleted_at.is_(None)))
+    current_version = result.scalar_one_or_none()
+    if current_version is None:
+        raise HTTPException(status_code=404, detail="Quiz not found")
+    if version is None:
+        version = current_version
+    if not 1 <= version <= current_version:
+        raise HTTPException(status_code=404, detail="Quiz version not found")
+
+    return await get_item_analysis(db, quiz_id, version)
+
+# 13. 관리자 응시 결과 내보내기 (CSV 또는 NDJSON 스트림, 답안 하나가 한 행)
+@router.get("/{quiz_id}/results/export")
+async def export_quiz_results(
+    quiz_id: UUID,
+    format: str = "csv",
+    db: AsyncSession = Depends(get_read_db),
+    current_user: UserPrincipal = Depends(admin_required),
+):
+    if format not in EXPORT_MEDIA_TYPES:
+        raise HTTPException(status_code=400, detail="format must be csv or ndjson")
+    await get_live_quiz_id(db, quiz_id)
+
+    session_factory = await read_session_factory(current_user.id)
+    return StreamingResponse(
+        stream_results(session_factory, quiz_id, format),
+        media_type=EXPORT_MEDIA_TYPES[format],
+        headers={"Content-Disposition": f'attachment; filename="quiz-{quiz_id}-results.{format}"'},
+    )
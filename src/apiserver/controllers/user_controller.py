@@ -2,13 +2,19 @@ from fastapi import Depends, APIRouter, Request
 from sqlalchemy.ext.asyncio import AsyncSession
 from apiserver.db.database import AsyncSessionLocal
 from apiserver.models.user_model import User
-from apiserver.schemas.user_shcema import UserCreate
-from apiserver.utils.auth import hash_password
+from apiserver.schemas.user_shcema import UserCreate, UserPrincipal
+from apiserver.utils.auth import hash_password_async
 from sqlalchemy.future import select
 from apiserver.dependencies.auth import get_current_user, admin_required
+from apiserver.dependencies.db import get_read_db
 from sqlalchemy.orm import class_mapper
 from sqlalchemy import func
 from apiserver.db.redis_client import redis_client
+from apiserver.utils.pagination import decode_cursor, apply_cursor, cursor_page
+from apiserver.cache.l1 import l1_cache
+from apiserver.cache.generation import cache_key, bump_generation, USERS
+from apiserver.config import settings
+from typing import Optional
 import json
 
 router = APIRouter()
@@ -22,41 +28,61 @@ async def get_users(
     request: Request,
     page: int = 1,
     per_page: int = 10,
-    db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(admin_required)
+    cursor: Optional[str] = None,
+    db: AsyncSession = Depends(get_read_db),
+    current_user: UserPrincipal = Depends(admin_required)
 ):
     
-    redis_key = str(request.url.path) + "?" + str(request.url.query)
+    redis_key = await cache_key("users:list?" + str(request.url.query), USERS)
 
-    cached_data = await redis_client.get(redis_key)
-    if cached_data:
-        return json.loads(cached_data)
+    async def load_page():
+        cached_data = await redis_client.get(redis_key)
+        if cached_data:
+            return json.loads(cached_data)
 
-    count_result = await db.execute(
-        select(func.count(User.id))
-    )
-    total = count_result.scalar()
-    offset = (page - 1) * per_page
-    total_pages = round(total/per_page)
+        columns = [column for column in class_mapper(User).columns if column.name != 'password']
 
-    columns = [column for column in class_mapper(User).columns if column.name != 'password']
-    result = await db.execute(
-        select(*columns)
-        .offset(offset)
-        .limit(per_page)
-    )
-    users = [dict(row._mapping) for row in result.all()]
+        if cursor is None:
+            count_result = await db.execute(
+                select(func.count(User.id))
+            )
+            total = count_result.scalar()
+            offset = (page - 1) * per_page
+            total_pages = round(total/per_page)
+
+            result = await db.execute(
+                select(*columns)
+                .order_by(User.created_at, User.id)
+                .offset(offset)
+                .limit(per_page)
+            )
+            users = [dict(row._mapping) for row in result.all()]
+
+            response_data = {
+                "users": users,
+                "total_pages": total_pages,
+                "page": page,
+                "per_page": per_page
+            }
+        else:
+            # 커서 모드: count(*)/OFFSET 없이 (created_at, id) 기준으로 조회
+            position = decode_cursor(cursor)
+            result = await db.execute(apply_cursor(select(*columns), User.created_at, User.id, position, per_page))
+            rows, next_cursor, prev_cursor = cursor_page(
+                result.all(), position, per_page, lambda row: (row.created_at, row.id)
+            )
 
-    response_data = {
-        "users": users,
-        "total_pages": total_pages,
-        "page": page,
-        "per_page": per_page
-    }
+            response_data = {
+                "users": [dict(row._mapping) for row in rows],
+                "per_page": per_page,
+                "next_cursor": next_cursor,
+                "prev_cursor": prev_cursor,
+            }
 
-    await redis_client.set(redis_key, json.dumps(response_data, default=str), ex=60)
+        await redis_client.set(redis_key, json.dumps(response_data, default=str), ex=settings.CACHE_TTL)
+        return response_data
 
-    return response_data
+    return await l1_cache.get_or_load(redis_key, load_page)
 
 @router.post("/users")
 async def post_users(
@@ -66,11 +92,12 @@ async def post_users(
     user = User(
         name = user_data.name,
         email = user_data.email,
-        password = hash_password(user_data.password),
+        password = await hash_password_async(user_data.password),
         is_admin = user_data.is_admin,
     )
     db.add(user)
     await db.commit() 
+    await bump_generation(USERS)
     await db.refresh(user)
 
     return user
\ No newline at end of file
@@ -0,0 +1,143 @@
+# apiserver/src/apiserver/db/migrations.py
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+# 버전별 스키마 마이그레이션
+# tools/create_tables.py(create_all)는 새 DB에만 테이블을 만들고 기존 테이블은 바꾸지 않으므로,
+# 이미 운영 중인 DB의 스키마 변경은 여기에 버전을 하나씩 추가한다. (tools/migrate.py로 실행)
+#
+# - statements: 순서대로 실행되는 SQL (재실행해도 안전하게 IF NOT EXISTS 등을 사용)
+# - indexes: {인덱스 이름: CREATE INDEX CONCURRENTLY ...}
+#   테이블 잠금 없이(online) 만들기 위해 트랜잭션 밖(AUTOCOMMIT)에서 실행한다.
+#   이전에 실패해서 INVALID 상태로 남은 인덱스는 지우고 다시 만든다.
+# 적용된 버전은 schema_migrations 테이블에 기록된다.
+
+MIGRATIONS = [
+    {
+        "version": 1,
+        "description": "indexes for quiz lookups and unique attempt per user/quiz",
+        "indexes": {
+            "ix_questions_quiz_id_created_at_id":
+                "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_questions_quiz_id_created_at_id "
+                "ON questions (quiz_id, created_at, id)",
+            "ix_choices_question_id":
+                "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_choices_question_id ON choices (question_id)",
+            "ix_answers_attempt_id":
+                "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_answers_attempt_id ON answers (attempt_id)",
+            "ix_answers_question_id":
+                "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_answers_question_id ON answers (question_id)",
+            "ix_answers_choice_id":
+                "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_answers_choice_id ON answers (choice_id)",
+            "ix_quiz_attempts_quiz_id":
+                "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_quiz_attempts_quiz_id ON quiz_attempts (quiz_id)",
+            # 기존에 중복 응시가 있으면 실패하므로 먼저 정리해야 한다
+            "uq_quiz_attempts_user_quiz":
+                "CREATE UNIQUE INDEX CONCURRENTLY IF NOT EXISTS uq_quiz_attempts_user_quiz "
+                "ON quiz_attempts (user_id, quiz_id)",
+            "ix_quizzes_created_at_id":
+                "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_quizzes_created_at_id ON quizzes (created_at, id)",
+            "ix_users_created_at_id":
+                "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_users_created_at_id ON users (created_at, id)",
+        },
+    },
+    {
+        "version": 2,
+        "description": "unique answer per attempt/question for answer upsert",
+        "statements": [
+            # 같은 질문에 답안이 여러 개면 가장 최근 것만 남긴다
+            "DELETE FROM answers a USING answers b "
+            "WHERE a.attempt_id = b.attempt_id AND a.question_id = b.question_id "
+            "AND (COALESCE(a.answered_at, '-infinity'), a.id) < (COALESCE(b.answered_at, '-infinity'), b.id)",
+        ],
+        "indexes": {
+            "uq_answers_attempt_question":
+                "CREATE UNIQUE INDEX CONCURRENTLY IF NOT EXISTS uq_answers_attempt_question "
+                "ON answers (attempt_id, question_id)",
+        },
+    },
+    {
+        "version": 3,
+        "description": "immutable quiz content versions pinned by attempts",
+        "statements": [
+            "ALTER TABLE quizzes ADD COLUMN IF NOT EXISTS version integer NOT NULL DEFAULT 1",
+            "ALTER TABLE quiz_attempts ADD COLUMN IF NOT EXISTS quiz_version integer",
+            "ALTER TABLE questions ADD COLUMN IF NOT EXISTS removed_at timestamp",
+            "ALTER TABLE choices ADD COLUMN IF NOT EXISTS removed_at timestamp",
+            "CREATE TABLE IF NOT EXISTS quiz_versions ("
+            "id uuid PRIMARY KEY, "
+            "quiz_id uuid NOT NULL REFERENCES quizzes (id), "
+            "version integer NOT NULL, "
+            "content jsonb NOT NULL, "
+            "created_at timestamp, "
+            "CONSTRAINT uq_quiz_versions_quiz_version UNIQUE (quiz_id, version))",
+            # 기존 퀴즈의 현재 질문/선택지를 버전 1로 기록
+            "INSERT INTO quiz_versions (id, quiz_id, version, content, created_at) "
+            "SELECT gen_random_uuid(), qz.id, qz.version, COALESCE(("
+            "  SELECT jsonb_agg(jsonb_build_object("
+            "    'id', q.id, 'content', q.content, 'correct', q.correct_choice_id, "
+            "    'choices', (SELECT COALESCE(jsonb_agg(jsonb_build_array(c.id, c.content) ORDER BY c.created_at, c.id), '[]') "
+            "                FROM choices c WHERE c.question_id = q.id AND c.removed_at IS NULL)"
+            "  ) ORDER BY q.created_at, q.id) "
+            "  FROM questions q WHERE q.quiz_id = qz.id AND q.removed_at IS NULL"
+            "), '[]'), now() FROM quizzes qz "
+            "ON CONFLICT (quiz_id, version) DO NOTHING",
+        ],
+    },
+    {
+        "version": 4,
+        "description": "soft delete for quizzes with background purge",
+        "statements": [
+            "ALTER TABLE quizzes ADD COLUMN IF NOT EXISTS deleted_at timestamp",
+        ],
+        "indexes": {
+            "ix_quizzes_deleted_at":
+                "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_quizzes_deleted_at "
+                "ON quizzes (deleted_at) WHERE deleted_at IS NOT NULL",
+        },
+    },
+]
+
+# 여러 인스턴스가 동시에 배포되어도 한 곳에서만 실행되도록 advisory lock 사용
+MIGRATION_LOCK_ID = 7_240_531
+
+async def applied_versions(conn):
+    await conn.execute(text(
+        "CREATE TABLE IF NOT EXISTS schema_migrations ("
+        "version integer PRIMARY KEY, "
+        "description text NOT NULL, "
+        "applied_at timestamp NOT NULL DEFAULT now())"
+    ))
+    result = await conn.execute(text("SELECT version FROM schema_migrations"))
+    return set(result.scalars().all())
+
+async def drop_invalid_index(conn, name):
+    result = await conn.execute(text(
+        "SELECT NOT i.indisvalid FROM pg_index i "
+        "JOIN pg_class c ON c.oid = i.indexrelid WHERE c.relname = :name"
+    ), {"name": name})
+    if result.scalar():
+        await conn.execute(text(f'DROP INDEX CONCURRENTLY IF EXISTS "{name}"'))
+
+async def run_migrations(engine: AsyncEngine, log=print):
+    async with engine.connect() as conn:
+        conn = await conn.execution_options(isolation_level="AUTOCOMMIT")
+        await conn.execute(text("SELECT pg_advisory_lock(:id)"), {"id": MIGRATION_LOCK_ID})
+        try:
+            applied = await applied_versions(conn)
+            for migration in MIGRATIONS:
+                if migration["version"] in applied:
+                    continue
+
+                log(f"applying migration {migration['version']}: {migration['description']}")
+                for statement in migration.get("statements", []):
+                    await conn.execute(text(statement))
+                for name, statement in migration.get("indexes", {}).items():
+                    await drop_invalid_index(conn, name)
+                    await conn.execute(text(statement))
+
+                await conn.execute(
+                    text("INSERT INTO schema_migrations (version, description) VALUES (:version, :description)"),
+                    {"version": migration["version"], "description": migration["description"]},
+                )
+        finally:
+            await conn.execute(text("SELECT pg_advisory_unlock(:id)"), {"id": MIGRATION_LOCK_ID})
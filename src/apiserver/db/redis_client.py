@@ -1,4 +1,9 @@
 import redis.asyncio as redis
+from apiserver.config import settings
 
 # Redis 클라이언트 설정
-redis_client = redis.Redis(host="localhost", port=6379, db=0, decode_responses=True)
+redis_client = redis.Redis.from_url(
+    settings.REDIS_URL,
+    max_connections=settings.REDIS_MAX_CONNECTIONS,
+    decode_responses=True,
+)
@@ -0,0 +1,31 @@
+# apiserver/src/apiserver/db/routing.py
+from apiserver.db.redis_client import redis_client
+from apiserver.config import settings
+
+# 복제본 읽기의 read-your-writes 보장
+# 쓰기 직후에는 복제본에 아직 반영되지 않았을 수 있으므로, REPLICA_MAX_LAG_SECONDS 동안 읽기를 primary로 보낸다.
+#   user:{user_id}:primary : 그 사용자가 쓴 직후 (응시 -> foruser 등)
+#   db:primary             : 여러 사용자가 공유하는 캐시(목록, 퀴즈 상세)가 바뀐 직후
+#                            복제본의 이전 데이터로 새 세대의 캐시가 채워지지 않도록 모든 읽기를 primary로 보낸다.
+
+PRIMARY_KEY = "db:primary"
+
+def user_primary_key(user_id):
+    return f"user:{user_id}:primary"
+
+async def mark_written(user_id, pipe=None):
+    if pipe is not None:
+        pipe.set(user_primary_key(user_id), 1, ex=settings.REPLICA_MAX_LAG_SECONDS)
+    else:
+        await redis_client.set(user_primary_key(user_id), 1, ex=settings.REPLICA_MAX_LAG_SECONDS)
+
+async def mark_shared_written(pipe=None):
+    if pipe is not None:
+        pipe.set(PRIMARY_KEY, 1, ex=settings.REPLICA_MAX_LAG_SECONDS)
+    else:
+        await redis_client.set(PRIMARY_KEY, 1, ex=settings.REPLICA_MAX_LAG_SECONDS)
+
+async def should_read_primary(user_id):
+    if not settings.DATABASE_REPLICA_URL:
+        return True
+    return any(await redis_client.mget(PRIMARY_KEY, user_primary_key(user_id)))
@@ -3,12 +3,13 @@
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
 from jose import jwt, JWTError
-from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
 from uuid import UUID
 
-from apiserver.db.database import get_db
+from apiserver.db.database import AsyncSessionLocal
 from apiserver.models.user_model import User
+from apiserver.schemas.user_shcema import UserPrincipal
+from apiserver.cache.principal import get_principal, get_principal_version, set_principal
 from apiserver.config import settings
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/auth/token")
@@ -18,8 +19,7 @@ ALGORITHM = settings.ALGORITHM
 
 async def get_current_user(
     token: str = Depends(oauth2_scheme),
-    db: AsyncSession = Depends(get_db)
-) -> User:
+) -> UserPrincipal:
     credentials_exception = HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
         detail="Could not validate credentials",
@@ -34,17 +34,27 @@ async def get_current_user(
     except (JWTError, ValueError):
         raise credentials_exception
 
-    result = await db.execute(select(User).where(User.id == user_id))
-    user = result.scalar_one_or_none()
+    # 캐시에 있으면 DB 세션을 열지 않음
+    principal = await get_principal(user_id)
+    if principal is not None:
+        return principal
+
+    # DB 조회 중에 무효화가 끼어들면 조회 결과를 캐시하지 않음
+    version = await get_principal_version(user_id)
+    async with AsyncSessionLocal() as db:
+        result = await db.execute(select(User.id, User.is_admin).where(User.id == user_id))
+        user = result.one_or_none()
 
     if user is None:
         raise credentials_exception
 
-    return user
+    principal = UserPrincipal.model_validate(user)
+    await set_principal(principal, version)
+    return principal
 
 async def admin_required(
-    current_user: User = Depends(get_current_user)
-) -> User:
+    current_user: UserPrincipal = Depends(get_current_user)
+) -> UserPrincipal:
     if not current_user.is_admin:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
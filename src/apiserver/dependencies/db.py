@@ -0,0 +1,15 @@
+from fastapi import Depends
+from apiserver.db.database import AsyncSessionLocal, ReplicaSessionLocal
+from apiserver.db.routing import should_read_primary
+from apiserver.schemas.user_shcema import UserPrincipal
+from apiserver.dependencies.auth import get_current_user
+
+# 기본은 복제본, 최근 쓰기가 있으면 primary
+async def read_session_factory(user_id):
+    return AsyncSessionLocal if await should_read_primary(user_id) else ReplicaSessionLocal
+
+# 읽기 전용 엔드포인트용 세션
+async def get_read_db(current_user: UserPrincipal = Depends(get_current_user)):
+    session_factory = await read_session_factory(current_user.id)
+    async with session_factory() as session:
+        yield session
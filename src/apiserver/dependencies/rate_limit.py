@@ -0,0 +1,115 @@
+# apiserver/src/apiserver/dependencies/rate_limit.py
+import math
+from fastapi import Depends, HTTPException, status
+
+from apiserver.db.redis_client import redis_client
+from apiserver.schemas.user_shcema import UserPrincipal
+from apiserver.dependencies.auth import get_current_user
+from apiserver.config import settings
+
+# 쓰기 엔드포인트 요청 제한 (라우트마다 Depends(RouteLimit(...)))
+# 1. 사용자별 토큰 버킷 (Redis, 모든 워커 공유)
+#    초당 rate개씩 최대 burst개까지 토큰이 차고 요청마다 하나를 쓴다. 토큰이 없으면 429 + Retry-After(다음 토큰까지 초).
+#    버킷 계산은 스크립트 하나로 처리하므로 동시에 여러 요청이 와도 토큰을 중복으로 쓰지 않는다.
+# 2. 라우트별 동시 실행 수 (워커 프로세스마다)
+#    커넥션 풀(DB_POOL_SIZE + DB_MAX_OVERFLOW)이 다 차서 다른 엔드포인트까지 DB_POOL_TIMEOUT 동안 기다리기 전에
+#    max_concurrent를 넘는 요청은 기다리지 않고 바로 503 + Retry-After로 거절한다.
+
+def rate_limit_key(route, user_id):
+    return f"ratelimit:{route}:{user_id}"
+
+# KEYS: 버킷 / ARGV: rate(초당 토큰), burst
+# 반환: {허용 여부, 다음 토큰까지 ms}
+# 현재 시각은 Redis 서버 시각을 쓴다. (워커 간 시계 차이와 무관)
+TOKEN_BUCKET_SCRIPT = redis_client.register_script("""
+local rate = tonumber(ARGV[1])
+local burst = tonumber(ARGV[2])
+local time = redis.call('TIME')
+local now = tonumber(time[1]) * 1000 + math.floor(tonumber(time[2]) / 1000)
+
+local bucket = redis.call('HMGET', KEYS[1], 'tokens', 'ts')
+local tokens = tonumber(bucket[1]) or burst
+local ts = tonumber(bucket[2]) or now
+tokens = math.min(burst, tokens + math.max(0, now - ts) * rate / 1000)
+
+local allowed = 0
+local retry_ms = 0
+if tokens >= 1 then
+    tokens = tokens - 1
+    allowed = 1
+else
+    retry_ms = math.ceil((1 - tokens) * 1000 / rate)
+end
+
+redis.call('HSET', KEYS[1], 'tokens', tostring(tokens), 'ts', now)
+-- 가득 찰 때까지 요청이 없으면 버킷을 지운다 (다음 요청은 burst부터 시작)
+redis.call('PEXPIRE', KEYS[1], math.ceil(burst * 1000 / rate) + 1000)
+return {allowed, retry_ms}
+""")
+
+class RouteLimit:
+    def __init__(self, route, rate, burst, max_concurrent):
+        self.route = route
+        self.rate = rate
+        self.burst = burst
+        self.max_concurrent = max_concurrent
+        self.active = 0
+        self.admitted = 0
+        self.rate_limited = 0
+        self.shed = 0
+
+    async def __call__(self, current_user: UserPrincipal = Depends(get_current_user)):
+        if settings.RATE_LIMIT_ENABLED:
+            allowed, retry_ms = await TOKEN_BUCKET_SCRIPT(
+                keys=[rate_limit_key(self.route, current_user.id)],
+                args=[self.rate, self.burst],
+            )
+            if not allowed:
+                self.rate_limited += 1
+                raise HTTPException(
+                    status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+                    detail="Too many requests",
+                    headers={"Retry-After": str(max(1, math.ceil(retry_ms / 1000)))},
+                )
+
+        if self.active >= self.max_concurrent:
+            self.shed += 1
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail="Server is busy",
+                headers={"Retry-After": "1"},
+            )
+
+        self.active += 1
+        self.admitted += 1
+        try:
+            yield
+        finally:
+            self.active -= 1
+
+    def stats(self):
+        return {
+            "rate": self.rate,
+            "burst": self.burst,
+            "max_concurrent": self.max_concurrent,
+            "active": self.active,
+            "admitted": self.admitted,
+            "rate_limited": self.rate_limited,
+            "shed": self.shed,
+        }
+
+answer_limit = RouteLimit(
+    "answer",
+    settings.RATE_LIMIT_ANSWER_RATE,
+    settings.RATE_LIMIT_ANSWER_BURST,
+    settings.MAX_CONCURRENT_ANSWER,
+)
+submit_limit = RouteLimit(
+    "submit",
+    settings.RATE_LIMIT_SUBMIT_RATE,
+    settings.RATE_LIMIT_SUBMIT_BURST,
+    settings.MAX_CONCURRENT_SUBMIT,
+)
+
+def route_limit_stats():
+    return {limit.route: limit.stats() for limit in (answer_limit, submit_limit)}
@@ -1,15 +1,59 @@
+import asyncio
+from contextlib import asynccontextmanager, suppress
 from fastapi import FastAPI
+from sqlalchemy import text
+from apiserver.config import settings
 from apiserver.controllers import user_controller
 from apiserver.controllers import auth_controller
 from apiserver.controllers import quiz_controller
+from apiserver.controllers import metrics_controller
+from apiserver.cache.l1 import listen_for_invalidations
+from apiserver.utils.quiz_purge import purge_deleted_quizzes
+from apiserver.db.database import engine, replica_engine
+from apiserver.db.redis_client import redis_client
 
-app = FastAPI(title="seoyeongje_Quiz")
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # 워커 시작 시 DB/Redis 연결을 미리 열어서 접속 문제를 첫 요청 전에 확인
+    for db_engine in {engine, replica_engine}:
+        async with db_engine.connect() as conn:
+            await conn.execute(text("SELECT 1"))
+    await redis_client.ping()
+
+    # 다른 워커가 보낸 L1 캐시 무효화 메시지 구독
+    background_tasks = [asyncio.create_task(listen_for_invalidations())]
+    # 삭제된 퀴즈의 관련 행 정리 (여러 워커 중 한 곳에서만 실제로 실행)
+    if settings.PURGE_ENABLED:
+        background_tasks.append(asyncio.create_task(purge_deleted_quizzes()))
+    yield
+    for task in background_tasks:
+        task.cancel()
+        with suppress(asyncio.CancelledError):
+            await task
+
+    # 진행 중인 요청이 끝난 뒤(graceful shutdown) 커넥션 풀 정리
+    for db_engine in {engine, replica_engine}:
+        await db_engine.dispose()
+    await redis_client.aclose()
+
+app = FastAPI(title="seoyeongje_Quiz", lifespan=lifespan)
 
 # 라우터 등록
 app.include_router(user_controller.router)
 app.include_router(auth_controller.router)
 app.include_router(quiz_controller.router)
+app.include_router(metrics_controller.router)
 
 def main():
     import uvicorn
-    uvicorn.run("apiserver.main:app", host="127.0.0.1", port=8000, reload=True)
+    uvicorn.run(
+        "apiserver.main:app",
+        host=settings.SERVER_HOST,
+        port=settings.SERVER_PORT,
+        reload=settings.SERVER_RELOAD,
+        workers=None if settings.SERVER_RELOAD else settings.SERVER_WORKERS,
+        loop=settings.SERVER_LOOP,
+        http=settings.SERVER_HTTP,
+        timeout_keep_alive=settings.SERVER_KEEPALIVE_TIMEOUT,
+        timeout_graceful_shutdown=settings.SERVER_GRACEFUL_SHUTDOWN_TIMEOUT,
+    )
@@ -1,5 +1,5 @@
 import uuid
-from sqlalchemy import Column, String, Boolean, Integer, ForeignKey, Text, DateTime
+from sqlalchemy import Column, String, Boolean, Integer, ForeignKey, Text, DateTime, UniqueConstraint
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 from datetime import datetime
@@ -8,11 +8,14 @@ from apiserver.db.base import Base
 
 class Answer(Base):
     __tablename__ = "answers"
+    __table_args__ = (
+        UniqueConstraint("attempt_id", "question_id", name="uq_answers_attempt_question"),
+    )
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
-    attempt_id = Column(UUID(as_uuid=True), ForeignKey("quiz_attempts.id"))
-    question_id = Column(UUID(as_uuid=True), ForeignKey("questions.id"))
-    choice_id = Column(UUID(as_uuid=True), ForeignKey("choices.id"))
+    attempt_id = Column(UUID(as_uuid=True), ForeignKey("quiz_attempts.id"), index=True)
+    question_id = Column(UUID(as_uuid=True), ForeignKey("questions.id"), index=True)
+    choice_id = Column(UUID(as_uuid=True), ForeignKey("choices.id"), index=True)
     is_correct = Column(Boolean, default=False)
     answered_at = Column(DateTime, default=datetime.utcnow)
 
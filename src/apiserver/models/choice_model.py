@@ -11,8 +11,10 @@ class Choice(Base):
     __tablename__ = "choices"
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
-    question_id = Column(UUID(as_uuid=True), ForeignKey("questions.id"))
+    question_id = Column(UUID(as_uuid=True), ForeignKey("questions.id"), index=True)
     content = Column(Text, nullable=False)
     created_at = Column(DateTime, default=datetime.now)
+    # 퀴즈 수정으로 빠진 선택지 (답안과 이전 버전이 참조하므로 지우지 않음)
+    removed_at = Column(DateTime, nullable=True)
 
     question = relationship("Question", back_populates="choices")
\ No newline at end of file
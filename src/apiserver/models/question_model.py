@@ -1,5 +1,5 @@
 import uuid
-from sqlalchemy import Column, String, Boolean, Integer, ForeignKey, Text, DateTime
+from sqlalchemy import Column, String, Boolean, Integer, ForeignKey, Text, DateTime, Index
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 from datetime import datetime
@@ -8,12 +8,17 @@ from apiserver.db.base import Base
 
 class Question(Base):
     __tablename__ = "questions"
+    __table_args__ = (
+        Index("ix_questions_quiz_id_created_at_id", "quiz_id", "created_at", "id"),
+    )
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     quiz_id = Column(UUID(as_uuid=True), ForeignKey("quizzes.id"))
     content = Column(Text, nullable=False)
     correct_choice_id = Column(UUID(as_uuid=True), nullable=True)
     created_at = Column(DateTime, default=datetime.now)
+    # 퀴즈 수정으로 빠진 질문 (답안과 이전 버전이 참조하므로 지우지 않음)
+    removed_at = Column(DateTime, nullable=True)
 
     quiz = relationship("Quiz", back_populates="questions")
     choices = relationship("Choice", back_populates="question")
\ No newline at end of file
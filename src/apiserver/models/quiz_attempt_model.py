@@ -1,5 +1,5 @@
 import uuid
-from sqlalchemy import Column, String, Boolean, Integer, ForeignKey, Text, DateTime
+from sqlalchemy import Column, String, Boolean, Integer, ForeignKey, Text, DateTime, UniqueConstraint
 from sqlalchemy.dialects.postgresql import UUID, JSONB
 from sqlalchemy.orm import relationship
 from datetime import datetime
@@ -9,11 +9,16 @@ from apiserver.db.base import Base
 
 class QuizAttempt(Base):
     __tablename__ = "quiz_attempts"
+    __table_args__ = (
+        UniqueConstraint("user_id", "quiz_id", name="uq_quiz_attempts_user_quiz"),
+    )
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     user_id = Column(UUID(as_uuid=True), ForeignKey("users.id"))
-    quiz_id = Column(UUID(as_uuid=True), ForeignKey("quizzes.id"))
+    quiz_id = Column(UUID(as_uuid=True), ForeignKey("quizzes.id"), index=True)
     questions = Column(JSONB, nullable=True)
+    # 응시 시작 시점의 퀴즈 내용 버전 (이전에 만든 응시는 NULL)
+    quiz_version = Column(Integer, nullable=True)
     started_at = Column(DateTime, default=datetime.now)
     submitted_at = Column(DateTime, nullable=True)
     score = Column(Integer, default=0)
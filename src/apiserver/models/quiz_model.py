@@ -1,5 +1,5 @@
 import uuid
-from sqlalchemy import Column, String, Boolean, Integer, ForeignKey, Text, DateTime
+from sqlalchemy import Column, String, Boolean, Integer, ForeignKey, Text, DateTime, Index, text
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 from datetime import datetime
@@ -8,6 +8,11 @@ from apiserver.db.base import Base
 
 class Quiz(Base):
     __tablename__ = "quizzes"
+    __table_args__ = (
+        Index("ix_quizzes_created_at_id", "created_at", "id"),
+        # 정리 대기 중인 삭제 퀴즈 찾기
+        Index("ix_quizzes_deleted_at", "deleted_at", postgresql_where=text("deleted_at IS NOT NULL")),
+    )
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     title = Column(String, nullable=False)
@@ -15,6 +20,10 @@ class Quiz(Base):
     created_by = Column(UUID(as_uuid=True), nullable=False)
     created_at = Column(DateTime, default=datetime.now)
     updated_at = Column(DateTime, default=datetime.now)
+    # 현재 문제 내용 버전 (quiz_versions.version)
+    version = Column(Integer, nullable=False, default=1, server_default="1")
+    # 삭제 시각 (soft delete). 관련 행은 백그라운드에서 정리되고 마지막에 퀴즈 행도 지워진다
+    deleted_at = Column(DateTime, nullable=True)
 
     questions = relationship("Question", back_populates="quiz")
     attempts = relationship("QuizAttempt", back_populates="quiz")
@@ -0,0 +1,22 @@
+import uuid
+from sqlalchemy import Column, Integer, ForeignKey, DateTime, UniqueConstraint
+from sqlalchemy.dialects.postgresql import UUID, JSONB
+from datetime import datetime
+
+from apiserver.db.base import Base
+
+# 퀴즈 문제 내용의 불변 버전
+# 질문/선택지가 바뀔 때마다 새 버전이 추가되고, 응시(QuizAttempt.quiz_version)는 시작 시점의 버전을 가리킨다.
+# content: [{"id": question_id, "content": str, "correct": choice_id | None,
+#            "choices": [[choice_id, content], ...]}, ...] (표시 순서)
+class QuizVersion(Base):
+    __tablename__ = "quiz_versions"
+    __table_args__ = (
+        UniqueConstraint("quiz_id", "version", name="uq_quiz_versions_quiz_version"),
+    )
+
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    quiz_id = Column(UUID(as_uuid=True), ForeignKey("quizzes.id"), nullable=False)
+    version = Column(Integer, nullable=False)
+    content = Column(JSONB, nullable=False)
+    created_at = Column(DateTime, default=datetime.now)
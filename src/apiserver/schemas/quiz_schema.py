@@ -1,5 +1,5 @@
 from pydantic import BaseModel, Field, field_validator, ValidationError
-from typing import List, Optional
+from typing import Dict, List, Optional, Literal
 from uuid import UUID
 from datetime import datetime
 
@@ -39,6 +39,17 @@ class QuizCreateResponse(BaseModel):
     message: str
 
 
+# POST /import
+class QuizImportError(BaseModel):
+    line: int
+    detail: str
+
+class QuizImportResponse(BaseModel):
+    imported: int
+    failed: int
+    errors: List[QuizImportError]
+
+
 # GET /
 class QuizConfig(BaseModel):
     quiz_id: UUID
@@ -60,7 +71,7 @@ class QuizResponse(BaseModel):
     created_by: UUID
     updated_at: datetime
     config: Optional[QuizConfig]
-    attempted: bool
+    attempted: bool = False
 
     model_config = {
         "from_attributes": True,
@@ -68,22 +79,32 @@ class QuizResponse(BaseModel):
 
 class QuizGetListResponse(BaseModel):
     quizzes: List[QuizResponse]
-    total_pages: int
-    page: int
+    total_pages: Optional[int] = None
+    page: Optional[int] = None
     per_page: int
+    next_cursor: Optional[str] = None
+    prev_cursor: Optional[str] = None
 
     class Config:
         orm_mode = True
 
 
 # PATCH /{quiz_id}
+# id를 보내면 기존 질문/선택지를 수정하고, 없으면 같은 내용의 기존 항목과 짝짓거나 새로 만든다
+class ChoiceUpdate(ChoiceCreate):
+    id: Optional[UUID] = None
+
+class QuestionUpdate(QuestionCreate):
+    id: Optional[UUID] = None
+    choices: List[ChoiceUpdate]
+
 class QuizUpdate(BaseModel):
     title: Optional[str] = None
     description: Optional[str] = None
     num_questions: Optional[int] = None
     shuffle_questions: Optional[bool] = None
     shuffle_choices: Optional[bool] = None
-    questions: Optional[List[QuestionCreate]] = None
+    questions: Optional[List[QuestionUpdate]] = None
 
     @field_validator("questions", mode="after")
     @classmethod
@@ -127,10 +148,13 @@ class QuizGetDetailForStaffResponse(BaseModel):
     created_at: datetime
     updated_at: datetime
     config: QuizConfig
+    version: int
     questions: List[Question]
-    total_pages: int
-    page: int
+    total_pages: Optional[int] = None
+    page: Optional[int] = None
     per_page: int
+    next_cursor: Optional[str] = None
+    prev_cursor: Optional[str] = None
 
     class Config:
         orm_mode = True
@@ -181,6 +205,10 @@ class QuizAnswer(BaseModel):
 
 class QuizAnswerCreate(BaseModel):
     answer: List[QuizAnswer]
+    # replace: answer가 전체 답안 (기존 방식), delta: 바뀐 답안만 보내고 나머지는 유지
+    mode: Literal["replace", "delta"] = "replace"
+    # delta 모드에서 답안을 지울 question_id 목록
+    cleared: List[UUID] = []
 
 class QuizAnswerCreateResponse(BaseModel):
     attempt_id: UUID
@@ -190,4 +218,65 @@ class QuizAnswerCreateResponse(BaseModel):
 class QuizSubmitResponse(BaseModel):
     attempt_id: UUID
     score: int
-    submitted_at: datetime
\ No newline at end of file
+    submitted_at: datetime
+
+
+# GET /{quiz_id}/purge
+class QuizPurgeStatusResponse(BaseModel):
+    # pending: 정리 대기, running: 정리 중, done: 완료
+    status: Literal["pending", "running", "done"]
+    # 현재 지우고 있는 테이블
+    step: Optional[str] = None
+    # 테이블별 삭제한 행 수
+    deleted: Dict[str, int] = {}
+    deleted_at: Optional[datetime] = None
+    started_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
+
+
+# GET /{quiz_id}/stats
+class QuizStatsResponse(BaseModel):
+    attempts: int
+    submissions: int
+    average_score: Optional[float] = None
+    # 점수 -> 제출 인원
+    score_distribution: Dict[int, int] = {}
+
+
+# GET /{quiz_id}/leaderboard
+class QuizLeaderboardEntry(BaseModel):
+    rank: int
+    user_id: UUID
+    score: int
+
+class QuizLeaderboardResponse(BaseModel):
+    entries: List[QuizLeaderboardEntry]
+    # 현재 사용자의 순위/점수 (제출하지 않았으면 None)
+    my_rank: Optional[int] = None
+    my_score: Optional[int] = None
+
+
+# GET /{quiz_id}/item-analysis
+class QuizItemChoiceStats(BaseModel):
+    choice_id: UUID
+    content: str
+    is_correct: bool
+    count: int
+    # 문항에 답한 응시 중 이 선택지를 고른 비율
+    selection_rate: Optional[float] = None
+
+class QuizItemStats(BaseModel):
+    question_id: UUID
+    content: str
+    responses: int
+    # 정답 비율 (p-value)
+    difficulty: Optional[float] = None
+    # 정답 여부와 나머지 점수의 점이연 상관계수
+    discrimination: Optional[float] = None
+    choices: List[QuizItemChoiceStats]
+
+class QuizItemAnalysisResponse(BaseModel):
+    version: int
+    attempts: int
+    answers: int
+    items: List[QuizItemStats]
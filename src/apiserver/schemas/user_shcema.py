@@ -1,4 +1,5 @@
 from pydantic import BaseModel
+from uuid import UUID
 
 class UserCreate(BaseModel):
     name: str
@@ -15,3 +16,11 @@ class UserResponse(BaseModel):
     created_at: str
     updated_at: str
 
+# 인증된 사용자 (get_current_user 반환값, 캐시에 저장되는 필드만 포함)
+class UserPrincipal(BaseModel):
+    id: UUID
+    is_admin: bool
+
+    model_config = {
+        "from_attributes": True,
+    }
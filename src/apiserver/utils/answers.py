@@ -0,0 +1,55 @@
+# apiserver/src/apiserver/utils/answers.py
+import uuid
+from datetime import datetime
+from sqlalchemy import delete, false
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+
+from apiserver.models.answer_model import Answer
+
+# 응시 답안 저장: answers (attempt_id, question_id) 유니크 기준 upsert
+# 선택지가 바뀐 질문만 UPDATE 되므로 자동저장 한 번의 쓰기 양은 바뀐 답안 수에 비례한다.
+
+def upsert_answers_statement(attempt_id, answers):
+    now = datetime.utcnow()
+    stmt = pg_insert(Answer).values([
+        {
+            "id": uuid.uuid4(),
+            "attempt_id": attempt_id,
+            "question_id": question_id,
+            "choice_id": choice_id,
+            "is_correct": False,  # 제출이 아니므로 아직 판단하지 않음
+            "answered_at": now,
+        }
+        for question_id, choice_id in answers.items()
+    ])
+    return stmt.on_conflict_do_update(
+        index_elements=[Answer.attempt_id, Answer.question_id],
+        set_={
+            "choice_id": stmt.excluded.choice_id,
+            "is_correct": false(),
+            "answered_at": stmt.excluded.answered_at,
+        },
+        where=Answer.choice_id.is_distinct_from(stmt.excluded.choice_id),
+    )
+
+# answers: {question_id: choice_id}
+# replace=True 이면 answers에 없는 질문의 답안은 지운다 (전체 저장)
+# cleared: 답안을 지울 question_id 목록 (부분 저장)
+async def save_answers(db, attempt_id, answers, replace=False, cleared=()):
+    if replace:
+        await db.execute(
+            delete(Answer).where(
+                Answer.attempt_id == attempt_id,
+                Answer.question_id.not_in(list(answers)),
+            )
+        )
+    elif cleared:
+        await db.execute(
+            delete(Answer).where(
+                Answer.attempt_id == attempt_id,
+                Answer.question_id.in_(list(cleared)),
+            )
+        )
+
+    if answers:
+        await db.execute(upsert_answers_statement(attempt_id, answers))
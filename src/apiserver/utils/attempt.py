@@ -0,0 +1,101 @@
+# apiserver/src/apiserver/utils/attempt.py
+import json
+import random
+from uuid import UUID
+from sqlalchemy import select, func, cast, literal, Text
+from sqlalchemy.dialects.postgresql import JSONB, JSONPATH
+
+from apiserver.models.answer_model import Answer
+from apiserver.models.quiz_attempt_model import QuizAttempt
+
+# 응시 질문 목록(QuizAttempt.questions JSONB 배열)을 페이지 단위로 다룬다.
+# 전체 배열을 읽지 않고 DB에서 요청한 구간만 잘라 오므로 질문 수와 관계없이 페이지 크기만큼만 전송된다.
+#
+# 배열 항목 형식
+#   compact : {"id": question_id, "choices": [choice_id, ...]}
+#             질문/선택지 순서만 저장하고 내용은 cache/quiz_content.py에서 가져온다.
+#             선택지를 섞지 않는 퀴즈는 "choices"를 생략한다. (기본 순서)
+#   snapshot: {"id", "content", "correct_choice_id", "choices": [{"id", "question_id", "content"}]}
+#             이전 버전에서 저장된 응시. 읽기만 지원한다.
+
+def is_snapshot_question(question):
+    return "content" in question
+
+def compact_question(question_id, choice_ids=None):
+    question = {"id": str(question_id)}
+    if choice_ids is not None:
+        question["choices"] = [str(choice_id) for choice_id in choice_ids]
+    return question
+
+# 새 응시의 질문 목록 (compact 형식)
+# 퀴즈 내용 캐시의 질문 id 목록에서 num_questions개만 고르고, 고른 질문의 선택지만 섞는다.
+# 문제 은행 크기와 관계없이 num_questions에 비례하는 비용이 든다.
+def sample_attempt_questions(content, num_questions, shuffle_questions, shuffle_choices):
+    question_ids = content.question_ids()
+    if shuffle_questions:
+        question_ids = random.sample(question_ids, min(num_questions, len(question_ids)))
+    else:
+        question_ids = question_ids[:num_questions]
+
+    questions = []
+    for question_id in question_ids:
+        if shuffle_choices:
+            choice_ids = content.choice_ids(question_id)
+            questions.append(compact_question(question_id, random.sample(choice_ids, len(choice_ids))))
+        else:
+            questions.append(compact_question(question_id))
+    return questions
+
+# 응시 질문들을 {"id", "content", "choices": [{"id", "content"}]} 목록으로 만든다.
+# content(QuizContent)는 compact 항목이 있을 때만 필요하다. 퀴즈에서 삭제된 질문은 건너뛴다.
+def render_attempt_questions(questions, content=None):
+    rendered = []
+    for question in questions:
+        if is_snapshot_question(question):
+            rendered.append({
+                "id": question["id"],
+                "content": question["content"],
+                "choices": [
+                    {"id": choice["id"], "content": choice["content"]}
+                    for choice in question["choices"]
+                ],
+            })
+        else:
+            question = content.render_question(question["id"], question.get("choices"))
+            if question is not None:
+                rendered.append(question)
+    return rendered
+
+# jsonpath 범위 밖의 인덱스는 lax 모드에서 무시되므로 마지막 페이지도 그대로 잘린다
+QUESTION_PAGE_PATH = "$[$start to $end]"
+
+def attempt_page_statement(user_id, quiz_id, offset, limit):
+    return (
+        select(
+            QuizAttempt.id,
+            QuizAttempt.quiz_version,
+            func.jsonb_array_length(QuizAttempt.questions),
+            func.jsonb_path_query_array(
+                QuizAttempt.questions,
+                cast(literal(QUESTION_PAGE_PATH, Text), JSONPATH),
+                cast(literal(json.dumps({"start": offset, "end": offset + limit - 1}), Text), JSONB),
+            ),
+        )
+        .where(QuizAttempt.user_id == user_id)
+        .where(QuizAttempt.quiz_id == quiz_id)
+    )
+
+# (attempt_id, quiz_version, 전체 질문 수, 페이지 질문 목록) 또는 None
+async def load_attempt_page(db, user_id, quiz_id, offset, limit):
+    result = await db.execute(attempt_page_statement(user_id, quiz_id, offset, limit))
+    return result.one_or_none()
+
+# 주어진 질문들에 대해 선택한 choice_id 집합 (문자열)
+async def selected_choice_ids(db, attempt_id, question_ids):
+    result = await db.execute(
+        select(Answer.choice_id).where(
+            Answer.attempt_id == attempt_id,
+            Answer.question_id.in_([UUID(str(question_id)) for question_id in question_ids]),
+        )
+    )
+    return {str(choice_id) for choice_id in result.scalars()}
@@ -1,4 +1,8 @@
 # apiserver/src/apiserver/utils/auth.py
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+from fastapi import HTTPException, status
 from passlib.context import CryptContext
 from datetime import datetime, timedelta
 from jose import jwt
@@ -13,6 +17,70 @@ def verify_password(plain_password, hashed_password):
 def hash_password(password):
     return pwd_context.hash(password)
 
+# bcrypt는 호출당 수백 ms가 걸리므로 이벤트 루프가 아닌 전용 스레드 풀에서 실행한다.
+# 동시 실행 수는 세마포어로 제한하고, 대기열이 가득 차면 503으로 거절한다.
+_hash_executor = ThreadPoolExecutor(
+    max_workers=settings.PASSWORD_HASH_WORKERS,
+    thread_name_prefix="password-hash",
+)
+_hash_slots = asyncio.Semaphore(settings.PASSWORD_HASH_CONCURRENCY)
+
+_hash_stats = {
+    "queued": 0,
+    "active": 0,
+    "completed": 0,
+    "rejected": 0,
+    "wait_seconds_total": 0.0,
+    "run_seconds_total": 0.0,
+}
+
+async def _run_in_hash_pool(func, *args):
+    if _hash_stats["queued"] >= settings.PASSWORD_HASH_MAX_QUEUE:
+        _hash_stats["rejected"] += 1
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Too many authentication requests",
+            headers={"Retry-After": "1"},
+        )
+
+    queued_at = time.perf_counter()
+    _hash_stats["queued"] += 1
+    try:
+        await _hash_slots.acquire()
+    finally:
+        _hash_stats["queued"] -= 1
+
+    started_at = time.perf_counter()
+    _hash_stats["wait_seconds_total"] += started_at - queued_at
+    _hash_stats["active"] += 1
+    try:
+        return await asyncio.get_running_loop().run_in_executor(_hash_executor, func, *args)
+    finally:
+        _hash_stats["active"] -= 1
+        _hash_stats["completed"] += 1
+        _hash_stats["run_seconds_total"] += time.perf_counter() - started_at
+        _hash_slots.release()
+
+async def verify_password_async(plain_password, hashed_password):
+    return await _run_in_hash_pool(verify_password, plain_password, hashed_password)
+
+async def hash_password_async(password):
+    return await _run_in_hash_pool(hash_password, password)
+
+def password_hash_stats():
+    completed = _hash_stats["completed"]
+    return {
+        "workers": settings.PASSWORD_HASH_WORKERS,
+        "concurrency": settings.PASSWORD_HASH_CONCURRENCY,
+        "max_queue": settings.PASSWORD_HASH_MAX_QUEUE,
+        "queued": _hash_stats["queued"],
+        "active": _hash_stats["active"],
+        "completed": completed,
+        "rejected": _hash_stats["rejected"],
+        "avg_wait_ms": _hash_stats["wait_seconds_total"] / completed * 1000 if completed else 0.0,
+        "avg_run_ms": _hash_stats["run_seconds_total"] / completed * 1000 if completed else 0.0,
+    }
+
 def create_access_token(data: dict, expires_delta: timedelta = None):
     to_encode = data.copy()
     if expires_delta:
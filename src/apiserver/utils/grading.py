@@ -0,0 +1,51 @@
+# apiserver/src/apiserver/utils/grading.py
+from datetime import datetime
+from uuid import UUID
+from sqlalchemy import update, select, func, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from apiserver.models.quiz_attempt_model import QuizAttempt
+from apiserver.models.answer_model import Answer
+
+# 응시 시점에 QuizAttempt.questions에 스냅샷된 정답 -> {question_id: correct_choice_id}
+# 스냅샷 형식으로 저장된 응시만 정답을 가지고 있다 (compact 형식은 None -> 정답표 캐시 사용)
+def answer_key_from_snapshot(questions):
+    if not questions or not all("correct_choice_id" in question for question in questions):
+        return None
+    return {
+        UUID(question["id"]): UUID(question["correct_choice_id"])
+        for question in questions
+        if question.get("correct_choice_id")
+    }
+
+def is_correct_expression(answer_key):
+    return tuple_(Answer.question_id, Answer.choice_id).in_(list(answer_key.items()))
+
+# 응시 하나의 모든 답안 채점(Answer.is_correct)과 점수/제출시각 저장을 한 문장으로 처리한다.
+# answer_key: {question_id: correct_choice_id}
+def grade_attempt_statement(attempt_id, answer_key, submitted_at):
+    graded = (
+        update(Answer)
+        .where(Answer.attempt_id == attempt_id)
+        .values(is_correct=is_correct_expression(answer_key))
+        .returning(Answer.is_correct)
+        .cte("graded")
+    )
+    score = (
+        select(func.count())
+        .select_from(graded)
+        .where(graded.c.is_correct)
+        .scalar_subquery()
+    )
+    return (
+        update(QuizAttempt)
+        .where(QuizAttempt.id == attempt_id, QuizAttempt.submitted_at.is_(None))
+        .values(score=score, submitted_at=submitted_at)
+        .returning(QuizAttempt.score, QuizAttempt.submitted_at)
+        .execution_options(synchronize_session=False)
+    )
+
+# 이미 제출된 응시라면 None을 반환한다 (호출자가 rollback).
+async def grade_attempt(db: AsyncSession, attempt_id, answer_key):
+    result = await db.execute(grade_attempt_statement(attempt_id, answer_key, datetime.now()))
+    return result.one_or_none()
@@ -0,0 +1,157 @@
+# apiserver/src/apiserver/utils/item_analysis.py
+import numpy as np
+from itertools import chain
+from sqlalchemy import select, func, cast, literal, Text
+from sqlalchemy.dialects.postgresql import ARRAY, UUID as PG_UUID
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from apiserver.models.quiz_attempt_model import QuizAttempt
+from apiserver.models.answer_model import Answer
+
+# 문항 분석 (퀴즈 버전 하나의 제출된 응시 기준)
+# - 난이도(p-value): 문항에 답한 응시 중 정답 비율
+# - 변별도: 문항 정답 여부(0/1)와 나머지 문항 점수(총점 - 해당 문항) 사이의 점이연 상관계수
+# - 선택지별 선택 비율 (오답 선택지의 매력도)
+# 답안은 응시별 선택지 번호 배열로 청크 단위 스트리밍해서 (응시, 문항, 선택지) int32 열 배열로 모으고,
+# 통계는 np.bincount로 모든 문항을 한 번에 계산한다. (답안 객체를 만들거나 행마다 반복하지 않음)
+# 정답 여부는 버전 내용의 정답과 비교해서 계산하므로 Answer.is_correct에 의존하지 않는다.
+
+# 한 번에 가져오는 응시 수
+ATTEMPT_CHUNK_SIZE = 1000
+
+# uuid[] 값 (EXPLAIN 확인에서 literal_binds로 렌더링할 수 있도록 텍스트를 캐스팅)
+def uuid_array(ids):
+    return cast(literal("{" + ",".join(str(i) for i in ids) + "}", Text), ARRAY(PG_UUID(as_uuid=True)))
+
+# (id, position) 테이블, position은 1부터
+def numbered(ids, name):
+    return func.unnest(uuid_array(ids)).table_valued("id", with_ordinality="position").render_derived(name=name)
+
+# 제출된 응시마다 한 행: 답한 선택지 번호(버전 내용의 순서, 0부터) 배열
+# UUID 대신 정수 배열만 전송하므로 행/객체 수가 답안 수가 아니라 응시 수만큼만 생긴다. (문항 번호는 선택지 번호로 알 수 있음)
+# 버전 이전에 만든 응시(quiz_version NULL)는 버전 1로 본다. 이 버전에 없는 선택지의 답안은 제외된다.
+def answer_rows_statement(quiz_id, version, choice_ids):
+    choices = numbered(choice_ids, "choice_numbers")
+    return (
+        select(func.array_agg(choices.c.position - 1))
+        .select_from(Answer)
+        .join(QuizAttempt, QuizAttempt.id == Answer.attempt_id)
+        .join(choices, choices.c.id == Answer.choice_id)
+        .where(
+            QuizAttempt.quiz_id == quiz_id,
+            QuizAttempt.submitted_at.is_not(None),
+            func.coalesce(QuizAttempt.quiz_version, 1) == version,
+        )
+        .group_by(Answer.attempt_id)
+    )
+
+class AnswerColumns:
+    def __init__(self, content):
+        # 버전 내용의 질문/선택지 순서대로 번호를 매긴다
+        self.question_ids = content.question_ids()
+        self.choice_ids = []
+        choice_question = []
+        correct_choice = []
+        for i, question_id in enumerate(self.question_ids):
+            question = content.questions[question_id]
+            correct = -1
+            for choice_id, _ in question["choices"]:
+                if choice_id == question["correct"]:
+                    correct = len(self.choice_ids)
+                self.choice_ids.append(choice_id)
+                choice_question.append(i)
+            correct_choice.append(correct)
+        self.choice_question = np.array(choice_question, dtype=np.int32)
+        self.correct_choice = np.array(correct_choice, dtype=np.int32)
+        self.num_attempts = 0
+        self._chunks = []
+
+    def add_rows(self, rows):
+        lengths = np.fromiter((len(row[0]) for row in rows), dtype=np.int64, count=len(rows))
+        choices = np.fromiter(
+            chain.from_iterable(row[0] for row in rows), dtype=np.int32, count=int(lengths.sum())
+        )
+        attempts = np.repeat(
+            np.arange(self.num_attempts, self.num_attempts + len(rows), dtype=np.int32), lengths
+        )
+        self.num_attempts += len(rows)
+        self._chunks.append((attempts, choices))
+
+    # (응시 번호, 문항 번호, 선택지 번호) 열 배열
+    def arrays(self):
+        if not self._chunks:
+            empty = np.empty(0, dtype=np.int32)
+            return empty, empty, empty
+        attempts = np.concatenate([attempts for attempts, _ in self._chunks])
+        choices = np.concatenate([choices for _, choices in self._chunks])
+        return attempts, self.choice_question[choices], choices
+
+async def load_answer_columns(db: AsyncSession, quiz_id, version, content) -> AnswerColumns:
+    columns = AnswerColumns(content)
+    statement = answer_rows_statement(quiz_id, version, columns.choice_ids)
+    result = await db.stream(statement.execution_options(yield_per=ATTEMPT_CHUNK_SIZE))
+    async for rows in result.partitions():
+        columns.add_rows(rows)
+    return columns
+
+def ratio(numerator, denominator):
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return np.where(denominator > 0, numerator / np.maximum(denominator, 1), np.nan)
+
+def optional_float(value):
+    return None if np.isnan(value) else round(float(value), 4)
+
+def compute_item_analysis(columns: AnswerColumns, content):
+    attempts, questions, choices = columns.arrays()
+    num_questions = len(columns.question_ids)
+    num_choices = len(columns.choice_ids)
+    num_attempts = columns.num_attempts
+
+    correct = (choices == columns.correct_choice[questions]).astype(np.float64)
+    total = np.bincount(attempts, weights=correct, minlength=num_attempts)
+    # 해당 문항을 뺀 나머지 점수 (문항 자신이 상관계수를 부풀리지 않도록)
+    rest = total[attempts] - correct
+
+    responses = np.bincount(questions, minlength=num_questions).astype(np.float64)
+    sum_x = np.bincount(questions, weights=correct, minlength=num_questions)
+    sum_y = np.bincount(questions, weights=rest, minlength=num_questions)
+    sum_yy = np.bincount(questions, weights=rest * rest, minlength=num_questions)
+    sum_xy = np.bincount(questions, weights=correct * rest, minlength=num_questions)
+
+    difficulty = ratio(sum_x, responses)
+    mean_y = ratio(sum_y, responses)
+    covariance = ratio(sum_xy, responses) - difficulty * mean_y
+    variance = difficulty * (1 - difficulty) * (ratio(sum_yy, responses) - mean_y * mean_y)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        discrimination = np.where(variance > 0, covariance / np.sqrt(np.maximum(variance, 0)), np.nan)
+
+    choice_counts = np.bincount(choices, minlength=num_choices)
+    selection_rate = ratio(choice_counts, responses[columns.choice_question])
+
+    items = []
+    for i, question_id in enumerate(columns.question_ids):
+        question = content.questions[question_id]
+        choice_numbers = np.flatnonzero(columns.choice_question == i)
+        items.append({
+            "question_id": question_id,
+            "content": question["content"],
+            "responses": int(responses[i]),
+            "difficulty": optional_float(difficulty[i]),
+            "discrimination": optional_float(discrimination[i]),
+            "choices": [
+                {
+                    "choice_id": columns.choice_ids[c],
+                    "content": choice_content,
+                    "is_correct": columns.choice_ids[c] == question["correct"],
+                    "count": int(choice_counts[c]),
+                    "selection_rate": optional_float(selection_rate[c]),
+                }
+                for c, (_, choice_content) in zip(choice_numbers, question["choices"])
+            ],
+        })
+
+    return {
+        "attempts": num_attempts,
+        "answers": int(len(attempts)),
+        "items": items,
+    }
@@ -0,0 +1,39 @@
+# apiserver/src/apiserver/utils/ndjson.py
+
+# 요청 본문 스트림을 줄 단위로 나눈다. 한 줄 이상을 버퍼에 들고 있지 않으므로
+# 업로드 크기와 무관하게 메모리 사용량이 일정하다.
+# (줄 번호, bytes) 를 반환하며, max_line_bytes를 넘는 줄은 bytes 대신 None을 반환한다.
+async def iter_ndjson_lines(stream, max_line_bytes):
+    buffer = bytearray()
+    line_no = 0
+    overflow = False
+
+    async for chunk in stream:
+        start = 0
+        while True:
+            end = chunk.find(b"\n", start)
+            if end == -1:
+                break
+            line_no += 1
+            if overflow or len(buffer) + end - start > max_line_bytes:
+                yield line_no, None
+            else:
+                buffer += chunk[start:end]
+                if buffer.strip():
+                    yield line_no, bytes(buffer)
+            buffer.clear()
+            overflow = False
+            start = end + 1
+
+        if not overflow:
+            buffer += chunk[start:]
+            if len(buffer) > max_line_bytes:
+                # 줄이 끝날 때까지 나머지는 버린다
+                overflow = True
+                buffer.clear()
+
+    line_no += 1
+    if overflow:
+        yield line_no, None
+    elif buffer.strip():
+        yield line_no, bytes(buffer)
@@ -0,0 +1,58 @@
+# apiserver/src/apiserver/utils/pagination.py
+import base64
+import json
+from datetime import datetime
+from uuid import UUID
+from fastapi import HTTPException
+from sqlalchemy import tuple_
+
+# 커서(keyset) 페이지네이션: (created_at, id) 순서로 정렬하고 커서 위치 다음 행부터 per_page + 1개를 읽는다.
+# OFFSET/count(*)가 없으므로 몇 번째 페이지든 비용이 첫 페이지와 같다.
+# 커서는 [created_at, id, 방향("next"/"prev")]를 base64로 인코딩한 불투명 토큰이다.
+# cursor="" 는 커서 모드의 첫 페이지를 의미한다.
+
+def encode_cursor(created_at: datetime, id: UUID, direction: str):
+    raw = json.dumps([created_at.isoformat(), str(id), direction])
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+def decode_cursor(cursor: str):
+    if not cursor:
+        return None
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        # 클라이언트가 보낸 값이므로 형식을 모두 확인한다 (문자열 3개짜리 리스트)
+        position = json.loads(raw)
+        if not isinstance(position, list) or len(position) != 3 or not all(isinstance(value, str) for value in position):
+            raise ValueError(position)
+        created_at, id, direction = position
+        if direction not in ("next", "prev"):
+            raise ValueError(direction)
+        return datetime.fromisoformat(created_at), UUID(id), direction
+    except (ValueError, TypeError, KeyError, AttributeError):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+def apply_cursor(stmt, created_at_column, id_column, position, per_page):
+    key = tuple_(created_at_column, id_column)
+    if position and position[2] == "prev":
+        stmt = stmt.where(key < (position[0], position[1])).order_by(created_at_column.desc(), id_column.desc())
+    else:
+        if position:
+            stmt = stmt.where(key > (position[0], position[1]))
+        stmt = stmt.order_by(created_at_column, id_column)
+    return stmt.limit(per_page + 1)
+
+# rows: apply_cursor로 조회한 결과, key: row -> (created_at, id)
+def cursor_page(rows, position, per_page, key):
+    rows = list(rows)
+    has_more = len(rows) > per_page
+    rows = rows[:per_page]
+
+    if position and position[2] == "prev":
+        rows.reverse()
+        has_next, has_prev = True, has_more
+    else:
+        has_next, has_prev = has_more, position is not None
+
+    next_cursor = encode_cursor(*key(rows[-1]), "next") if rows and has_next else None
+    prev_cursor = encode_cursor(*key(rows[0]), "prev") if rows and has_prev else None
+    return rows, next_cursor, prev_cursor
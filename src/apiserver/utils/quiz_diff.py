@@ -0,0 +1,167 @@
+# apiserver/src/apiserver/utils/quiz_diff.py
+import uuid
+from datetime import datetime, timedelta
+from sqlalchemy import select, update, insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from apiserver.models.question_model import Question
+from apiserver.models.choice_model import Choice
+
+# 퀴즈 수정(PATCH questions)을 현재 질문/선택지와 비교해서 바뀐 행만 쓴다.
+# - 질문/선택지는 id로, id가 없으면 같은 내용(content)으로 기존 행과 짝을 짓는다.
+# - 짝이 있으면 내용/정답이 바뀐 경우에만 UPDATE, 없으면 INSERT
+# - 요청에서 빠진 행은 removed_at만 기록한다. (답안과 이전 버전이 id를 참조하므로 지우지 않음)
+# - 표시 순서는 (created_at, id)이므로 요청 순서와 다를 때만 created_at을 다시 매긴다.
+# 결과의 content는 새 quiz_versions.content가 된다.
+
+class QuestionDiff:
+    def __init__(self):
+        self.question_inserts = []
+        self.question_updates = []
+        self.choice_inserts = []
+        self.choice_updates = []
+        self.removed_question_ids = []
+        self.removed_choice_ids = []
+        self.content = []
+
+    @property
+    def changed(self):
+        return any((
+            self.question_inserts, self.question_updates,
+            self.choice_inserts, self.choice_updates,
+            self.removed_question_ids, self.removed_choice_ids,
+        ))
+
+# 현재(삭제되지 않은) 질문/선택지: [{"id", "content", "correct_choice_id", "created_at", "choices": [{"id", "content", "created_at"}]}]
+async def load_live_questions(db: AsyncSession, quiz_id):
+    result = await db.execute(
+        select(Question.id, Question.content, Question.correct_choice_id, Question.created_at)
+        .where(Question.quiz_id == quiz_id, Question.removed_at.is_(None))
+        .order_by(Question.created_at, Question.id)
+    )
+    questions = {
+        question_id: {"id": question_id, "content": content, "correct_choice_id": correct, "created_at": created_at, "choices": []}
+        for question_id, content, correct, created_at in result.all()
+    }
+    if questions:
+        result = await db.execute(
+            select(Choice.id, Choice.question_id, Choice.content, Choice.created_at)
+            .where(Choice.question_id.in_(list(questions)), Choice.removed_at.is_(None))
+            .order_by(Choice.created_at, Choice.id)
+        )
+        for choice_id, question_id, content, created_at in result.all():
+            questions[question_id]["choices"].append({"id": choice_id, "content": content, "created_at": created_at})
+    return list(questions.values())
+
+# 요청 항목(id 속성이 있을 수 있음)을 기존 행과 짝짓는다: id 우선, 그다음 같은 내용
+def match_rows(live_rows, items, kind):
+    live_by_id = {row["id"]: row for row in live_rows}
+    matched = [None] * len(items)
+    used = set()
+
+    for i, item in enumerate(items):
+        if item.id is None:
+            continue
+        row = live_by_id.get(item.id)
+        if row is None or item.id in used:
+            raise ValueError(f"Unknown {kind} id: {item.id}")
+        matched[i] = row
+        used.add(item.id)
+
+    by_content = {}
+    for row in live_rows:
+        if row["id"] not in used:
+            by_content.setdefault(row["content"], []).append(row)
+    for i, item in enumerate(items):
+        if matched[i] is None and item.id is None and by_content.get(item.content):
+            row = by_content[item.content].pop(0)
+            matched[i] = row
+            used.add(row["id"])
+
+    removed = [row["id"] for row in live_rows if row["id"] not in used]
+    return matched, removed
+
+# 요청 순서대로 정렬되도록 created_at 목록을 정한다 (이미 순서대로면 기존 값 유지)
+def ordered_created_at(matched, now):
+    current = [row["created_at"] if row else None for row in matched]
+    existing = [created_at for created_at in current if created_at is not None]
+    in_order = all(a < b for a, b in zip(existing, existing[1:]))
+    # 새 행(None)이 모두 기존 행 뒤에 있어야 now 이후 시각으로 순서가 유지된다
+    new_at_end = None not in current[:len(existing)]
+    if in_order and new_at_end:
+        return [created_at or now + timedelta(microseconds=i) for i, created_at in enumerate(current)]
+    return [now + timedelta(microseconds=i) for i in range(len(matched))]
+
+def diff_questions(quiz_id, live_questions, questions_data, now=None):
+    now = now or datetime.now()
+    diff = QuestionDiff()
+
+    matched_questions, diff.removed_question_ids = match_rows(live_questions, questions_data, "question")
+    question_created_at = ordered_created_at(matched_questions, now)
+
+    for question_data, live, created_at in zip(questions_data, matched_questions, question_created_at):
+        question_id = live["id"] if live else uuid.uuid4()
+        live_choices = live["choices"] if live else []
+
+        matched_choices, removed_choice_ids = match_rows(live_choices, question_data.choices, "choice")
+        diff.removed_choice_ids.extend(removed_choice_ids)
+        choice_created_at = ordered_created_at(matched_choices, now)
+
+        correct_choice_id = None
+        content_choices = []
+        for choice_data, live_choice, choice_at in zip(question_data.choices, matched_choices, choice_created_at):
+            if live_choice is None:
+                choice_id = uuid.uuid4()
+                diff.choice_inserts.append({
+                    "id": choice_id,
+                    "question_id": question_id,
+                    "content": choice_data.content,
+                    "created_at": choice_at,
+                })
+            else:
+                choice_id = live_choice["id"]
+                if (live_choice["content"], live_choice["created_at"]) != (choice_data.content, choice_at):
+                    diff.choice_updates.append({"id": choice_id, "content": choice_data.content, "created_at": choice_at})
+            if choice_data.is_correct:
+                correct_choice_id = choice_id
+            content_choices.append([str(choice_id), choice_data.content])
+
+        row = {
+            "id": question_id,
+            "content": question_data.content,
+            "correct_choice_id": correct_choice_id,
+            "created_at": created_at,
+        }
+        if live is None:
+            diff.question_inserts.append(dict(row, quiz_id=quiz_id))
+        elif (live["content"], live["correct_choice_id"], live["created_at"]) != (row["content"], row["correct_choice_id"], row["created_at"]):
+            diff.question_updates.append(row)
+
+        diff.content.append({
+            "id": str(question_id),
+            "content": question_data.content,
+            "correct": str(correct_choice_id) if correct_choice_id else None,
+            "choices": content_choices,
+        })
+
+    return diff
+
+async def apply_question_diff(db: AsyncSession, diff: QuestionDiff, now=None):
+    now = now or datetime.now()
+    if diff.removed_question_ids:
+        await db.execute(
+            update(Question).where(Question.id.in_(diff.removed_question_ids)).values(removed_at=now)
+        )
+    if diff.removed_choice_ids:
+        await db.execute(
+            update(Choice).where(Choice.id.in_(diff.removed_choice_ids)).values(removed_at=now)
+        )
+    # 선택지가 질문을 FK로 참조하므로 질문 -> 선택지 순서로 저장
+    if diff.question_inserts:
+        await db.execute(insert(Question), diff.question_inserts)
+    if diff.question_updates:
+        await db.execute(update(Question), diff.question_updates)
+    if diff.choice_inserts:
+        await db.execute(insert(Choice), diff.choice_inserts)
+    if diff.choice_updates:
+        await db.execute(update(Choice), diff.choice_updates)
@@ -0,0 +1,180 @@
+# apiserver/src/apiserver/utils/quiz_purge.py
+import asyncio
+import logging
+import secrets
+from contextlib import suppress
+from datetime import datetime
+from sqlalchemy import select, delete
+
+from apiserver.db.database import AsyncSessionLocal
+from apiserver.db.redis_client import redis_client
+from apiserver.cache.quiz_stats import drop_quiz_stats
+from apiserver.models.quiz_model import Quiz
+from apiserver.models.quiz_config_model import QuizConfig
+from apiserver.models.quiz_version_model import QuizVersion
+from apiserver.models.question_model import Question
+from apiserver.models.choice_model import Choice
+from apiserver.models.quiz_attempt_model import QuizAttempt
+from apiserver.models.answer_model import Answer
+from apiserver.config import settings
+
+# 삭제된 퀴즈(deleted_at)의 관련 행을 백그라운드에서 나눠서 지운다.
+# - delete_quiz는 deleted_at만 기록하고 바로 응답한다. (목록/상세/응시에서는 이때부터 보이지 않음)
+# - FK 순서(답안 -> 응시 -> 선택지 -> 질문 -> 버전 -> 설정)대로 PURGE_BATCH_SIZE 행씩 지우고 마지막에 퀴즈 행을 지운다.
+#   배치마다 커밋해서 잠금을 짧게 유지하고, 배치 사이에 PURGE_BATCH_PAUSE초 쉬어서 다른 요청에 DB를 양보한다.
+# - 여러 워커 중 Redis 잠금(PURGE_LOCK_KEY)을 얻은 한 곳에서만 실행한다.
+#   잠금 값은 실행마다 만든 토큰이고, 연장/해제는 토큰이 같을 때만 한다. (만료 후 다른 워커가 얻은 잠금을 건드리지 않음)
+#   연장에 실패하면(잠금을 잃었으면) 바로 정리를 멈춘다.
+# - 중간에 실패하거나 재시작되어도 다음 실행에서 남은 행부터 다시 지운다.
+# - 진행 상황은 Redis 해시(purge_status_key)에 단계와 테이블별 삭제 행 수로 남긴다. (GET /quizzes/{quiz_id}/purge)
+
+logger = logging.getLogger(__name__)
+
+PURGE_LOCK_KEY = "purge:lock"
+# 배치 하나가 끝날 때마다 연장
+PURGE_LOCK_TTL = 60
+
+# KEYS: 잠금 / ARGV: 토큰, TTL ms
+EXTEND_LOCK_SCRIPT = redis_client.register_script("""
+if redis.call('GET', KEYS[1]) == ARGV[1] then
+    return redis.call('PEXPIRE', KEYS[1], ARGV[2])
+end
+return 0
+""")
+
+# KEYS: 잠금 / ARGV: 토큰
+RELEASE_LOCK_SCRIPT = redis_client.register_script("""
+if redis.call('GET', KEYS[1]) == ARGV[1] then
+    return redis.call('DEL', KEYS[1])
+end
+return 0
+""")
+
+class PurgeLockLost(Exception):
+    pass
+
+async def extend_purge_lock(token):
+    if not await EXTEND_LOCK_SCRIPT(keys=[PURGE_LOCK_KEY], args=[token, PURGE_LOCK_TTL * 1000]):
+        raise PurgeLockLost()
+
+# 같은 워커에서 퀴즈가 삭제되면 확인 주기를 기다리지 않고 바로 정리 시작
+purge_wakeup = asyncio.Event()
+
+def purge_status_key(quiz_id):
+    return f"purge:quiz:{quiz_id}"
+
+# (테이블 이름, 모델, 지울 행 id를 고르는 select)
+def purge_steps(quiz_id):
+    question_ids = select(Question.id).where(Question.quiz_id == quiz_id)
+    attempt_ids = select(QuizAttempt.id).where(QuizAttempt.quiz_id == quiz_id)
+    return [
+        ("answers", Answer, select(Answer.id).where(Answer.question_id.in_(question_ids))),
+        ("answers", Answer, select(Answer.id).where(Answer.attempt_id.in_(attempt_ids))),
+        ("quiz_attempts", QuizAttempt, attempt_ids),
+        ("choices", Choice, select(Choice.id).where(Choice.question_id.in_(question_ids))),
+        ("questions", Question, question_ids),
+        ("quiz_versions", QuizVersion, select(QuizVersion.id).where(QuizVersion.quiz_id == quiz_id)),
+        ("quiz_configs", QuizConfig, select(QuizConfig.id).where(QuizConfig.quiz_id == quiz_id)),
+    ]
+
+def purge_batch_statement(model, ids, batch_size):
+    return delete(model).where(model.id.in_(ids.limit(batch_size)))
+
+def next_deleted_quiz_statement():
+    return select(Quiz.id, Quiz.deleted_at).where(Quiz.deleted_at.is_not(None)).order_by(Quiz.deleted_at).limit(1)
+
+async def mark_purge_pending(quiz_id, deleted_at):
+    await redis_client.hset(purge_status_key(quiz_id), mapping={
+        "status": "pending",
+        "deleted_at": deleted_at.isoformat(),
+    })
+    purge_wakeup.set()
+
+async def get_purge_status(quiz_id):
+    status = await redis_client.hgetall(purge_status_key(quiz_id))
+    if not status:
+        return None
+    return {
+        "status": status["status"],
+        "step": status.get("step") or None,
+        "deleted": {
+            field.removeprefix("deleted:"): int(count)
+            for field, count in status.items() if field.startswith("deleted:")
+        },
+        "deleted_at": status.get("deleted_at"),
+        "started_at": status.get("started_at"),
+        "finished_at": status.get("finished_at"),
+    }
+
+# 진행 상황 해시는 mark_purge_pending 없이 시작해도 (Redis 유실, 도구로 정리) deleted_at을 가지며 항상 만료된다
+async def purge_quiz(quiz_id, deleted_at, lock_token):
+    status_key = purge_status_key(quiz_id)
+    async with redis_client.pipeline(transaction=False) as pipe:
+        pipe.hset(status_key, mapping={
+            "status": "running",
+            "deleted_at": deleted_at.isoformat(),
+            "started_at": datetime.now().isoformat(),
+        })
+        pipe.expire(status_key, settings.PURGE_STATUS_TTL)
+        await pipe.execute()
+
+    for table, model, ids in purge_steps(quiz_id):
+        await redis_client.hset(status_key, "step", table)
+        while True:
+            async with AsyncSessionLocal() as db:
+                result = await db.execute(purge_batch_statement(model, ids, settings.PURGE_BATCH_SIZE))
+                await db.commit()
+
+            await redis_client.hincrby(status_key, f"deleted:{table}", result.rowcount)
+            await extend_purge_lock(lock_token)
+
+            if result.rowcount < settings.PURGE_BATCH_SIZE:
+                break
+            await asyncio.sleep(settings.PURGE_BATCH_PAUSE)
+
+    await extend_purge_lock(lock_token)
+    async with AsyncSessionLocal() as db:
+        await db.execute(delete(Quiz).where(Quiz.id == quiz_id, Quiz.deleted_at.is_not(None)))
+        await db.commit()
+    await drop_quiz_stats(quiz_id)
+
+    async with redis_client.pipeline(transaction=False) as pipe:
+        pipe.hset(status_key, mapping={"status": "done", "step": "", "finished_at": datetime.now().isoformat()})
+        pipe.expire(status_key, settings.PURGE_STATUS_TTL)
+        await pipe.execute()
+
+# 잠금을 얻으면 정리 대기 중인 퀴즈가 없을 때까지 삭제 순서대로 정리한다. (정리한 퀴즈 수 반환)
+async def run_pending_purges():
+    lock_token = secrets.token_hex(16)
+    if not await redis_client.set(PURGE_LOCK_KEY, lock_token, nx=True, ex=PURGE_LOCK_TTL):
+        return 0
+
+    purged = 0
+    try:
+        while True:
+            async with AsyncSessionLocal() as db:
+                result = await db.execute(next_deleted_quiz_statement())
+                quiz = result.one_or_none()
+            if quiz is None:
+                return purged
+            await purge_quiz(quiz.id, quiz.deleted_at, lock_token)
+            purged += 1
+    except PurgeLockLost:
+        # 잠금을 얻은 다른 워커가 남은 행부터 이어서 정리한다
+        logger.warning("Quiz purge lock lost, stopping")
+        return purged
+    finally:
+        await RELEASE_LOCK_SCRIPT(keys=[PURGE_LOCK_KEY], args=[lock_token])
+
+# 앱 lifespan 동안 실행되는 정리 루프
+async def purge_deleted_quizzes():
+    while True:
+        purge_wakeup.clear()
+        try:
+            await run_pending_purges()
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            logger.exception("Quiz purge failed, retrying later")
+        with suppress(asyncio.TimeoutError):
+            await asyncio.wait_for(purge_wakeup.wait(), settings.PURGE_POLL_INTERVAL)
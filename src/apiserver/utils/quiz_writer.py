@@ -0,0 +1,116 @@
+# apiserver/src/apiserver/utils/quiz_writer.py
+import uuid
+from datetime import datetime, timedelta
+from sqlalchemy import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from apiserver.models.quiz_model import Quiz
+from apiserver.models.quiz_config_model import QuizConfig
+from apiserver.models.question_model import Question
+from apiserver.models.choice_model import Choice
+from apiserver.models.quiz_version_model import QuizVersion
+
+# 퀴즈 트리(퀴즈, 설정, 질문, 선택지, 내용 버전)를 문항 수와 무관하게 고정된 개수의 INSERT로 저장한다.
+# id를 애플리케이션에서 미리 생성하므로 flush로 id를 받아올 필요가 없고,
+# 정답 선택지(correct_choice_id)도 질문 INSERT 시점에 함께 채워진다.
+
+def build_question_rows(quiz_id, questions_data, created_at=None):
+    created_at = created_at or datetime.now()
+    question_rows = []
+    choice_rows = []
+
+    for question_data in questions_data:
+        question_id = uuid.uuid4()
+        correct_choice_id = None
+
+        for choice_data in question_data.choices:
+            choice_id = uuid.uuid4()
+            choice_rows.append({
+                "id": choice_id,
+                "question_id": question_id,
+                "content": choice_data.content,
+                # 입력 순서를 (created_at, id) 정렬에서도 유지하기 위해 1µs씩 증가
+                "created_at": created_at + timedelta(microseconds=len(choice_rows)),
+            })
+            if choice_data.is_correct:
+                correct_choice_id = choice_id
+
+        question_rows.append({
+            "id": question_id,
+            "quiz_id": quiz_id,
+            "content": question_data.content,
+            "correct_choice_id": correct_choice_id,
+            "created_at": created_at + timedelta(microseconds=len(question_rows)),
+        })
+
+    return question_rows, choice_rows
+
+async def insert_question_rows(db: AsyncSession, question_rows, choice_rows):
+    # 선택지가 질문을 FK로 참조하므로 질문 -> 선택지 순서로 저장
+    if question_rows:
+        await db.execute(insert(Question), question_rows)
+    if choice_rows:
+        await db.execute(insert(Choice), choice_rows)
+
+# 질문/선택지 행 -> quiz_versions.content (행 순서 유지)
+def version_content(question_rows, choice_rows):
+    choices = {}
+    for row in choice_rows:
+        choices.setdefault(row["question_id"], []).append([str(row["id"]), row["content"]])
+    return [
+        {
+            "id": str(row["id"]),
+            "content": row["content"],
+            "correct": str(row["correct_choice_id"]) if row["correct_choice_id"] else None,
+            "choices": choices.get(row["id"], []),
+        }
+        for row in question_rows
+    ]
+
+async def insert_quizzes(db: AsyncSession, items):
+    # items: [(QuizCreate, created_by), ...] -> 퀴즈 개수와 무관하게 INSERT 5회
+    now = datetime.now()
+    quiz_rows = []
+    config_rows = []
+    question_rows = []
+    choice_rows = []
+    version_rows = []
+
+    for quiz_data, created_by in items:
+        quiz_id = uuid.uuid4()
+        quiz_rows.append({
+            "id": quiz_id,
+            "title": quiz_data.title,
+            "description": quiz_data.description,
+            "created_by": created_by,
+            "created_at": now,
+            "updated_at": now,
+            "version": 1,
+        })
+        config_rows.append({
+            "id": uuid.uuid4(),
+            "quiz_id": quiz_id,
+            "num_questions": quiz_data.num_questions,
+            "shuffle_questions": quiz_data.shuffle_questions,
+            "shuffle_choices": quiz_data.shuffle_choices,
+            "created_at": now,
+        })
+        questions, choices = build_question_rows(quiz_id, quiz_data.questions, now)
+        question_rows.extend(questions)
+        choice_rows.extend(choices)
+        version_rows.append({
+            "id": uuid.uuid4(),
+            "quiz_id": quiz_id,
+            "version": 1,
+            "content": version_content(questions, choices),
+            "created_at": now,
+        })
+
+    if quiz_rows:
+        await db.execute(insert(Quiz), quiz_rows)
+        await db.execute(insert(QuizConfig), config_rows)
+    await insert_question_rows(db, question_rows, choice_rows)
+    if version_rows:
+        await db.execute(insert(QuizVersion), version_rows)
+
+    return [row["id"] for row in quiz_rows]
@@ -0,0 +1,95 @@
+# apiserver/src/apiserver/utils/results_export.py
+from itertools import chain
+from sqlalchemy import select, func, cast, case, literal, Text
+
+from apiserver.models.user_model import User
+from apiserver.models.quiz_attempt_model import QuizAttempt
+from apiserver.models.answer_model import Answer
+from apiserver.config import settings
+
+# 퀴즈의 모든 응시/답안 내보내기 (GET /quizzes/{quiz_id}/results/export)
+# - 서버 측 커서로 EXPORT_BATCH_SIZE 행씩 읽고, 배치마다 CSV/NDJSON 청크 하나를 만들어 바로 보낸다.
+#   각 줄은 DB에서 만들어서 텍스트 한 열로 받는다. (행마다 UUID/datetime 객체를 만들고 Python에서 다시 문자열로 바꾸지 않음)
+#   결과 크기와 무관하게 메모리에는 배치 하나만 있고, 헤더는 쿼리 실행 전에 보내므로 첫 바이트도 바로 나간다.
+# - StreamingResponse가 본문을 보내는 동안에는 요청 의존성(get_read_db)의 세션이 이미 닫혀 있으므로 제너레이터가 직접 세션을 연다.
+#   클라이언트가 연결을 끊으면 제너레이터가 닫히면서 세션과 커서도 정리된다.
+# - 한 행은 답안 하나 (답안이 없는 응시는 답안 열이 빈 한 행). 행 순서는 보장하지 않는다.
+# - is_correct는 제출 시 채점된 값이므로 제출 전 응시는 비워 둔다.
+# - 질문/선택지는 id로만 내보낸다. 내용은 quiz_version의 퀴즈 내용에서 찾는다.
+
+EXPORT_MEDIA_TYPES = {
+    "csv": "text/csv; charset=utf-8",
+    "ndjson": "application/x-ndjson",
+}
+
+def iso_text(column):
+    return func.to_char(column, 'YYYY-MM-DD"T"HH24:MI:SS.US')
+
+def bool_text(column):
+    return case((column, "true"), (column.is_not(None), "false"))
+
+# 따옴표로 감싸고 안의 따옴표는 두 번 (RFC 4180)
+def csv_quote(column):
+    return func.concat('"', func.replace(column, '"', '""'), '"')
+
+# (열 이름, 값) - 제출 전 응시는 점수/정답 여부를 비워 둔다
+def export_fields():
+    submitted = QuizAttempt.submitted_at.is_not(None)
+    return [
+        ("user_id", QuizAttempt.user_id),
+        ("user_name", User.name),
+        ("attempt_id", QuizAttempt.id),
+        ("quiz_version", func.coalesce(QuizAttempt.quiz_version, 1)),
+        ("started_at", QuizAttempt.started_at),
+        ("submitted_at", QuizAttempt.submitted_at),
+        ("score", case((submitted, QuizAttempt.score))),
+        ("question_id", Answer.question_id),
+        ("choice_id", Answer.choice_id),
+        ("is_correct", case((submitted, Answer.is_correct))),
+        ("answered_at", Answer.answered_at),
+    ]
+
+EXPORT_COLUMNS = [name for name, _ in export_fields()]
+CSV_HEADER = (",".join(EXPORT_COLUMNS) + "\n").encode()
+
+def csv_line(fields):
+    values = []
+    for name, column in fields:
+        if name == "user_name":
+            value = csv_quote(column)
+        elif name == "is_correct":
+            value = bool_text(column)
+        elif name.endswith("_at"):
+            value = iso_text(column)
+        else:
+            value = cast(column, Text)
+        values.append(func.coalesce(value, ""))
+    return func.concat_ws(",", *values)
+
+def ndjson_line(fields):
+    return cast(func.json_build_object(*chain.from_iterable((literal(name), column) for name, column in fields)), Text)
+
+# 답안(없으면 응시) 하나마다 CSV/NDJSON 한 줄
+def export_rows_statement(quiz_id, export_format="csv"):
+    fields = export_fields()
+    line = csv_line(fields) if export_format == "csv" else ndjson_line(fields)
+    return (
+        select(line)
+        .select_from(QuizAttempt)
+        .join(User, User.id == QuizAttempt.user_id)
+        .outerjoin(Answer, Answer.attempt_id == QuizAttempt.id)
+        .where(QuizAttempt.quiz_id == quiz_id)
+    )
+
+def export_chunk(lines):
+    return ("\n".join(lines) + "\n").encode()
+
+async def stream_results(session_factory, quiz_id, export_format):
+    if export_format == "csv":
+        yield CSV_HEADER
+
+    async with session_factory() as db:
+        statement = export_rows_statement(quiz_id, export_format)
+        result = await db.stream_scalars(statement.execution_options(yield_per=settings.EXPORT_BATCH_SIZE))
+        async for lines in result.partitions():
+            yield export_chunk(lines)
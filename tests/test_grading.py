@@ -0,0 +1,32 @@
+# tests/test_grading.py
+import uuid
+
+from apiserver.utils.grading import answer_key_from_snapshot
+
+def test_answer_key_from_snapshot():
+    question_ids = [uuid.uuid4() for _ in range(2)]
+    choice_ids = [uuid.uuid4() for _ in range(2)]
+    questions = [
+        {"id": str(question_id), "correct_choice_id": str(choice_id)}
+        for question_id, choice_id in zip(question_ids, choice_ids)
+    ]
+    assert answer_key_from_snapshot(questions) == dict(zip(question_ids, choice_ids))
+
+# 정답이 없는 질문은 정답표에서 빠진다 (어떤 답도 정답이 아님)
+def test_question_without_correct_choice():
+    question_id, choice_id = uuid.uuid4(), uuid.uuid4()
+    questions = [
+        {"id": str(question_id), "correct_choice_id": str(choice_id)},
+        {"id": str(uuid.uuid4()), "correct_choice_id": None},
+    ]
+    assert answer_key_from_snapshot(questions) == {question_id: choice_id}
+
+# compact 형식(정답 없음)이나 빈 스냅샷은 None -> 정답표 캐시 사용
+def test_snapshot_without_answers():
+    assert answer_key_from_snapshot(None) is None
+    assert answer_key_from_snapshot([]) is None
+    assert answer_key_from_snapshot([{"id": str(uuid.uuid4()), "choices": [str(uuid.uuid4())]}]) is None
+    assert answer_key_from_snapshot([
+        {"id": str(uuid.uuid4()), "correct_choice_id": str(uuid.uuid4())},
+        {"id": str(uuid.uuid4())},
+    ]) is None
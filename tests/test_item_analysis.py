@@ -0,0 +1,87 @@
+# tests/test_item_analysis.py
+import random
+import numpy as np
+import pytest
+
+from apiserver.cache.quiz_content import QuizContent
+from apiserver.utils.item_analysis import AnswerColumns, compute_item_analysis
+
+NUM_QUESTIONS = 4
+NUM_CHOICES = 3
+
+# 질문 q의 선택지 c id는 "c{q}-{c}", 정답은 첫 번째 선택지
+def make_content():
+    return QuizContent([
+        {
+            "id": f"q{q}",
+            "content": f"question {q}",
+            "correct": f"c{q}-0",
+            "choices": [[f"c{q}-{c}", f"choice {c}"] for c in range(NUM_CHOICES)],
+        }
+        for q in range(NUM_QUESTIONS)
+    ])
+
+# attempts: 응시마다 {질문 번호: 선택지 번호}
+def analyze(attempts, chunk_size=2):
+    content = make_content()
+    columns = AnswerColumns(content)
+    rows = [([q * NUM_CHOICES + c for q, c in attempt.items()],) for attempt in attempts]
+    for i in range(0, len(rows), chunk_size):
+        columns.add_rows(rows[i:i + chunk_size])
+    return compute_item_analysis(columns, content)
+
+# 응시별로 반복해서 계산한 기준값
+def expected_item(attempts, q):
+    answered = [attempt for attempt in attempts if q in attempt]
+    x = [int(attempt[q] == 0) for attempt in answered]
+    y = [sum(c == 0 for c in attempt.values()) - xi for attempt, xi in zip(answered, x)]
+    difficulty = sum(x) / len(x) if x else None
+    if len(set(x)) > 1 and len(set(y)) > 1:
+        discrimination = float(np.corrcoef(x, y)[0, 1])
+    else:
+        discrimination = None
+    counts = [sum(attempt[q] == c for attempt in answered) for c in range(NUM_CHOICES)]
+    return difficulty, discrimination, counts
+
+def test_matches_per_attempt_computation():
+    rng = random.Random(0)
+    attempts = [
+        {q: rng.randrange(NUM_CHOICES) for q in range(NUM_QUESTIONS) if rng.random() < 0.9}
+        for _ in range(50)
+    ]
+    result = analyze(attempts, chunk_size=7)
+
+    assert result["attempts"] == len(attempts)
+    assert result["answers"] == sum(len(attempt) for attempt in attempts)
+    for q, item in enumerate(result["items"]):
+        difficulty, discrimination, counts = expected_item(attempts, q)
+        assert item["question_id"] == f"q{q}"
+        assert item["responses"] == sum(counts)
+        assert item["difficulty"] == pytest.approx(difficulty, abs=1e-4)
+        assert item["discrimination"] == pytest.approx(discrimination, abs=1e-4)
+        assert [choice["count"] for choice in item["choices"]] == counts
+        assert [choice["is_correct"] for choice in item["choices"]] == [True, False, False]
+        for choice, count in zip(item["choices"], counts):
+            assert choice["selection_rate"] == pytest.approx(count / sum(counts), abs=1e-4)
+
+def test_perfect_discrimination():
+    # 질문 0을 맞힌 응시만 나머지도 모두 맞힘
+    attempts = [{q: 0 for q in range(NUM_QUESTIONS)}] * 3 + [{q: 1 for q in range(NUM_QUESTIONS)}] * 2
+    item = analyze(attempts)["items"][0]
+    assert item["difficulty"] == 0.6
+    assert item["discrimination"] == 1.0
+
+# 응답이 없거나 분산이 0이면 값 대신 None
+def test_undefined_statistics_are_none():
+    attempts = [{0: 0, 1: 0}, {0: 0, 1: 1}]
+    items = analyze(attempts)["items"]
+    assert items[0]["difficulty"] == 1.0
+    assert items[0]["discrimination"] is None
+    assert items[2]["responses"] == 0
+    assert items[2]["difficulty"] is None
+    assert all(choice["selection_rate"] is None for choice in items[2]["choices"])
+
+def test_no_attempts():
+    result = analyze([])
+    assert (result["attempts"], result["answers"]) == (0, 0)
+    assert all(item["responses"] == 0 and item["difficulty"] is None for item in result["items"])
@@ -0,0 +1,38 @@
+# tests/test_ndjson.py
+import asyncio
+
+from apiserver.utils.ndjson import iter_ndjson_lines
+
+async def stream(chunks):
+    for chunk in chunks:
+        yield chunk
+
+def lines(chunks, max_line_bytes=100):
+    async def collect():
+        return [line async for line in iter_ndjson_lines(stream(chunks), max_line_bytes)]
+    return asyncio.run(collect())
+
+def test_lines_split_across_chunks():
+    assert lines([b'{"a"', b':1}\n{"b":2', b'}\n']) == [(1, b'{"a":1}'), (2, b'{"b":2}')]
+
+def test_last_line_without_newline():
+    assert lines([b"one\ntwo"]) == [(1, b"one"), (2, b"two")]
+
+# 빈 줄은 건너뛰지만 줄 번호는 센다
+def test_blank_lines_keep_line_numbers():
+    assert lines([b"one\n\n  \nfour\n"]) == [(1, b"one"), (4, b"four")]
+
+def test_empty_stream():
+    assert lines([]) == []
+    assert lines([b""]) == []
+
+def test_long_line_is_none():
+    assert lines([b"x" * 11 + b"\nok\n"], max_line_bytes=10) == [(1, None), (2, b"ok")]
+
+# 한계를 넘은 줄의 나머지 청크는 버퍼에 쌓지 않고, 다음 줄부터 정상 처리
+def test_long_line_across_chunks():
+    chunks = [b"x" * 6, b"x" * 6, b"x" * 6, b"x\nok\n", b"y" * 20]
+    assert lines(chunks, max_line_bytes=10) == [(1, None), (2, b"ok"), (3, None)]
+
+def test_line_at_limit():
+    assert lines([b"x" * 5, b"x" * 5 + b"\n"], max_line_bytes=10) == [(1, b"x" * 10)]
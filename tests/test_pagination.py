@@ -0,0 +1,69 @@
+# tests/test_pagination.py
+import base64
+import json
+import uuid
+from datetime import datetime, timedelta
+import pytest
+from fastapi import HTTPException
+
+from apiserver.utils.pagination import encode_cursor, decode_cursor, cursor_page
+
+def raw_cursor(value):
+    return base64.urlsafe_b64encode(json.dumps(value).encode()).decode().rstrip("=")
+
+def test_cursor_round_trip():
+    created_at = datetime(2025, 1, 2, 3, 4, 5, 678901)
+    id = uuid.uuid4()
+    for direction in ("next", "prev"):
+        assert decode_cursor(encode_cursor(created_at, id, direction)) == (created_at, id, direction)
+
+def test_empty_cursor_is_first_page():
+    assert decode_cursor("") is None
+    assert decode_cursor(None) is None
+
+# 형식이 잘못된 커서는 500이 아니라 400 (TypeError/AttributeError 등이 그대로 올라가지 않아야 함)
+@pytest.mark.parametrize("cursor", [
+    "!!!",
+    base64.urlsafe_b64encode(b"not json").decode(),
+    raw_cursor(5),
+    raw_cursor({}),
+    raw_cursor(None),
+    raw_cursor([1, 2, "next"]),
+    raw_cursor(["2025-01-01T00:00:00", str(uuid.uuid4())]),
+    raw_cursor(["2025-01-01T00:00:00", str(uuid.uuid4()), "sideways"]),
+    raw_cursor(["yesterday", str(uuid.uuid4()), "next"]),
+    raw_cursor(["2025-01-01T00:00:00", "not-a-uuid", "next"]),
+])
+def test_malformed_cursor_is_400(cursor):
+    with pytest.raises(HTTPException) as error:
+        decode_cursor(cursor)
+    assert error.value.status_code == 400
+
+ROWS = [(datetime(2025, 1, 1) + timedelta(minutes=i), uuid.UUID(int=i)) for i in range(5)]
+
+def key(row):
+    return row
+
+def test_cursor_page_first_page():
+    rows, next_cursor, prev_cursor = cursor_page(ROWS[:3], None, 2, key)
+    assert rows == ROWS[:2]
+    assert decode_cursor(next_cursor) == (*ROWS[1], "next")
+    assert prev_cursor is None
+
+def test_cursor_page_last_page():
+    position = decode_cursor(encode_cursor(*ROWS[2], "next"))
+    rows, next_cursor, prev_cursor = cursor_page(ROWS[3:], position, 2, key)
+    assert rows == ROWS[3:]
+    assert next_cursor is None
+    assert decode_cursor(prev_cursor) == (*ROWS[3], "prev")
+
+# prev 방향은 역순으로 조회하므로 뒤집어서 반환하고, 다음 페이지는 항상 있다
+def test_cursor_page_prev():
+    position = decode_cursor(encode_cursor(*ROWS[3], "prev"))
+    rows, next_cursor, prev_cursor = cursor_page([ROWS[2], ROWS[1], ROWS[0]], position, 2, key)
+    assert rows == [ROWS[1], ROWS[2]]
+    assert decode_cursor(next_cursor) == (*ROWS[2], "next")
+    assert decode_cursor(prev_cursor) == (*ROWS[1], "prev")
+
+def test_cursor_page_empty():
+    assert cursor_page([], None, 10, key) == ([], None, None)
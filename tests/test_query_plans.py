@@ -0,0 +1,192 @@
+# tests/test_query_plans.py
+# 엔드포인트별 주요 쿼리의 실행계획(EXPLAIN)에 Seq Scan이 없는지 확인한다.
+# 로컬 PostgreSQL에 tools/migrate.py까지 적용된 상태에서 실행하고, 연결할 수 없으면 건너뛴다.
+# 데이터는 하나의 트랜잭션 안에서 시드하고 마지막에 rollback 하므로 DB에 남지 않는다.
+# 플래너 설정은 바꾸지 않으므로, 인덱스가 있어도 플래너가 쓰지 않을 만큼 데이터가 적으면 실패할 수 있다.
+# 그래서 엔드포인트가 읽는 행이 테이블의 일부가 되도록 여러 퀴즈/응시를 시드한다.
+import asyncio
+import json
+import uuid
+from datetime import datetime
+import pytest
+from sqlalchemy import select, delete, func, insert, text
+from sqlalchemy.exc import DBAPIError
+
+from apiserver.db.database import engine
+from apiserver.models.user_model import User
+from apiserver.models.answer_model import Answer
+from apiserver.models.quiz_attempt_model import QuizAttempt
+from apiserver.models.quiz_model import Quiz
+from apiserver.models.quiz_config_model import QuizConfig
+from apiserver.models.question_model import Question
+from apiserver.models.choice_model import Choice
+from apiserver.utils.quiz_writer import insert_quizzes
+from apiserver.utils.pagination import apply_cursor
+from apiserver.utils.grading import grade_attempt_statement
+from apiserver.utils.answers import upsert_answers_statement
+from apiserver.utils.attempt import attempt_page_statement
+from apiserver.cache.quiz_content import quiz_version_statement
+from apiserver.cache.quiz_stats import submitted_scores_statement
+from apiserver.utils.item_analysis import answer_rows_statement
+from apiserver.utils.results_export import export_rows_statement
+from apiserver.utils.quiz_purge import purge_steps, purge_batch_statement, next_deleted_quiz_statement
+from bench_data import make_quiz
+
+NUM_USERS = 1000
+NUM_QUIZZES = 3000
+NUM_QUESTIONS = 20
+# 사용자마다 응시하는 퀴즈 수
+ATTEMPTS_PER_USER = 2
+
+CHECKED_TABLES = {"users", "quizzes", "quiz_configs", "questions", "choices", "quiz_attempts", "answers", "quiz_versions"}
+
+async def seed(conn):
+    user_rows = [
+        {
+            "id": uuid.uuid4(),
+            "name": f"plan-{uuid.uuid4()}",
+            "email": f"{uuid.uuid4()}@plan",
+            "password": str(uuid.uuid4()),
+            "is_admin": False,
+        }
+        for _ in range(NUM_USERS)
+    ]
+    await conn.execute(insert(User), user_rows)
+
+    quiz_data = make_quiz(NUM_QUESTIONS, title="plan")
+    quiz_ids = await insert_quizzes(conn, [(quiz_data, user_rows[0]["id"])] * NUM_QUIZZES)
+
+    result = await conn.execute(
+        select(Question.quiz_id, Question.id, Question.correct_choice_id).where(Question.quiz_id.in_(quiz_ids))
+    )
+    questions = {quiz_id: [] for quiz_id in quiz_ids}
+    for quiz_id, question_id, correct_choice_id in result:
+        questions[quiz_id].append((question_id, correct_choice_id))
+
+    # 사용자 k는 퀴즈 k, k+1, ...을 응시 (퀴즈마다 응시 NUM_USERS * ATTEMPTS_PER_USER / NUM_QUIZZES개)
+    attempt_rows = [
+        {
+            "id": uuid.uuid4(),
+            "user_id": user["id"],
+            "quiz_id": quiz_ids[(k + j) % NUM_QUIZZES],
+            "questions": [],
+        }
+        for k, user in enumerate(user_rows)
+        for j in range(ATTEMPTS_PER_USER)
+    ]
+    await conn.execute(insert(QuizAttempt), attempt_rows)
+    await conn.execute(insert(Answer), [
+        {
+            "attempt_id": attempt["id"],
+            "question_id": question_id,
+            "choice_id": correct_choice_id,
+            "is_correct": False,
+            "answered_at": datetime.now(),
+        }
+        for attempt in attempt_rows
+        for question_id, correct_choice_id in questions[attempt["quiz_id"]]
+    ])
+
+    for table in CHECKED_TABLES:
+        await conn.execute(text(f"ANALYZE {table}"))
+
+    quiz_id = quiz_ids[0]
+    result = await conn.execute(
+        select(Choice.id).join(Question, Question.id == Choice.question_id).where(Question.quiz_id == quiz_id)
+    )
+    return {
+        "user_id": user_rows[0]["id"],
+        "quiz_id": quiz_id,
+        "quiz_ids": quiz_ids,
+        "attempt_id": attempt_rows[0]["id"],
+        "question_ids": [question_id for question_id, _ in questions[quiz_id]],
+        "answer_key": dict(questions[quiz_id]),
+        "choice_ids": result.scalars().all(),
+        "cursor": (datetime.now(), uuid.uuid4(), "next"),
+    }
+
+def endpoint_queries(ids):
+    quiz_id = ids["quiz_id"]
+    user_id = ids["user_id"]
+    attempt_id = ids["attempt_id"]
+    question_ids = ids["question_ids"]
+    cursor = ids["cursor"]
+
+    return [
+        ("GET /quizzes/ page", select(Quiz).where(Quiz.deleted_at.is_(None))
+            .order_by(Quiz.created_at, Quiz.id).offset(20).limit(10)),
+        ("GET /quizzes/ cursor", apply_cursor(
+            select(Quiz).where(Quiz.deleted_at.is_(None)), Quiz.created_at, Quiz.id, cursor, 10)),
+        ("GET /quizzes/ config", select(QuizConfig).where(QuizConfig.quiz_id.in_(ids["quiz_ids"][:10]))),
+        ("GET /quizzes/ attempted", select(QuizAttempt.quiz_id).where(QuizAttempt.user_id == user_id)),
+        ("GET /users page", select(User.id).order_by(User.created_at, User.id).offset(20).limit(10)),
+        ("GET /users cursor", apply_cursor(select(User.id), User.created_at, User.id, cursor, 10)),
+        ("GET /forstaff count", select(func.count(Question.id)).where(
+            Question.quiz_id == quiz_id, Question.removed_at.is_(None))),
+        ("GET /forstaff page", select(Question).where(Question.quiz_id == quiz_id, Question.removed_at.is_(None))
+            .order_by(Question.created_at, Question.id).offset(10).limit(10)),
+        ("GET /forstaff cursor", apply_cursor(
+            select(Question).where(Question.quiz_id == quiz_id, Question.removed_at.is_(None)),
+            Question.created_at, Question.id, cursor, 10)),
+        ("GET /forstaff choices", select(Choice).where(
+            Choice.question_id.in_(question_ids[:10]), Choice.removed_at.is_(None))),
+        ("POST /attempt existing", select(QuizAttempt.id).where(
+            QuizAttempt.quiz_id == quiz_id, QuizAttempt.user_id == user_id)),
+        ("POST /attempt quiz version", quiz_version_statement(quiz_id, 1)),
+        ("GET /foruser page", attempt_page_statement(user_id, quiz_id, 10, 10)),
+        ("GET /foruser answers", select(Answer.choice_id).where(
+            Answer.attempt_id == attempt_id, Answer.question_id.in_(question_ids[:10]))),
+        ("POST /answer replace", delete(Answer).where(
+            Answer.attempt_id == attempt_id, Answer.question_id.not_in(question_ids[:10]))),
+        ("POST /answer upsert", upsert_answers_statement(attempt_id, ids["answer_key"])),
+        ("POST /submit grade", grade_attempt_statement(attempt_id, ids["answer_key"], datetime.now())),
+        ("PATCH /quizzes live questions", select(Question.id).where(
+            Question.quiz_id == quiz_id, Question.removed_at.is_(None)).order_by(Question.created_at, Question.id)),
+        ("PATCH /quizzes live choices", select(Choice.id).where(
+            Choice.question_id.in_(question_ids), Choice.removed_at.is_(None)).order_by(Choice.created_at, Choice.id)),
+        ("GET /stats rebuild scores", submitted_scores_statement(quiz_id)),
+        ("GET /item-analysis answers", answer_rows_statement(quiz_id, 1, ids["choice_ids"])),
+        ("GET /results/export", export_rows_statement(quiz_id)),
+        ("purge next quiz", next_deleted_quiz_statement()),
+    ] + [
+        (f"purge {table}", purge_batch_statement(model, ids, 1000))
+        for table, model, ids in purge_steps(quiz_id)
+    ]
+
+def seq_scans(plan):
+    found = []
+    if plan.get("Node Type") == "Seq Scan" and plan.get("Relation Name") in CHECKED_TABLES:
+        found.append(plan["Relation Name"])
+    for child in plan.get("Plans", []):
+        found.extend(seq_scans(child))
+    return found
+
+# {쿼리 이름: Seq Scan 테이블 목록}
+async def explain_endpoint_queries():
+    try:
+        conn = await engine.connect()
+    except (OSError, DBAPIError) as e:
+        pytest.skip(f"PostgreSQL is not available: {e}")
+
+    scans = {}
+    try:
+        transaction = await conn.begin()
+        try:
+            ids = await seed(conn)
+            for name, stmt in endpoint_queries(ids):
+                sql = str(stmt.compile(dialect=engine.dialect, compile_kwargs={"literal_binds": True}))
+                result = await conn.exec_driver_sql("EXPLAIN (FORMAT JSON) " + sql)
+                plan = result.scalar()
+                plan = (json.loads(plan) if isinstance(plan, str) else plan)[0]["Plan"]
+                scans[name] = seq_scans(plan)
+        finally:
+            await transaction.rollback()
+    finally:
+        await conn.close()
+        await engine.dispose()
+    return scans
+
+def test_endpoint_queries_use_indexes():
+    scans = asyncio.run(explain_endpoint_queries())
+    regressed = {name: tables for name, tables in scans.items() if tables}
+    assert not regressed, f"query plans regressed to a sequential scan: {regressed}"
@@ -0,0 +1,111 @@
+# tests/test_quiz_diff.py
+import uuid
+from datetime import datetime, timedelta
+import pytest
+
+from apiserver.schemas.quiz_schema import QuestionUpdate
+from apiserver.utils.quiz_diff import match_rows, diff_questions
+
+NOW = datetime(2025, 6, 1)
+CREATED = datetime(2025, 1, 1)
+
+def live_question(content, choices, correct=0, offset=0):
+    question = {
+        "id": uuid.uuid4(),
+        "content": content,
+        "created_at": CREATED + timedelta(seconds=offset),
+        "choices": [
+            {"id": uuid.uuid4(), "content": choice, "created_at": CREATED + timedelta(seconds=i)}
+            for i, choice in enumerate(choices)
+        ],
+    }
+    question["correct_choice_id"] = question["choices"][correct]["id"]
+    return question
+
+# 요청 형식: 기존 질문/선택지를 그대로 보내기 (id 포함 여부 선택)
+def as_update(question, with_ids=True, correct=0):
+    return QuestionUpdate(
+        id=question["id"] if with_ids else None,
+        content=question["content"],
+        choices=[
+            {"id": choice["id"] if with_ids else None, "content": choice["content"], "is_correct": i == correct}
+            for i, choice in enumerate(question["choices"])
+        ],
+    )
+
+class Item:
+    def __init__(self, content, id=None):
+        self.content = content
+        self.id = id
+
+def test_match_rows_by_id_then_content():
+    rows = [{"id": uuid.uuid4(), "content": c} for c in ("a", "b", "b", "c")]
+    matched, removed = match_rows(rows, [Item("x", rows[0]["id"]), Item("b"), Item("b"), Item("new")], "question")
+    assert matched == [rows[0], rows[1], rows[2], None]
+    assert removed == [rows[3]["id"]]
+
+def test_match_rows_rejects_unknown_and_duplicate_ids():
+    rows = [{"id": uuid.uuid4(), "content": "a"}]
+    with pytest.raises(ValueError):
+        match_rows(rows, [Item("a", uuid.uuid4())], "question")
+    with pytest.raises(ValueError):
+        match_rows(rows, [Item("a", rows[0]["id"]), Item("a", rows[0]["id"])], "question")
+
+# id로 짝지어진 행은 같은 내용의 다른 요청 항목과 다시 짝지어지지 않는다
+def test_match_rows_id_wins_over_content():
+    rows = [{"id": uuid.uuid4(), "content": "a"}]
+    matched, removed = match_rows(rows, [Item("a"), Item("changed", rows[0]["id"])], "question")
+    assert matched == [None, rows[0]]
+    assert removed == []
+
+@pytest.mark.parametrize("with_ids", [True, False])
+def test_unchanged_questions_write_nothing(with_ids):
+    live = [live_question(f"q{i}", ["a", "b", "c"], offset=i) for i in range(3)]
+    diff = diff_questions(uuid.uuid4(), live, [as_update(q, with_ids) for q in live], NOW)
+    assert not diff.changed
+    assert [q["id"] for q in diff.content] == [str(q["id"]) for q in live]
+    assert [q["correct"] for q in diff.content] == [str(q["correct_choice_id"]) for q in live]
+
+def test_changed_correct_choice_updates_question_only():
+    live = [live_question("q", ["a", "b"])]
+    diff = diff_questions(uuid.uuid4(), live, [as_update(live[0], correct=1)], NOW)
+    assert diff.question_updates == [{
+        "id": live[0]["id"],
+        "content": "q",
+        "correct_choice_id": live[0]["choices"][1]["id"],
+        "created_at": live[0]["created_at"],
+    }]
+    assert not (diff.question_inserts or diff.choice_inserts or diff.choice_updates)
+
+def test_added_and_removed_rows():
+    quiz_id = uuid.uuid4()
+    live = [live_question("keep", ["a", "b"]), live_question("drop", ["a", "b"], offset=1)]
+    keep = QuestionUpdate(id=live[0]["id"], content="keep", choices=[
+        {"id": live[0]["choices"][0]["id"], "content": "a", "is_correct": True},
+        {"content": "new choice", "is_correct": False},
+    ])
+    new = QuestionUpdate(content="new", choices=[{"content": "x", "is_correct": True}])
+
+    diff = diff_questions(quiz_id, live, [keep, new], NOW)
+
+    assert diff.removed_question_ids == [live[1]["id"]]
+    assert diff.removed_choice_ids == [live[0]["choices"][1]["id"]]
+    assert [q["content"] for q in diff.question_inserts] == ["new"]
+    assert diff.question_inserts[0]["quiz_id"] == quiz_id
+    assert diff.question_inserts[0]["created_at"] > live[0]["created_at"]
+    # 새 질문의 정답은 새로 만든 선택지
+    new_choice = next(c for c in diff.choice_inserts if c["question_id"] == diff.question_inserts[0]["id"])
+    assert diff.question_inserts[0]["correct_choice_id"] == new_choice["id"]
+    assert sorted(c["content"] for c in diff.choice_inserts) == ["new choice", "x"]
+    assert [q["content"] for q in diff.content] == ["keep", "new"]
+    assert diff.content[0]["choices"][1][1] == "new choice"
+
+# 순서가 바뀌면 요청 순서대로 created_at을 다시 매긴다
+def test_reordered_questions_get_new_created_at():
+    live = [live_question(f"q{i}", ["a"], offset=i) for i in range(3)]
+    diff = diff_questions(uuid.uuid4(), live, [as_update(q) for q in reversed(live)], NOW)
+    assert [row["id"] for row in diff.question_updates] == [q["id"] for q in reversed(live)]
+    created_at = [row["created_at"] for row in diff.question_updates]
+    assert created_at == sorted(created_at)
+    assert all(at >= NOW for at in created_at)
+    assert [q["id"] for q in diff.content] == [str(q["id"]) for q in reversed(live)]
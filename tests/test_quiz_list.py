@@ -0,0 +1,59 @@
+# tests/test_quiz_list.py
+import json
+import uuid
+from datetime import datetime
+import pytest
+
+from apiserver.schemas.quiz_schema import QuizGetListResponse, QuizResponse, QuizConfig
+from apiserver.cache.quiz_list import EncodedQuizList, encode_quiz_list
+
+def make_page(per_page):
+    now = datetime(2025, 1, 1, 12, 0, 0, 123456)
+    quizzes = []
+    for i in range(per_page):
+        quiz_id = uuid.uuid4()
+        quizzes.append(QuizResponse(
+            # 줄바꿈/따옴표/유니코드가 들어간 내용도 조각 경계를 깨지 않아야 한다
+            title=f"quiz {i}\n\"제목\"",
+            description="line\nbreak" if i % 2 else "",
+            created_at=now,
+            id=quiz_id,
+            created_by=uuid.uuid4(),
+            updated_at=now,
+            config=QuizConfig(
+                quiz_id=quiz_id, num_questions=20, shuffle_choices=True,
+                id=uuid.uuid4(), shuffle_questions=False, created_at=now,
+            ),
+        ))
+    return QuizGetListResponse(quizzes=quizzes, per_page=per_page, next_cursor="bmV4dA")
+
+# 변경 전 경로: 모델에 attempted/config를 덧씌워서 response_model로 직렬화
+def expected_body(response_data, is_admin, attempted_flags):
+    return response_data.model_copy(update={
+        "quizzes": [
+            quiz.model_copy(update={"attempted": attempted, "config": quiz.config if is_admin else None})
+            for quiz, attempted in zip(response_data.quizzes, attempted_flags)
+        ],
+    }).model_dump_json()
+
+@pytest.mark.parametrize("per_page", [0, 1, 5])
+@pytest.mark.parametrize("is_admin", [True, False])
+def test_render_matches_model_serialization(per_page, is_admin):
+    response_data = make_page(per_page)
+    attempted_flags = [i % 2 == 0 for i in range(per_page)]
+    encoded = encode_quiz_list(response_data)
+
+    body = encoded.render(is_admin, attempted_flags)
+    assert json.loads(body) == json.loads(expected_body(response_data, is_admin, attempted_flags))
+    assert body == expected_body(response_data, is_admin, attempted_flags).encode()
+
+@pytest.mark.parametrize("per_page", [0, 1, 5])
+def test_dumps_loads_round_trip(per_page):
+    response_data = make_page(per_page)
+    encoded = encode_quiz_list(response_data)
+    loaded = EncodedQuizList.loads(encoded.dumps())
+
+    assert loaded.quiz_ids == [str(quiz.id) for quiz in response_data.quizzes]
+    attempted_flags = [True] * per_page
+    for is_admin in (True, False):
+        assert loaded.render(is_admin, attempted_flags) == encoded.render(is_admin, attempted_flags)
@@ -0,0 +1,109 @@
+# tools/bench_attempt.py
+# 퀴즈 응시 시작(attempt_quiz)의 질문 선택 지연시간 벤치마크 (문제 은행 크기별, num_questions=20)
+#   legacy : 모든 질문/선택지를 selectinload로 읽고 Python에서 섞은 뒤 앞에서 num_questions개 사용
+#   sampled: 퀴즈 내용 캐시의 질문 id 목록에서 num_questions개만 골라 compact 형식으로 저장 (캐시 적중)
+#   cold   : sampled와 같지만 매번 캐시를 비우고 DB에서 퀴즈 버전 내용을 다시 읽음 (새 버전의 첫 응시)
+# 사용법: poetry run python tools/bench_attempt.py [문제 은행 크기 ...]
+import sys
+import os
+
+# src 디렉토리를 Python path에 추가
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'src')))
+
+import asyncio
+import random
+import time
+import uuid
+from sqlalchemy import select, insert
+from sqlalchemy.orm import selectinload
+
+from apiserver.db.database import engine, AsyncSessionLocal
+from apiserver.db.redis_client import redis_client
+from apiserver.models.user_model import User
+from apiserver.models.question_model import Question
+from apiserver.utils.quiz_writer import insert_quizzes
+from apiserver.utils.attempt import sample_attempt_questions
+from apiserver.cache.l1 import l1_cache
+from apiserver.cache.quiz_content import get_quiz_content, quiz_content_cache_key
+from bench_data import make_quiz
+
+NUM_QUESTIONS = 20
+REPEAT = 30
+
+async def seed(db, bank_size):
+    user_id = uuid.uuid4()
+    await db.execute(insert(User), [{
+        "id": user_id,
+        "name": f"bench-{user_id}",
+        "email": f"{user_id}@bench",
+        "password": str(uuid.uuid4()),
+        "is_admin": False,
+    }])
+    quiz_data = make_quiz(NUM_QUESTIONS, bank_size, padded=True)
+    return (await insert_quizzes(db, [(quiz_data, user_id)]))[0]
+
+# 기존 attempt_quiz의 질문 선택 (스냅샷 저장)
+async def legacy_attempt(db, quiz_id):
+    result = await db.execute(
+        select(Question)
+        .where(Question.quiz_id == quiz_id)
+        .options(selectinload(Question.choices))
+    )
+    questions = result.scalars().all()
+    random.shuffle(questions)
+    snapshot = []
+    for question in questions[:NUM_QUESTIONS]:
+        random.shuffle(question.choices)
+        snapshot.append({
+            "id": str(question.id),
+            "content": question.content,
+            "correct_choice_id": str(question.correct_choice_id),
+            "choices": [
+                {"id": str(choice.id), "question_id": str(choice.id), "content": choice.content}
+                for choice in question.choices
+            ],
+        })
+    # 세션에 로드된 객체를 비워 다음 반복도 DB에서 읽도록 함
+    db.expunge_all()
+    return snapshot
+
+async def sampled_attempt(db, quiz_id):
+    content = await get_quiz_content(db, quiz_id, 1)
+    return sample_attempt_questions(content, NUM_QUESTIONS, True, True)
+
+async def cold_attempt(db, quiz_id):
+    redis_key = quiz_content_cache_key(quiz_id, 1)
+    l1_cache.invalidate(redis_key)
+    await redis_client.delete(redis_key)
+    return await sampled_attempt(db, quiz_id)
+
+async def measure(attempt, db, quiz_id):
+    await attempt(db, quiz_id)
+    elapsed = []
+    for _ in range(REPEAT):
+        started = time.perf_counter()
+        questions = await attempt(db, quiz_id)
+        elapsed.append(time.perf_counter() - started)
+    assert len(questions) == NUM_QUESTIONS
+    elapsed.sort()
+    p50 = elapsed[len(elapsed) // 2] * 1000
+    p99 = elapsed[min(len(elapsed) - 1, int(len(elapsed) * 0.99))] * 1000
+    return p50, p99
+
+async def main(bank_sizes):
+    print(f"{'bank':>6} | {'mode':>7} | {'p50 ms':>8} | {'p99 ms':>8}")
+    for bank_size in bank_sizes:
+        async with AsyncSessionLocal() as db:
+            try:
+                quiz_id = await seed(db, bank_size)
+                for name, attempt in (("legacy", legacy_attempt), ("sampled", sampled_attempt), ("cold", cold_attempt)):
+                    p50, p99 = await measure(attempt, db, quiz_id)
+                    print(f"{bank_size:>6} | {name:>7} | {p50:>8.2f} | {p99:>8.2f}")
+            finally:
+                # 시드 데이터를 남기지 않음
+                await db.rollback()
+    await engine.dispose()
+
+if __name__ == "__main__":
+    bank_sizes = [int(arg) for arg in sys.argv[1:]] or [100, 2000]
+    asyncio.run(main(bank_sizes))
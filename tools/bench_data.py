@@ -0,0 +1,33 @@
+# tools/bench_data.py
+# 벤치마크 스크립트와 테스트가 함께 쓰는 퀴즈 데이터 (QuizCreate)
+# 질문마다 선택지 NUM_CHOICES개, 첫 번째 선택지가 정답
+import sys
+import os
+
+# src 디렉토리를 Python path에 추가
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'src')))
+
+from apiserver.schemas.quiz_schema import QuizCreate
+
+NUM_CHOICES = 4
+
+# num_questions: 응시할 때 출제되는 질문 수 / bank_size: 등록할 질문 수 (기본 num_questions)
+# padded: 질문/선택지 내용을 실제 퀴즈 정도 길이로 늘린다
+def make_quiz(num_questions, bank_size=None, title="bench", padded=False):
+    question_padding = " " + "x" * 200 if padded else ""
+    choice_padding = " " + "y" * 50 if padded else ""
+    return QuizCreate(
+        title=title,
+        description=title,
+        num_questions=num_questions,
+        questions=[
+            {
+                "content": f"question {i}" + question_padding,
+                "choices": [
+                    {"content": f"choice {j}" + choice_padding, "is_correct": j == 0}
+                    for j in range(NUM_CHOICES)
+                ],
+            }
+            for i in range(bank_size or num_questions)
+        ],
+    )
@@ -0,0 +1,135 @@
+# tools/bench_export.py
+# 응시 결과 내보내기(GET /quizzes/{quiz_id}/results/export) 벤치마크 (합성 퀴즈, 기본 답안 20만 행)
+#   legacy   : Answer ORM 객체를 모두 읽고 CSV 전체를 메모리에서 만든 뒤 응답
+#   streaming: 서버 측 커서로 EXPORT_BATCH_SIZE 행씩 읽어서 청크 단위로 CSV 생성 (stream_results)
+# 첫 데이터 바이트까지의 시간, 전체 시간, Python 힙 최대 사용량(tracemalloc, 시간과는 따로 한 번 더 실행)을 비교한다.
+# legacy는 메모리가 결과 크기에 비례해서 늘어나므로 (100만 행이면 수 GB) 큰 크기는 --streaming-only로 실행
+# 시드 데이터는 커밋해야 내보내기 세션에서 보이므로 끝나면 run_pending_purges로 지운다.
+# 사용법: poetry run python tools/bench_export.py [답안 수] [--streaming-only]
+import sys
+import os
+
+# src 디렉토리를 Python path에 추가
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'src')))
+
+import asyncio
+import csv
+import io
+import time
+import tracemalloc
+import uuid
+from datetime import datetime
+from sqlalchemy import select, update, delete, text
+
+from apiserver.db.database import engine, AsyncSessionLocal
+from apiserver.db.redis_client import redis_client
+from apiserver.models.user_model import User
+from apiserver.models.question_model import Question
+from apiserver.models.choice_model import Choice
+from apiserver.models.quiz_config_model import QuizConfig
+from apiserver.models.quiz_model import Quiz
+from apiserver.models.answer_model import Answer
+from apiserver.models.quiz_attempt_model import QuizAttempt
+from apiserver.utils.quiz_writer import insert_quizzes
+from apiserver.utils.quiz_purge import run_pending_purges, purge_status_key
+from apiserver.utils.results_export import EXPORT_COLUMNS, CSV_HEADER, stream_results
+from bench_data import make_quiz
+
+NUM_QUESTIONS = 50
+
+async def seed(db, num_answers, tag):
+    num_attempts = max(1, num_answers // NUM_QUESTIONS)
+    quiz_data = make_quiz(NUM_QUESTIONS)
+    quiz_id = (await insert_quizzes(db, [(quiz_data, uuid.uuid4())]))[0]
+    await db.execute(text(
+        "INSERT INTO users (id, name, email, password, is_admin, created_at, updated_at) "
+        "SELECT gen_random_uuid(), 'bench-' || :tag || '-' || g, g || '@' || :tag, :tag || g, false, now(), now() "
+        "FROM generate_series(1, :n) g"
+    ), {"tag": tag, "n": num_attempts})
+    await db.execute(text(
+        "INSERT INTO quiz_attempts (id, user_id, quiz_id, quiz_version, questions, started_at, submitted_at, score, created_at) "
+        "SELECT gen_random_uuid(), id, :quiz_id, 1, '[]', now(), now(), 0, now() FROM users WHERE email LIKE '%@' || :tag"
+    ), {"tag": tag, "quiz_id": quiz_id})
+    await db.execute(text(
+        "INSERT INTO answers (id, attempt_id, question_id, choice_id, is_correct, answered_at) "
+        "SELECT gen_random_uuid(), t.id, q.id, q.correct_choice_id, true, now() "
+        "FROM quiz_attempts t JOIN questions q ON q.quiz_id = t.quiz_id WHERE t.quiz_id = :quiz_id"
+    ), {"quiz_id": quiz_id})
+    await db.commit()
+    return quiz_id
+
+# 기존 방식: 전체 결과를 ORM으로 읽고 CSV 전체를 만든 뒤 보냄 (첫 바이트 = 전체 완료)
+async def legacy_export(quiz_id):
+    async with AsyncSessionLocal() as db:
+        result = await db.execute(
+            select(QuizAttempt, Answer)
+            .join(Answer, Answer.attempt_id == QuizAttempt.id)
+            .where(QuizAttempt.quiz_id == quiz_id)
+        )
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        writer.writerow(EXPORT_COLUMNS)
+        for attempt, answer in result.all():
+            writer.writerow([
+                attempt.user_id, "", attempt.id, attempt.quiz_version, attempt.started_at, attempt.submitted_at,
+                attempt.score, answer.question_id, answer.choice_id, answer.is_correct, answer.answered_at,
+            ])
+        body = buffer.getvalue().encode()
+    return [body]
+
+async def measure_time(chunks):
+    started = time.perf_counter()
+    first_byte = None
+    size = 0
+    async for chunk in chunks:
+        # 헤더만 있는 청크 다음의 첫 데이터 청크
+        if first_byte is None and chunk != CSV_HEADER:
+            first_byte = time.perf_counter() - started
+        size += len(chunk)
+    return first_byte, time.perf_counter() - started, size
+
+async def measure_memory(chunks):
+    tracemalloc.start()
+    async for _ in chunks:
+        pass
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return peak
+
+async def as_chunks(coroutine):
+    for chunk in await coroutine:
+        yield chunk
+
+async def main(num_answers, streaming_only):
+    tag = uuid.uuid4().hex
+    async with AsyncSessionLocal() as db:
+        started = time.perf_counter()
+        quiz_id = await seed(db, num_answers, tag)
+        print(f"seeded {num_answers} answers in {time.perf_counter() - started:.1f}s")
+
+    try:
+        modes = {"streaming": lambda: stream_results(AsyncSessionLocal, quiz_id, "csv")}
+        if not streaming_only:
+            modes["legacy"] = lambda: as_chunks(legacy_export(quiz_id))
+
+        print(f"{'mode':>9} | {'first byte s':>12} | {'total s':>8} | {'peak MiB':>8} | {'MiB sent':>8}")
+        for mode, chunks in modes.items():
+            first_byte, elapsed, size = await measure_time(chunks())
+            peak = await measure_memory(chunks())
+            print(f"{mode:>9} | {first_byte:>12.3f} | {elapsed:>8.2f} | {peak / 2**20:>8.1f} | {size / 2**20:>8.1f}")
+    finally:
+        # 시드 데이터 정리
+        async with AsyncSessionLocal() as db:
+            await db.execute(update(Quiz).where(Quiz.id == quiz_id).values(deleted_at=datetime.now()))
+            await db.commit()
+        # 정리 잠금을 얻어서 삭제 표시한 퀴즈를 바로 정리 (서버가 정리 중이면 서버가 정리한다)
+        await run_pending_purges()
+        async with AsyncSessionLocal() as db:
+            await db.execute(delete(User).where(User.email.like(f"%@{tag}")))
+            await db.commit()
+        await redis_client.delete(purge_status_key(quiz_id))
+    await engine.dispose()
+
+if __name__ == "__main__":
+    args = [arg for arg in sys.argv[1:] if arg != "--streaming-only"]
+    asyncio.run(main(int(args[0]) if args else 200_000, "--streaming-only" in sys.argv))
@@ -0,0 +1,145 @@
+# tools/bench_foruser.py
+# 퀴즈 상세 조회(foruser) 한 페이지 렌더링 지연시간 벤치마크 (500문항 응시, 모든 문항 답안 저장)
+#   legacy: 응시 questions 전체를 읽어 Python에서 자르고, 선택지마다 전체 답안을 any()로 검사
+#   paged : DB에서 페이지 구간만 잘라 오고, 페이지 질문의 답안만 읽어 집합으로 검사
+# 사용법: poetry run python tools/bench_foruser.py [질문수 ...]
+import sys
+import os
+
+# src 디렉토리를 Python path에 추가
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'src')))
+
+import asyncio
+import math
+import time
+import uuid
+from datetime import datetime
+from sqlalchemy import select, insert
+
+from apiserver.db.database import engine
+from apiserver.models.user_model import User
+from apiserver.models.answer_model import Answer
+from apiserver.models.quiz_attempt_model import QuizAttempt
+from apiserver.models.question_model import Question
+from apiserver.models.choice_model import Choice
+from apiserver.utils.quiz_writer import insert_quizzes
+from apiserver.utils.attempt import load_attempt_page, selected_choice_ids
+from bench_data import make_quiz, NUM_CHOICES
+
+PER_PAGE = 10
+REPEAT = 50
+
+async def seed(conn, num_questions):
+    user_id = uuid.uuid4()
+    await conn.execute(insert(User), [{
+        "id": user_id,
+        "name": f"bench-{user_id}",
+        "email": f"{user_id}@bench",
+        "password": str(uuid.uuid4()),
+        "is_admin": False,
+    }])
+    quiz_data = make_quiz(num_questions, padded=True)
+    quiz_id = (await insert_quizzes(conn, [(quiz_data, user_id)]))[0]
+
+    questions = (await conn.execute(select(Question).where(Question.quiz_id == quiz_id))).all()
+    choices = (await conn.execute(
+        select(Choice).where(Choice.question_id.in_([q.id for q in questions]))
+    )).all()
+
+    # attempt_quiz가 저장하는 스냅샷 형식
+    snapshot = [
+        {
+            "id": str(q.id),
+            "content": q.content,
+            "correct_choice_id": str(q.correct_choice_id),
+            "choices": [
+                {"id": str(c.id), "question_id": str(c.id), "content": c.content}
+                for c in choices if c.question_id == q.id
+            ],
+        }
+        for q in questions
+    ]
+    attempt_id = uuid.uuid4()
+    await conn.execute(insert(QuizAttempt), [
+        {"id": attempt_id, "user_id": user_id, "quiz_id": quiz_id, "questions": snapshot}
+    ])
+    await conn.execute(insert(Answer), [
+        {
+            "attempt_id": attempt_id,
+            "question_id": uuid.UUID(q["id"]),
+            "choice_id": uuid.UUID(q["choices"][i % NUM_CHOICES]["id"]),
+            "is_correct": False,
+            "answered_at": datetime.now(),
+        }
+        for i, q in enumerate(snapshot)
+    ])
+    return user_id, quiz_id
+
+# 기존 get_quiz_questions의 페이지 처리
+async def legacy_page(conn, user_id, quiz_id, page):
+    result = await conn.execute(
+        select(QuizAttempt)
+        .where(QuizAttempt.user_id == user_id)
+        .where(QuizAttempt.quiz_id == quiz_id)
+    )
+    attempt = result.one()
+    questions = attempt.questions
+
+    total_pages = math.ceil((len(questions) + PER_PAGE - 1) / PER_PAGE)
+    start = (page - 1) * PER_PAGE
+    end = start + PER_PAGE
+
+    result = await conn.execute(select(Answer).where(Answer.attempt_id == attempt.id))
+    answers = result.all()
+
+    return total_pages, [
+        [any(str(ans.choice_id) == str(choice["id"]) for ans in answers) for choice in question["choices"]]
+        for question in questions[start:end]
+    ]
+
+async def paged_page(conn, user_id, quiz_id, page):
+    attempt_id, _, total_questions, questions = await load_attempt_page(
+        conn, user_id, quiz_id, (page - 1) * PER_PAGE, PER_PAGE
+    )
+    total_pages = math.ceil(total_questions / PER_PAGE)
+    selected = await selected_choice_ids(conn, attempt_id, [question["id"] for question in questions])
+
+    return total_pages, [
+        [choice["id"] in selected for choice in question["choices"]]
+        for question in questions
+    ]
+
+async def measure(render, conn, user_id, quiz_id, page):
+    elapsed = []
+    for _ in range(REPEAT):
+        started = time.perf_counter()
+        result = await render(conn, user_id, quiz_id, page)
+        elapsed.append(time.perf_counter() - started)
+    elapsed.sort()
+    p50 = elapsed[len(elapsed) // 2] * 1000
+    p99 = elapsed[min(len(elapsed) - 1, int(len(elapsed) * 0.99))] * 1000
+    return result, p50, p99
+
+async def main(sizes):
+    print(f"{'questions':>9} | {'page':>4} | {'mode':>6} | {'pages':>5} | {'p50 ms':>8} | {'p99 ms':>8}")
+    for num_questions in sizes:
+        async with engine.connect() as conn:
+            transaction = await conn.begin()
+            try:
+                user_id, quiz_id = await seed(conn, num_questions)
+                last_page = math.ceil(num_questions / PER_PAGE)
+                for page in (1, last_page):
+                    results = {}
+                    for name, render in (("legacy", legacy_page), ("paged", paged_page)):
+                        result, p50, p99 = await measure(render, conn, user_id, quiz_id, page)
+                        results[name] = result
+                        print(f"{num_questions:>9} | {page:>4} | {name:>6} | {result[0]:>5} | {p50:>8.2f} | {p99:>8.2f}")
+                    # 선택 여부는 같아야 한다 (전체 페이지 수는 legacy가 잘못 계산할 수 있음)
+                    assert results["legacy"][1] == results["paged"][1]
+            finally:
+                await transaction.rollback()
+    await engine.dispose()
+
+if __name__ == "__main__":
+    sizes = [int(arg) for arg in sys.argv[1:]] or [500]
+    asyncio.run(main(sizes))
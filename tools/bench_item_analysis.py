@@ -0,0 +1,147 @@
+# tools/bench_item_analysis.py
+# 문항 분석(GET /quizzes/{quiz_id}/item-analysis) 계산 시간 벤치마크 (합성 퀴즈, 기본 답안 100만 개)
+#   legacy  : Answer ORM 객체를 모두 읽고 Python에서 답안마다 반복하며 계산
+#   columnar: 답안을 청크 단위로 스트리밍해서 int32 열 배열로 만들고 NumPy bincount로 한 번에 계산
+#   cached  : 같은 버전의 두 번째 요청 (Redis/L1 캐시)
+# 두 방식의 난이도/변별도가 같은지도 확인한다.
+# 사용법: poetry run python tools/bench_item_analysis.py [답안 수]
+import sys
+import os
+
+# src 디렉토리를 Python path에 추가
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'src')))
+
+import asyncio
+import math
+import time
+import uuid
+from collections import defaultdict
+from sqlalchemy import select, text
+
+from apiserver.db.database import engine, AsyncSessionLocal
+from apiserver.db.redis_client import redis_client
+from apiserver.models.user_model import User
+from apiserver.models.answer_model import Answer
+from apiserver.models.quiz_attempt_model import QuizAttempt
+from apiserver.utils.quiz_writer import insert_quizzes
+from apiserver.utils.item_analysis import load_answer_columns, compute_item_analysis
+from apiserver.cache.quiz_content import get_quiz_content, quiz_content_cache_key
+from apiserver.cache.item_analysis import get_item_analysis, item_analysis_cache_key
+from apiserver.cache.l1 import l1_cache
+from bench_data import make_quiz
+
+NUM_QUESTIONS = 50
+
+async def seed(db, num_answers):
+    num_attempts = max(1, num_answers // NUM_QUESTIONS)
+    quiz_data = make_quiz(NUM_QUESTIONS)
+    quiz_id = (await insert_quizzes(db, [(quiz_data, uuid.uuid4())]))[0]
+    tag = uuid.uuid4().hex
+
+    # 사용자/응시/답안은 DB에서 바로 생성 (응시자 능력과 문항 난이도에 따라 정답 확률이 달라지도록)
+    await db.execute(text(
+        "INSERT INTO users (id, name, email, password, is_admin, created_at, updated_at) "
+        "SELECT gen_random_uuid(), 'bench-' || :tag || '-' || g, g || '@' || :tag, :tag || g, false, now(), now() "
+        "FROM generate_series(1, :n) g"
+    ), {"tag": tag, "n": num_attempts})
+    await db.execute(text(
+        "INSERT INTO quiz_attempts (id, user_id, quiz_id, quiz_version, questions, started_at, submitted_at, score, created_at) "
+        "SELECT gen_random_uuid(), id, :quiz_id, 1, '[]', now(), now(), 0, now() FROM users WHERE email LIKE '%@' || :tag"
+    ), {"tag": tag, "quiz_id": quiz_id})
+    await db.execute(text(
+        "WITH wrong AS ("
+        "  SELECT c.question_id, array_agg(c.id) AS ids FROM choices c JOIN questions q ON q.id = c.question_id "
+        "  WHERE q.quiz_id = :quiz_id AND c.id <> q.correct_choice_id GROUP BY c.question_id"
+        ") "
+        "INSERT INTO answers (id, attempt_id, question_id, choice_id, is_correct, answered_at) "
+        "SELECT gen_random_uuid(), t.id, q.id, "
+        "  CASE WHEN random() < 0.15 + 0.5 * (abs(hashtext(t.id::text)) % 1000) / 1000.0 "
+        "                     + 0.3 * (abs(hashtext(q.id::text)) % 1000) / 1000.0 "
+        "       THEN q.correct_choice_id ELSE w.ids[1 + floor(random() * array_length(w.ids, 1))::int] END, "
+        "  false, now() "
+        "FROM quiz_attempts t JOIN questions q ON q.quiz_id = t.quiz_id JOIN wrong w ON w.question_id = q.id "
+        "WHERE t.quiz_id = :quiz_id"
+    ), {"quiz_id": quiz_id})
+    return quiz_id
+
+# 기존 방식: 답안 객체마다 반복
+async def legacy_analysis(db, quiz_id, content):
+    result = await db.execute(
+        select(Answer)
+        .join(QuizAttempt, QuizAttempt.id == Answer.attempt_id)
+        .where(QuizAttempt.quiz_id == quiz_id, QuizAttempt.submitted_at.is_not(None))
+    )
+    answers = result.scalars().all()
+    correct_choice = {uuid.UUID(qid): uuid.UUID(q["correct"]) for qid, q in content.questions.items()}
+
+    totals = defaultdict(int)
+    for answer in answers:
+        if answer.choice_id == correct_choice.get(answer.question_id):
+            totals[answer.attempt_id] += 1
+
+    per_question = defaultdict(list)
+    choice_counts = defaultdict(int)
+    for answer in answers:
+        is_correct = int(answer.choice_id == correct_choice.get(answer.question_id))
+        per_question[answer.question_id].append((is_correct, totals[answer.attempt_id] - is_correct))
+        choice_counts[answer.choice_id] += 1
+
+    items = {}
+    for question_id, pairs in per_question.items():
+        n = len(pairs)
+        p = sum(x for x, _ in pairs) / n
+        mean_y = sum(y for _, y in pairs) / n
+        var_y = sum((y - mean_y) ** 2 for _, y in pairs) / n
+        cov = sum((x - p) * (y - mean_y) for x, y in pairs) / n
+        r = cov / math.sqrt(p * (1 - p) * var_y) if p * (1 - p) * var_y > 0 else None
+        items[str(question_id)] = (p, r)
+    db.expunge_all()
+    return items, choice_counts
+
+async def columnar_analysis(db, quiz_id, content):
+    started = time.perf_counter()
+    columns = await load_answer_columns(db, quiz_id, 1, content)
+    loaded = time.perf_counter()
+    report = compute_item_analysis(columns, content)
+    return report, loaded - started, time.perf_counter() - loaded
+
+async def main(num_answers):
+    async with AsyncSessionLocal() as db:
+        try:
+            started = time.perf_counter()
+            quiz_id = await seed(db, num_answers)
+            print(f"seeded {num_answers} answers in {time.perf_counter() - started:.1f}s")
+            content = await get_quiz_content(db, quiz_id, 1)
+
+            # legacy가 만든 객체 100만 개가 GC 비용으로 뒤 측정에 영향을 주지 않도록 columnar부터 측정
+            report, load_seconds, compute_seconds = await columnar_analysis(db, quiz_id, content)
+
+            await get_item_analysis(db, quiz_id, 1)
+            started = time.perf_counter()
+            await get_item_analysis(db, quiz_id, 1)
+            cached_seconds = time.perf_counter() - started
+
+            started = time.perf_counter()
+            legacy_items, _ = await legacy_analysis(db, quiz_id, content)
+            legacy_seconds = time.perf_counter() - started
+
+            print(f"{'mode':>8} | {'seconds':>10}")
+            print(f"{'legacy':>8} | {legacy_seconds:>10.3f}")
+            print(f"{'columnar':>8} | {load_seconds + compute_seconds:>10.3f}  (load {load_seconds:.3f}, numpy {compute_seconds:.4f})")
+            print(f"{'cached':>8} | {cached_seconds:>10.6f}")
+
+            max_diff = 0.0
+            for item in report["items"]:
+                p, r = legacy_items[item["question_id"]]
+                max_diff = max(max_diff, abs(p - item["difficulty"]), abs((r or 0) - (item["discrimination"] or 0)))
+            print(f"answers={report['answers']} attempts={report['attempts']} max difference vs legacy={max_diff:.4f}")
+        finally:
+            # 시드 데이터와 캐시를 남기지 않음
+            await db.rollback()
+            for key in (item_analysis_cache_key(quiz_id, 1), quiz_content_cache_key(quiz_id, 1)):
+                l1_cache.invalidate(key)
+                await redis_client.delete(key)
+    await engine.dispose()
+
+if __name__ == "__main__":
+    asyncio.run(main(int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000))
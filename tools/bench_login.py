@@ -0,0 +1,59 @@
+# tools/bench_login.py
+# 로그인(비밀번호 검증) 처리량과 이벤트 루프 정지 시간 벤치마크
+#   inline: 기존 login과 같이 이벤트 루프에서 hash + verify
+#   pool  : 스레드 풀에서 저장된 해시와 한 번만 verify
+# 사용법: poetry run python tools/bench_login.py [동시 로그인 수]
+import sys
+import os
+
+# src 디렉토리를 Python path에 추가
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'src')))
+
+import asyncio
+import time
+
+from apiserver.utils.auth import hash_password, verify_password, verify_password_async, password_hash_stats
+
+TICK = 0.005
+
+async def heartbeat(stop, lags):
+    # TICK마다 깨어나야 하는 코루틴; 늦게 깨어난 만큼이 이벤트 루프 정지 시간
+    while not stop.is_set():
+        expected = time.perf_counter() + TICK
+        await asyncio.sleep(TICK)
+        lags.append(max(0.0, time.perf_counter() - expected))
+
+async def inline_login(password, stored_hash):
+    return verify_password(password, hash_password(password))
+
+async def pool_login(password, stored_hash):
+    return await verify_password_async(password, stored_hash)
+
+async def run(login, logins, password, stored_hash):
+    stop = asyncio.Event()
+    lags = []
+    beat = asyncio.create_task(heartbeat(stop, lags))
+    await asyncio.sleep(TICK * 2)
+
+    started = time.perf_counter()
+    results = await asyncio.gather(*(login(password, stored_hash) for _ in range(logins)))
+    elapsed = time.perf_counter() - started
+
+    stop.set()
+    await beat
+    assert all(results)
+    return logins / elapsed, max(lags) * 1000, sum(lags) * 1000
+
+async def main(logins):
+    password = "benchmark-password"
+    stored_hash = hash_password(password)
+
+    print(f"{'mode':>6} | {'logins/s':>8} | {'max stall ms':>12} | {'total stall ms':>14}")
+    for name, login in (("inline", inline_login), ("pool", pool_login)):
+        throughput, max_stall, total_stall = await run(login, logins, password, stored_hash)
+        print(f"{name:>6} | {throughput:>8.1f} | {max_stall:>12.1f} | {total_stall:>14.1f}")
+    print(password_hash_stats())
+
+if __name__ == "__main__":
+    logins = int(sys.argv[1]) if len(sys.argv) > 1 else 32
+    asyncio.run(main(logins))
@@ -0,0 +1,102 @@
+# tools/bench_quiz_list.py
+# 퀴즈 목록(GET /quizzes) 캐시 적중 경로의 응답 생성 시간 마이크로벤치마크 (per_page별, DB/Redis 없이 합성 데이터)
+#   legacy : 캐시된 QuizGetListResponse에 attempted/config를 model_copy로 덧씌우고 FastAPI가 response_model로 검증/직렬화
+#   encoded: 캐시된 JSON 조각에 attempted만 붙여서 바이트 그대로 반환 (cache/quiz_list.py)
+# L1 적중(프로세스 내 객체)과 Redis 적중(문자열에서 캐시 값 복원) 두 경우를 측정하고, 두 방식의 응답 JSON이 같은지 확인한다.
+# 사용법: poetry run python tools/bench_quiz_list.py [per_page ...]
+import sys
+import os
+
+# src 디렉토리를 Python path에 추가
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'src')))
+
+import asyncio
+import json
+import random
+import time
+import uuid
+from datetime import datetime
+from fastapi.responses import JSONResponse
+from fastapi.routing import serialize_response
+
+from apiserver.main import app
+from apiserver.schemas.quiz_schema import QuizGetListResponse, QuizResponse, QuizConfig
+from apiserver.cache.quiz_list import EncodedQuizList, encode_quiz_list
+
+REPEAT = 200
+
+def make_page(per_page):
+    now = datetime.now()
+    quizzes = []
+    for i in range(per_page):
+        quiz_id = uuid.uuid4()
+        quizzes.append(QuizResponse(
+            title=f"quiz {i}",
+            description="bench quiz description",
+            created_at=now,
+            id=quiz_id,
+            created_by=uuid.uuid4(),
+            updated_at=now,
+            config=QuizConfig(
+                quiz_id=quiz_id, num_questions=20, shuffle_choices=True,
+                id=uuid.uuid4(), shuffle_questions=False, created_at=now,
+            ),
+        ))
+    return QuizGetListResponse(quizzes=quizzes, total_pages=10, page=1, per_page=per_page)
+
+def list_route():
+    return next(route for route in app.routes if getattr(route, "name", None) == "list_quizzes")
+
+# 변경 전 캐시 적중 경로: 덧씌운 모델을 FastAPI가 response_model로 직렬화
+async def legacy_response(route, response_data, is_admin, attempted_flags):
+    content = response_data.model_copy(update={
+        "quizzes": [
+            quiz.model_copy(update={
+                "attempted": attempted,
+                "config": quiz.config if is_admin else None,
+            })
+            for quiz, attempted in zip(response_data.quizzes, attempted_flags)
+        ],
+    })
+    serialized = await serialize_response(field=route.response_field, response_content=content, is_coroutine=True)
+    return JSONResponse(serialized).body
+
+def encoded_response(encoded, is_admin, attempted_flags):
+    return encoded.render(is_admin, attempted_flags)
+
+async def timed(function):
+    started = time.perf_counter()
+    for _ in range(REPEAT):
+        body = function()
+        if asyncio.iscoroutine(body):
+            body = await body
+    return (time.perf_counter() - started) / REPEAT * 1000, body
+
+async def main(per_pages):
+    route = list_route()
+    print(f"{'per_page':>8} | {'mode':>8} | {'L1 hit ms':>9} | {'Redis hit ms':>12}")
+    for per_page in per_pages:
+        response_data = make_page(per_page)
+        cached_model = response_data.model_dump_json()
+        encoded = encode_quiz_list(response_data)
+        cached_encoded = encoded.dumps()
+        attempted_flags = [random.random() < 0.3 for _ in range(per_page)]
+
+        for is_admin in (True, False):
+            legacy_body = await legacy_response(route, response_data, is_admin, attempted_flags)
+            assert json.loads(legacy_body) == json.loads(encoded_response(encoded, is_admin, attempted_flags))
+
+        legacy_l1, _ = await timed(lambda: legacy_response(route, response_data, False, attempted_flags))
+        legacy_redis, _ = await timed(lambda: legacy_response(
+            route, QuizGetListResponse.model_validate_json(cached_model), False, attempted_flags
+        ))
+        encoded_l1, _ = await timed(lambda: encoded_response(encoded, False, attempted_flags))
+        encoded_redis, _ = await timed(lambda: encoded_response(
+            EncodedQuizList.loads(cached_encoded), False, attempted_flags
+        ))
+
+        print(f"{per_page:>8} | {'legacy':>8} | {legacy_l1:>9.3f} | {legacy_redis:>12.3f}")
+        print(f"{per_page:>8} | {'encoded':>8} | {encoded_l1:>9.3f} | {encoded_redis:>12.3f}")
+
+if __name__ == "__main__":
+    asyncio.run(main([int(arg) for arg in sys.argv[1:]] or [10, 100, 1000]))
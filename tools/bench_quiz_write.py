@@ -0,0 +1,92 @@
+# tools/bench_quiz_write.py
+# 퀴즈 생성 경로 벤치마크: 기존(행마다 flush) vs 일괄 INSERT
+# 사용법: poetry run python tools/bench_quiz_write.py [질문수 ...]
+import sys
+import os
+
+# src 디렉토리를 Python path에 추가
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'src')))
+
+import asyncio
+import time
+import uuid
+from sqlalchemy import event
+
+from apiserver.db.database import engine, AsyncSessionLocal
+from apiserver.models.user_model import User
+from apiserver.models.answer_model import Answer
+from apiserver.models.quiz_attempt_model import QuizAttempt
+from apiserver.models.quiz_model import Quiz
+from apiserver.models.quiz_config_model import QuizConfig
+from apiserver.models.question_model import Question
+from apiserver.models.choice_model import Choice
+from apiserver.utils.quiz_writer import insert_quizzes
+from bench_data import make_quiz
+
+REPEAT = 5
+
+statement_count = 0
+
+def count_statement(conn, cursor, statement, parameters, context, executemany):
+    global statement_count
+    statement_count += 1
+
+event.listen(engine.sync_engine, "before_cursor_execute", count_statement)
+
+# 기존 create_quiz와 동일한 방식 (질문/선택지마다 flush)
+async def legacy_create(db, quiz_data, created_by):
+    quiz = Quiz(title=quiz_data.title, description=quiz_data.description, created_by=created_by)
+    db.add(quiz)
+    await db.flush()
+
+    db.add(QuizConfig(
+        quiz_id=quiz.id,
+        num_questions=quiz_data.num_questions,
+        shuffle_questions=quiz_data.shuffle_questions,
+        shuffle_choices=quiz_data.shuffle_choices,
+    ))
+    await db.flush()
+
+    for question_data in quiz_data.questions:
+        question = Question(quiz_id=quiz.id, content=question_data.content)
+        db.add(question)
+        await db.flush()
+        for choice_data in question_data.choices:
+            choice = Choice(question_id=question.id, content=choice_data.content)
+            db.add(choice)
+            await db.flush()
+            if choice_data.is_correct:
+                question.correct_choice_id = choice.id
+        await db.flush()
+
+async def bulk_create(db, quiz_data, created_by):
+    await insert_quizzes(db, [(quiz_data, created_by)])
+
+async def measure(create, quiz_data):
+    global statement_count
+    elapsed = []
+    statements = 0
+    for _ in range(REPEAT):
+        async with AsyncSessionLocal() as db:
+            statement_count = 0
+            started = time.perf_counter()
+            await create(db, quiz_data, uuid.uuid4())
+            elapsed.append(time.perf_counter() - started)
+            statements = statement_count
+            # 벤치마크 데이터는 남기지 않음
+            await db.rollback()
+    elapsed.sort()
+    return statements, elapsed[len(elapsed) // 2] * 1000
+
+async def main(sizes):
+    print(f"{'questions':>9} | {'legacy stmts':>12} | {'legacy ms':>9} | {'bulk stmts':>10} | {'bulk ms':>8}")
+    for size in sizes:
+        quiz_data = make_quiz(size)
+        legacy_statements, legacy_ms = await measure(legacy_create, quiz_data)
+        bulk_statements, bulk_ms = await measure(bulk_create, quiz_data)
+        print(f"{size:>9} | {legacy_statements:>12} | {legacy_ms:>9.1f} | {bulk_statements:>10} | {bulk_ms:>8.1f}")
+    await engine.dispose()
+
+if __name__ == "__main__":
+    sizes = [int(arg) for arg in sys.argv[1:]] or [2, 10, 50, 200]
+    asyncio.run(main(sizes))
@@ -0,0 +1,144 @@
+# tools/bench_submit.py
+# 퀴즈 제출(채점) 지연시간 벤치마크: 기존(답안마다 Question 조회) vs 일괄 채점
+# 사용법: poetry run python tools/bench_submit.py [질문수 ...]
+import sys
+import os
+
+# src 디렉토리를 Python path에 추가
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'src')))
+
+import asyncio
+import time
+import uuid
+from datetime import datetime
+from sqlalchemy import select, delete, insert
+
+from apiserver.db.database import engine, AsyncSessionLocal
+from apiserver.models.user_model import User
+from apiserver.models.answer_model import Answer
+from apiserver.models.quiz_attempt_model import QuizAttempt
+from apiserver.models.quiz_model import Quiz
+from apiserver.models.quiz_config_model import QuizConfig
+from apiserver.models.quiz_version_model import QuizVersion
+from apiserver.models.question_model import Question
+from apiserver.models.choice_model import Choice
+from apiserver.utils.quiz_writer import insert_quizzes
+from apiserver.utils.grading import grade_attempt, answer_key_from_snapshot
+from bench_data import make_quiz
+
+REPEAT = 20
+
+async def seed(num_questions):
+    async with AsyncSessionLocal() as db:
+        user = User(
+            name=f"bench-{uuid.uuid4()}",
+            email=f"{uuid.uuid4()}@bench",
+            password=str(uuid.uuid4()),
+        )
+        db.add(user)
+        await db.flush()
+
+        quiz_data = make_quiz(num_questions)
+        quiz_id = (await insert_quizzes(db, [(quiz_data, user.id)]))[0]
+
+        result = await db.execute(select(Question).where(Question.quiz_id == quiz_id))
+        questions = result.scalars().all()
+        result = await db.execute(
+            select(Choice).where(Choice.question_id.in_([q.id for q in questions]))
+        )
+        choices = result.scalars().all()
+
+        snapshot = [
+            {
+                "id": str(q.id),
+                "content": q.content,
+                "correct_choice_id": str(q.correct_choice_id),
+                "choices": [
+                    {"id": str(c.id), "question_id": str(c.id), "content": c.content}
+                    for c in choices if c.question_id == q.id
+                ],
+            }
+            for q in questions
+        ]
+        attempt = QuizAttempt(user_id=user.id, quiz_id=quiz_id, questions=snapshot)
+        db.add(attempt)
+        await db.flush()
+
+        # 절반은 정답, 절반은 오답
+        await db.execute(insert(Answer), [
+            {
+                "attempt_id": attempt.id,
+                "question_id": uuid.UUID(q["id"]),
+                "choice_id": uuid.UUID(q["choices"][i % 2]["id"]),
+                "is_correct": False,
+                "answered_at": datetime.now(),
+            }
+            for i, q in enumerate(snapshot)
+        ])
+        await db.commit()
+        return user.id, quiz_id, attempt.id
+
+async def cleanup(user_id, quiz_id, attempt_id):
+    async with AsyncSessionLocal() as db:
+        question_ids = select(Question.id).where(Question.quiz_id == quiz_id)
+        await db.execute(delete(Answer).where(Answer.attempt_id == attempt_id))
+        await db.execute(delete(QuizAttempt).where(QuizAttempt.id == attempt_id))
+        await db.execute(delete(Choice).where(Choice.question_id.in_(question_ids)))
+        await db.execute(delete(Question).where(Question.quiz_id == quiz_id))
+        await db.execute(delete(QuizConfig).where(QuizConfig.quiz_id == quiz_id))
+        await db.execute(delete(QuizVersion).where(QuizVersion.quiz_id == quiz_id))
+        await db.execute(delete(Quiz).where(Quiz.id == quiz_id))
+        await db.execute(delete(User).where(User.id == user_id))
+        await db.commit()
+
+# 기존 submit_quiz_attempt의 채점 루프
+async def legacy_submit(db, attempt):
+    result = await db.execute(select(Answer).where(Answer.attempt_id == attempt.id))
+    answers = result.scalars().all()
+    total_score = 0
+    for ans in answers:
+        question = await db.get(Question, ans.question_id)
+        if question.correct_choice_id == ans.choice_id:
+            total_score += 1
+        db.add(ans)
+    attempt.score = total_score
+    attempt.submitted_at = datetime.now()
+    await db.flush()
+    return total_score
+
+async def bulk_submit(db, attempt):
+    score, _ = await grade_attempt(db, attempt.id, answer_key_from_snapshot(attempt.questions))
+    return score
+
+async def measure(submit, attempt_id):
+    elapsed = []
+    score = None
+    for _ in range(REPEAT):
+        async with AsyncSessionLocal() as db:
+            attempt = await db.get(QuizAttempt, attempt_id)
+            started = time.perf_counter()
+            score = await submit(db, attempt)
+            elapsed.append(time.perf_counter() - started)
+            # 제출 상태를 남기지 않음
+            await db.rollback()
+    elapsed.sort()
+    p50 = elapsed[len(elapsed) // 2] * 1000
+    p99 = elapsed[min(len(elapsed) - 1, int(len(elapsed) * 0.99))] * 1000
+    return score, p50, p99
+
+async def main(sizes):
+    print(f"{'questions':>9} | {'legacy p50':>10} | {'legacy p99':>10} | {'bulk p50':>8} | {'bulk p99':>8} | score")
+    for size in sizes:
+        user_id, quiz_id, attempt_id = await seed(size)
+        try:
+            legacy_score, legacy_p50, legacy_p99 = await measure(legacy_submit, attempt_id)
+            bulk_score, bulk_p50, bulk_p99 = await measure(bulk_submit, attempt_id)
+            assert legacy_score == bulk_score
+            print(f"{size:>9} | {legacy_p50:>10.1f} | {legacy_p99:>10.1f} | {bulk_p50:>8.1f} | {bulk_p99:>8.1f} | {bulk_score}")
+        finally:
+            await cleanup(user_id, quiz_id, attempt_id)
+    await engine.dispose()
+
+if __name__ == "__main__":
+    sizes = [int(arg) for arg in sys.argv[1:]] or [10, 50, 200]
+    asyncio.run(main(sizes))
@@ -0,0 +1,133 @@
+# tools/bench_workers.py
+# 워커 프로세스 수별 apiserver 처리량 벤치마크
+# 워커 수마다 main()(운영 모드)으로 서버를 띄우고, keep-alive 연결 여러 개로 GET 요청을 보낸 뒤 SIGTERM으로 종료한다.
+#   list  : GET /quizzes/ (캐시 적중, CPU 위주)
+#   detail: GET /quizzes/{id}/forstaff (캐시 적중, 응답이 큼)
+# 로컬 PostgreSQL/Redis가 필요하며 CPU 코어 수보다 많은 워커는 의미가 없다.
+# 사용법: poetry run python tools/bench_workers.py [워커수 ...]
+import sys
+import os
+
+# src 디렉토리를 Python path에 추가
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'src')))
+
+import asyncio
+import signal
+import time
+import uuid
+from sqlalchemy import insert
+
+from apiserver.db.database import engine
+from apiserver.models.user_model import User
+from apiserver.utils.quiz_writer import insert_quizzes
+from apiserver.utils.auth import create_access_token
+from bench_data import make_quiz
+
+HOST = "127.0.0.1"
+PORT = 8765
+CONNECTIONS = 64
+DURATION = 10
+NUM_QUESTIONS = 20
+
+async def seed():
+    user_id = uuid.uuid4()
+    quiz_data = make_quiz(NUM_QUESTIONS)
+    async with engine.begin() as conn:
+        await conn.execute(insert(User), [{
+            "id": user_id,
+            "name": f"bench-{user_id}",
+            "email": f"{user_id}@bench",
+            "password": str(uuid.uuid4()),
+            "is_admin": True,
+        }])
+        quiz_ids = await insert_quizzes(conn, [(quiz_data, user_id)])
+    await engine.dispose()
+    return create_access_token(data={"sub": str(user_id)}), quiz_ids[0]
+
+async def request(reader, writer, path, token):
+    writer.write(
+        f"GET {path} HTTP/1.1\r\nHost: {HOST}\r\nAuthorization: Bearer {token}\r\n\r\n".encode()
+    )
+    status = await reader.readline()
+    length = 0
+    while (line := await reader.readline()) not in (b"\r\n", b""):
+        name, _, value = line.decode().partition(":")
+        if name.lower() == "content-length":
+            length = int(value)
+    await reader.readexactly(length)
+    return status.split()[1] == b"200"
+
+async def client(path, token, deadline, latencies):
+    reader, writer = await asyncio.open_connection(HOST, PORT)
+    try:
+        while time.perf_counter() < deadline:
+            started = time.perf_counter()
+            assert await request(reader, writer, path, token)
+            latencies.append(time.perf_counter() - started)
+    finally:
+        writer.close()
+
+async def run(path, token):
+    # 워커마다 L1 캐시가 채워지도록 먼저 예열
+    warmup = []
+    await asyncio.gather(*(client(path, token, time.perf_counter() + 1, warmup) for _ in range(CONNECTIONS)))
+
+    latencies = []
+    deadline = time.perf_counter() + DURATION
+    await asyncio.gather(*(client(path, token, deadline, latencies) for _ in range(CONNECTIONS)))
+    latencies.sort()
+    return (
+        len(latencies) / DURATION,
+        latencies[len(latencies) // 2] * 1000,
+        latencies[int(len(latencies) * 0.99)] * 1000,
+    )
+
+async def wait_ready(server):
+    while True:
+        if server.returncode is not None:
+            raise RuntimeError("server exited during startup")
+        try:
+            _, writer = await asyncio.open_connection(HOST, PORT)
+            writer.close()
+            return
+        except OSError:
+            await asyncio.sleep(0.2)
+
+async def start_server(workers):
+    env = dict(
+        os.environ,
+        SERVER_HOST=HOST,
+        SERVER_PORT=str(PORT),
+        SERVER_WORKERS=str(workers),
+        SERVER_RELOAD="false",
+        PYTHONPATH=os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'src')),
+    )
+    server = await asyncio.create_subprocess_exec(
+        sys.executable, "-c", "from apiserver.main import main; main()",
+        env=env, stdout=asyncio.subprocess.DEVNULL, stderr=asyncio.subprocess.DEVNULL,
+    )
+    await wait_ready(server)
+    return server
+
+async def main(worker_counts):
+    token, quiz_id = await seed()
+    paths = {
+        "list": "/quizzes/?page=1&per_page=10",
+        "detail": f"/quizzes/{quiz_id}/forstaff?page=1&per_page={NUM_QUESTIONS}",
+    }
+
+    print(f"{os.cpu_count()} CPU(s), {CONNECTIONS} connections, {DURATION}s per run")
+    print(f"{'workers':>7} | {'endpoint':>8} | {'req/s':>8} | {'p50 ms':>8} | {'p99 ms':>8}")
+    for workers in worker_counts:
+        server = await start_server(workers)
+        try:
+            for name, path in paths.items():
+                throughput, p50, p99 = await run(path, token)
+                print(f"{workers:>7} | {name:>8} | {throughput:>8.0f} | {p50:>8.1f} | {p99:>8.1f}")
+        finally:
+            server.send_signal(signal.SIGTERM)
+            await server.wait()
+
+if __name__ == "__main__":
+    worker_counts = [int(arg) for arg in sys.argv[1:]] or [1, 2, 4]
+    asyncio.run(main(worker_counts))
@@ -8,6 +8,7 @@ sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 's
 import asyncio
 from apiserver.db.database import engine
 from apiserver.db.base import Base
+from apiserver.db.migrations import run_migrations
 from apiserver.models.user_model import User  # 테이블이 정의된 모델들 import
 from apiserver.models.answer_model import Answer  # 테이블이 정의된 모델들 import
 from apiserver.models.choice_model import Choice  # 테이블이 정의된 모델들 import
@@ -15,10 +16,14 @@ from apiserver.models.question_model import Question  # 테이블이 정의된 
 from apiserver.models.quiz_attempt_model import QuizAttempt  # 테이블이 정의된 모델들 import
 from apiserver.models.quiz_config_model import QuizConfig  # 테이블이 정의된 모델들 import
 from apiserver.models.quiz_model import Quiz  # 테이블이 정의된 모델들 import
+from apiserver.models.quiz_version_model import QuizVersion  # 테이블이 정의된 모델들 import
 
 async def create_tables():
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
 
+    # 새로 만든 테이블에는 이미 반영된 마이그레이션을 적용 완료로 기록 (IF NOT EXISTS라 건너뜀)
+    await run_migrations(engine)
+
 if __name__ == "__main__":
     asyncio.run(create_tables())
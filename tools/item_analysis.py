@@ -0,0 +1,58 @@
+# tools/item_analysis.py
+# 퀴즈 문항 분석을 계산해서 출력 (GET /quizzes/{quiz_id}/item-analysis와 같은 계산, 캐시는 사용하지 않음)
+# 사용법: poetry run python tools/item_analysis.py <quiz_id> [version] [--json]
+import sys
+import os
+
+# src 디렉토리를 Python path에 추가
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'src')))
+
+import asyncio
+import json
+from uuid import UUID
+from sqlalchemy import select
+
+from apiserver.db.database import engine, AsyncSessionLocal
+from apiserver.db.redis_client import redis_client
+# 관계 매핑에 필요한 모델들 import
+from apiserver.models.user_model import User
+from apiserver.models.question_model import Question
+from apiserver.models.choice_model import Choice
+from apiserver.models.quiz_config_model import QuizConfig
+from apiserver.models.answer_model import Answer
+from apiserver.models.quiz_model import Quiz
+from apiserver.cache.quiz_content import load_quiz_content
+from apiserver.utils.item_analysis import load_answer_columns, compute_item_analysis
+
+def print_report(report):
+    print(f"version {report['version']}: {report['attempts']} attempts, {report['answers']} answers")
+    print(f"{'#':>3} | {'responses':>9} | {'difficulty':>10} | {'discrim':>8} | choice selection rates (* = correct)")
+    for number, item in enumerate(report["items"], 1):
+        rates = " ".join(
+            f"{'*' if choice['is_correct'] else ''}{choice['selection_rate'] if choice['selection_rate'] is not None else '-'}"
+            for choice in item["choices"]
+        )
+        difficulty = item["difficulty"] if item["difficulty"] is not None else "-"
+        discrimination = item["discrimination"] if item["discrimination"] is not None else "-"
+        print(f"{number:>3} | {item['responses']:>9} | {difficulty:>10} | {discrimination:>8} | {rates}")
+
+async def analyze(quiz_id, version, as_json):
+    async with AsyncSessionLocal() as db:
+        if version is None:
+            result = await db.execute(select(Quiz.version).where(Quiz.id == quiz_id))
+            version = result.scalar_one()
+        content = await load_quiz_content(db, quiz_id, version)
+        columns = await load_answer_columns(db, quiz_id, version, content)
+        report = {"version": version, **compute_item_analysis(columns, content)}
+    if as_json:
+        print(json.dumps(report, ensure_ascii=False, indent=2))
+    else:
+        print_report(report)
+    await engine.dispose()
+    await redis_client.aclose()
+
+if __name__ == "__main__":
+    args = [arg for arg in sys.argv[1:] if arg != "--json"]
+    if not args:
+        sys.exit("usage: python tools/item_analysis.py <quiz_id> [version] [--json]")
+    asyncio.run(analyze(UUID(args[0]), int(args[1]) if len(args) > 1 else None, "--json" in sys.argv))
@@ -0,0 +1,18 @@
+# tools/migrate.py
+# 기존 PostgreSQL 데이터베이스에 버전별 스키마 마이그레이션 적용 (apiserver/db/migrations.py)
+import sys
+import os
+
+# src 디렉토리를 Python path에 추가
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'src')))
+
+import asyncio
+from apiserver.db.database import engine
+from apiserver.db.migrations import run_migrations
+
+async def migrate():
+    await run_migrations(engine)
+    await engine.dispose()
+
+if __name__ == "__main__":
+    asyncio.run(migrate())
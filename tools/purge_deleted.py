@@ -0,0 +1,24 @@
+# tools/purge_deleted.py
+# 삭제된 퀴즈(deleted_at)의 관련 행을 지금 바로 정리 (apiserver/utils/quiz_purge.py)
+# 서버의 백그라운드 정리(PURGE_ENABLED)를 끈 환경에서 cron 등으로 실행할 때 사용
+# 다른 프로세스가 정리 중이면 아무것도 하지 않는다.
+import sys
+import os
+
+# src 디렉토리를 Python path에 추가
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'src')))
+
+import asyncio
+from apiserver.db.database import engine
+from apiserver.db.redis_client import redis_client
+from apiserver.models.user_model import User  # QuizAttempt.user 관계 매핑에 필요
+from apiserver.utils.quiz_purge import run_pending_purges
+
+async def purge():
+    purged = await run_pending_purges()
+    print(f"purged {purged} quizzes")
+    await engine.dispose()
+    await redis_client.aclose()
+
+if __name__ == "__main__":
+    asyncio.run(purge())
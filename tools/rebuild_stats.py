@@ -0,0 +1,38 @@
+# tools/rebuild_stats.py
+# PostgreSQL의 응시/제출 기록으로 퀴즈 통계와 리더보드(Redis)를 다시 채운다 (apiserver/cache/quiz_stats.py)
+# Redis 데이터를 잃었거나 값이 어긋났을 때 사용. 인자가 없으면 삭제되지 않은 모든 퀴즈
+# 사용법: poetry run python tools/rebuild_stats.py [quiz_id ...]
+import sys
+import os
+
+# src 디렉토리를 Python path에 추가
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'src')))
+
+import asyncio
+from uuid import UUID
+from sqlalchemy import select
+
+from apiserver.db.database import engine, AsyncSessionLocal
+from apiserver.db.redis_client import redis_client
+# 관계 매핑에 필요한 모델들 import
+from apiserver.models.user_model import User
+from apiserver.models.question_model import Question
+from apiserver.models.choice_model import Choice
+from apiserver.models.quiz_config_model import QuizConfig
+from apiserver.models.answer_model import Answer
+from apiserver.models.quiz_model import Quiz
+from apiserver.cache.quiz_stats import rebuild_quiz_stats
+
+async def rebuild(quiz_ids):
+    async with AsyncSessionLocal() as db:
+        if not quiz_ids:
+            result = await db.execute(select(Quiz.id).where(Quiz.deleted_at.is_(None)))
+            quiz_ids = result.scalars().all()
+        for quiz_id in quiz_ids:
+            await rebuild_quiz_stats(db, quiz_id, reset=True)
+            print(f"rebuilt {quiz_id}")
+    await engine.dispose()
+    await redis_client.aclose()
+
+if __name__ == "__main__":
+    asyncio.run(rebuild([UUID(arg) for arg in sys.argv[1:]]))